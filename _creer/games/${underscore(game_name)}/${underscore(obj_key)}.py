@@ -31,6 +31,30 @@ class ${obj_key}(${", ".join(parent_classes)}):
     ${shared['py']['format_description'](obj['description'])}
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+% for attr_name in obj['attribute_names']:
+        '_${underscore(attr_name)}',
+% endfor
+% if obj_key == "Game":
+        'name',
+        '_game_object_classes',
+% elif obj_key == 'Tile' and 'TiledGame' in game['serverParentClasses']:
+        '_neighbors',
+% endif
+${merge("        # ", "slots", "        # if you add attributes to this class, add their names here", optional=True)}
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+% for attr_name in obj['attribute_names']:
+<% attr_parms = obj['attributes'][attr_name]
+%>        '${underscore(attr_name)}': '${shared['py']['type'](attr_parms['type'])}',
+% endfor
+    }
+
     def __init__(self):
         """Initializes a ${obj_key} with basic logic as provided by the Creer code generator."""
 % for parent_class in reversed(parent_classes):
@@ -42,6 +66,9 @@ class ${obj_key}(${", ".join(parent_classes)}):
 <% attr_parms = obj['attributes'][attr_name]
 %>        self._${underscore(attr_name)} = ${shared['py']['default'](attr_parms['type'], attr_parms['default'])}
 % endfor
+% if obj_key == 'Tile' and 'TiledGame' in game['serverParentClasses']:
+        self._neighbors = None # cached by get_neighbors()
+% endif
 
 % if obj_key == "Game":
         self.name = "${game_name}"
@@ -110,14 +137,14 @@ class ${obj_key}(${", ".join(parent_classes)}):
     def get_neighbors(self):
         """Gets the neighbors of this Tile
 
-        :rtype list[games.${underscore(game_name)}.tile.Tile]
+        :rtype tuple[games.${underscore(game_name)}.tile.Tile]
         """
-        neighbors = []
-
-        for direction in Tile.directions:
-            neighbor = getattr(self, "tile_" + direction.lower())
-            if neighbor:
-                neighbors.append(neighbor)
+        neighbors = self._neighbors
+        if neighbors is None: # tiles are only linked once, so look them up once
+            neighbors = self._neighbors = tuple(
+                neighbor for neighbor in (self._tile_north, self._tile_east, self._tile_south, self._tile_west)
+                if neighbor
+            )
 
         return neighbors
 
@@ -136,7 +163,7 @@ ${merge("        # ", "is_pathable_builtin", "        return false  # DEVELOPER
         Returns:
             bool: True if the tile is a neighbor of this Tile, False otherwise
         """
-        return bool(tile and tile in self.get_neighbors())
+        return tile is not None and tile in self.get_neighbors()
 % endif
 % endif
 
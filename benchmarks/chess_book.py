@@ -0,0 +1,101 @@
+# Builds an opening book from random games, checks every move stored in it is
+# found again from its position, and times opening the book and looking
+# moves up, which should take microseconds however big the book is.
+#
+#   python3 -m benchmarks.chess_book --games 5000
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from games.chess.engine.book import OpeningBook, write_book
+from games.chess.engine.build_book import build, read_lines
+from games.chess.engine.position import Position
+
+PGN = '''[Event "Sample"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 Nc6 3. Bb5 {the Ruy Lopez} a6 (3... Nf6 4. O-O) 4. Ba4 Nf6 5. O-O Be7 1-0
+
+[Event "Sample"]
+[Result "1/2-1/2"]
+
+1. d4 d5 2. c4 e6 3. Nc3 Nf6 4. Bg5 $1 Be7 5. e3 O-O 1/2-1/2
+'''
+
+
+def random_lines(count, plies, seed):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        position = Position()
+        moves = []
+        for _ in range(plies):
+            legal = position.legal_moves()
+            if not legal:
+                break
+            move = rng.choice(legal)
+            moves.append(position.san(move))
+            position.make(move)
+        lines.append(moves)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checks and times opening book lookups.')
+    parser.add_argument('--games', type=int, default=2000, help='random games to build the book from')
+    parser.add_argument('--plies', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    lines = read_lines(PGN) + random_lines(args.games, args.plies, args.seed)
+    start = time.perf_counter()
+    weights = build(lines, args.plies)
+    build_seconds = time.perf_counter() - start
+
+    wrong = 0
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'book.bin')
+        write_book(path, weights)
+
+        start = time.perf_counter()
+        book = OpeningBook(path)
+        open_seconds = time.perf_counter() - start
+
+        # every position of every line, with the moves stored for it
+        stored = {}
+        for (key, move), weight in weights.items():
+            stored.setdefault(key, {})[move] = weight
+        positions = []
+        for moves in lines:
+            position = Position()
+            for san in moves[:args.plies]:
+                positions.append(position.copy())
+                position.make(position.parse_san(san))
+
+        start = time.perf_counter()
+        for position in positions:
+            book.entries(position.hash)
+        lookup_seconds = time.perf_counter() - start
+
+        for position in positions:
+            if dict(book.moves(position)) != stored[position.hash]:
+                wrong += 1
+        choose_start = time.perf_counter()
+        for position in positions:
+            book.choose(position)
+        choose_seconds = time.perf_counter() - choose_start
+        size = os.path.getsize(path)
+        book.close()
+
+    print('{} lines, {} entries ({:.0f} KB) built in {:.2f} s'.format(len(lines), len(weights), size / 1024, build_seconds))
+    print('opened in {:.1f} us'.format(open_seconds * 1e6))
+    print('{} lookups, {:.1f} us each'.format(len(positions), lookup_seconds / len(positions) * 1e6))
+    print('{} legal book moves picked, {:.1f} us each'.format(len(positions), choose_seconds / len(positions) * 1e6))
+    if wrong:
+        sys.exit('{} positions got the wrong moves from the book'.format(wrong))
+
+
+if __name__ == '__main__':
+    main()
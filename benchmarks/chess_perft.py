@@ -0,0 +1,61 @@
+# Checks the chess move generator against known perft counts (the number of
+# move sequences of each length from a position) and times it in nodes per
+# second, as everything the chess AI searches depends on how fast it is.
+#
+#   python3 -m benchmarks.chess_perft --depth 4
+import argparse
+import sys
+import time
+from games.chess.engine.position import Position, STARTING_FEN
+
+# (name, FEN, perft counts for depth 1, 2, ...), from the Chess Programming Wiki's perft results
+SUITE = [
+    ('start', STARTING_FEN,
+     [20, 400, 8902, 197281, 4865609]),
+    ('kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+     [48, 2039, 97862, 4085603]),
+    ('endgame', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+     [14, 191, 2812, 43238, 674624]),
+    ('promotions', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+     [6, 264, 9467, 422333]),
+    ('talkchess', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+     [44, 1486, 62379, 2103487]),
+    ('middlegame', 'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+     [46, 2079, 89890, 3894594]),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checks and times the chess move generator.')
+    parser.add_argument('--depth', type=int, default=3, help='the deepest perft to run on each position')
+    args = parser.parse_args()
+
+    wrong = []
+    total_nodes = 0
+    total_seconds = 0
+    for name, fen, counts in SUITE:
+        position = Position(fen)
+        for depth, expected in enumerate(counts[:args.depth], 1):
+            start = time.perf_counter()
+            nodes = position.perft(depth)
+            seconds = time.perf_counter() - start
+            total_nodes += nodes
+            total_seconds += seconds
+
+            print('{:<11} depth {} {:>9} nodes {:>8.3f} s {:>10.0f} nodes/s{}'.format(
+                name, depth, nodes, seconds, nodes / seconds if seconds else 0,
+                '' if nodes == expected else '  WRONG, expected {}'.format(expected)))
+            if nodes != expected:
+                wrong.append((name, depth))
+
+        if position.fen() != fen:
+            wrong.append((name, 'fen'))
+            print('{:<11} FEN changed to {}'.format(name, position.fen()))
+
+    print('{} nodes in {:.2f} s, {:.0f} nodes/s'.format(total_nodes, total_seconds, total_nodes / total_seconds))
+    if wrong:
+        sys.exit('perft counts were wrong for {}'.format(wrong))
+
+
+if __name__ == '__main__':
+    main()
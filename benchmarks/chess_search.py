@@ -0,0 +1,54 @@
+# Compares the chess AI's alpha-beta Searcher against plain minimax: nodes
+# searched and time to each depth, checking both find the same score (with
+# quiescence and check extensions off, so they search the same tree). Then
+# times the full Searcher to each depth, as make_move runs it.
+#
+#   python3 -m benchmarks.chess_search --depth 3 --seconds 5
+import argparse
+import sys
+import time
+from games.chess.engine.position import Position
+from games.chess.engine.search import Searcher, minimax
+from benchmarks.chess_perft import SUITE
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compares alpha-beta search against minimax.')
+    parser.add_argument('--depth', type=int, default=3, help='the deepest minimax to compare against')
+    parser.add_argument('--seconds', type=float, default=5, help='how long to run the full search on each position')
+    args = parser.parse_args()
+
+    different = []
+    for name, fen, _ in SUITE:
+        for depth in range(1, args.depth + 1):
+            position = Position(fen)
+            start = time.perf_counter()
+            minimax_score, _, minimax_nodes = minimax(position, depth)
+            minimax_seconds = time.perf_counter() - start
+
+            searcher = Searcher(quiescence=False, check_extensions=False)
+            result = searcher.search(position, max_depth=depth)
+
+            print('{:<11} depth {} | minimax {:>8} nodes {:>8.3f} s | alpha-beta {:>7} nodes {:>8.3f} s | {:6.1f}x fewer nodes {:6.1f}x faster{}'.format(
+                name, depth, minimax_nodes, minimax_seconds, result.nodes, result.seconds,
+                minimax_nodes / result.nodes, minimax_seconds / result.seconds if result.seconds else 0,
+                '' if result.score == minimax_score else '  DIFFERENT SCORE {} vs {}'.format(result.score, minimax_score)))
+            if result.score != minimax_score:
+                different.append((name, depth))
+
+    print()
+    for name, fen, _ in SUITE:
+        position = Position(fen)
+        iterations = []
+        result = Searcher().search(position, deadline=time.perf_counter() + args.seconds, on_iteration=iterations.append)
+        print('{:<11} {}'.format(name, ' | '.join(
+            'depth {} {:.2f} s'.format(iteration.depth, iteration.seconds) for iteration in iterations)))
+        print('{:<11} best {} scoring {} at depth {}, stopped after {:.2f} s, {:.0f} nodes/s'.format(
+            '', position.san(result.move), result.score, result.depth, result.seconds, result.nodes / result.seconds))
+
+    if different:
+        sys.exit('alpha-beta and minimax scored differently for {}'.format(different))
+
+
+if __name__ == '__main__':
+    main()
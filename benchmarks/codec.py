@@ -0,0 +1,75 @@
+# Benchmarks parsing and encoding frames with each installed JSON library,
+# using the frames a server would send for each game.
+#
+#   python3 -m benchmarks.codec necrowar pirates
+import argparse
+import json
+import time
+import joueur.codec as codec
+from benchmarks import synthetic
+
+
+def frames_for(game_name, width, height, objects, turns):
+    """The UTF-8 frames (without EOTs) a server would send to play a game."""
+    world = synthetic.World(game_name, width, height, objects)
+    return [
+        json.dumps({'event': 'delta', 'data': delta}).encode('utf-8')
+        for delta in world.deltas(turns)
+    ]
+
+
+def best_time(function, items, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(game_name, frames, repeat):
+    total_bytes = sum(len(frame) for frame in frames)
+    parsed = [json.loads(frame) for frame in frames]
+
+    for codec_name in codec.available():
+        codec.use(codec_name)
+
+        # the old client decoded each frame to a str before parsing it
+        if codec_name == 'json':
+            decoded = best_time(lambda f: json.loads(f.decode('utf-8')), frames, repeat)
+        loads = best_time(codec.loads, frames, repeat)
+        dumps = best_time(codec.dumps, parsed, repeat)
+
+        print('{:<12} {:<7} {:>5} frames {:>8.2f} MB | loads {:8.2f} ms {:7.1f} MB/s | dumps {:8.2f} ms'.format(
+            game_name, codec_name, len(frames), total_bytes / 1e6,
+            loads * 1000, total_bytes / 1e6 / loads, dumps * 1000
+        ))
+
+    print('{:<12} {:<7} {:>5} frames {:>8.2f} MB | loads {:8.2f} ms {:7.1f} MB/s | (decode then parse, as before)'.format(
+        game_name, 'str', len(frames), total_bytes / 1e6,
+        decoded * 1000, total_bytes / 1e6 / decoded
+    ))
+    codec.use()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the JSON libraries used for client I/O.')
+    parser.add_argument('games', nargs='*', default=synthetic.GAME_NAMES,
+                        help='the games to generate synthetic frames for')
+    parser.add_argument('--width', type=int, default=50)
+    parser.add_argument('--height', type=int, default=30)
+    parser.add_argument('--objects', type=int, default=100, help='game objects per class')
+    parser.add_argument('--turns', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('installed: ' + ', '.join(codec.available()))
+    for game_name in args.games:
+        frames = frames_for(game_name, args.width, args.height, args.objects, args.turns)
+        benchmark(game_name, frames, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
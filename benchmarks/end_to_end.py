@@ -0,0 +1,110 @@
+# Plays main.py against a local joueur.mock_server for each game, so the whole
+# client (socket, frames, JSON, merging, and the AI) is timed end to end with
+# no network. Each game is a synthetic world, or a captured game to replay.
+# A game fails if the client doesn't end it as the script's deltas say it
+# should, with the same winner and reason.
+#
+#   python3 -m benchmarks.end_to_end saloon chess --turns 200
+#   python3 -m benchmarks.end_to_end --captured game.jsonl
+import argparse
+import os
+import subprocess
+import sys
+import time
+from joueur.game_manager import GameManager
+from joueur.mock_server import MockServer, Script
+from joueur.utilities import camel_case_converter
+from benchmarks import synthetic
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+
+def play(script, timeout, client_args=()):
+    """Plays main.py through a script, returning the server's stats for the game and the client's exit code and output."""
+    server = MockServer(script, port=0)
+    server.start()
+    try:
+        start = time.perf_counter()
+        client = subprocess.run(
+            [sys.executable, MAIN, script.game_name, '-s', 'localhost:{}'.format(server.port)] + list(client_args),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout
+        )
+        wall = time.perf_counter() - start
+        results = server.wait_for(1, timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = results[0] if results else {'error': 'the game never finished'}
+    stats['wall'] = wall
+    return stats, client.returncode, client.stdout.decode('utf-8', 'replace')
+
+
+def expected_end(script):
+    """Gets how the client should print the end of the game, from merging every delta the script sends it."""
+    game = synthetic.load_game_module(camel_case_converter(script.game_name)).Game()
+    manager = GameManager(game)
+    manager.set_constants(script.constants)
+
+    deltas = list(script.initial_deltas)
+    for turn, (turn_deltas, _) in enumerate(script.turns):
+        deltas += turn_deltas
+        for run_deltas, _ in script.recorded.get(turn, []):
+            deltas += run_deltas
+    deltas += script.final_deltas
+    for delta in deltas:
+        manager.apply_delta_state(delta)
+
+    player = game.get_game_object(script.player_id)
+    return 'Game is Over. {} because {}'.format(
+        'I Won!' if player.won else 'I Lost :(',
+        player.reason_won if player.won else player.reason_lost
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Times main.py playing against a local mock server.')
+    parser.add_argument('games', nargs='*', default=synthetic.GAME_NAMES, help='games to play synthetic worlds of')
+    parser.add_argument('--captured', action='append', default=[], help='a captured game (JSON lines of server frames) to replay')
+    parser.add_argument('--turns', type=int, default=100)
+    parser.add_argument('--objects', type=int, default=50, help='game objects of each class in synthetic worlds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--async', action='store_true', dest='use_async', help='play through the asyncio client (main.py --async)')
+    args = parser.parse_args()
+
+    scripts = [(path, Script.from_captured(path)) for path in args.captured]
+    if not args.captured:
+        for game_name in args.games:
+            world = synthetic.World(game_name, objects_per_class=args.objects, seed=args.seed)
+            scripts.append((game_name, world.script(args.turns)))
+
+    failed = []
+    for name, script in scripts:
+        stats, exit_code, output = play(script, args.timeout, ['--async'] if args.use_async else [])
+        if stats['error'] or exit_code != 0:
+            failed.append(name)
+            print('{:<12} failed (exit code {}): {}'.format(name, exit_code, stats['error'] or ''))
+            print(output.strip()[-2000:])
+            continue
+
+        expected = expected_end(script)
+        if expected not in output:
+            failed.append(name)
+            print('{:<12} ended wrong, expected "{}"'.format(name, expected))
+            print(output.strip()[-500:])
+            continue
+
+        orders = stats['order_seconds']
+        print('{:<12} {:5} turns {:9.1f} turns/s | order round trip {:7.3f} ms mean {:7.3f} ms max | {:7.1f} KB sent | {:6.2f} s total'.format(
+            name, stats['turns'], stats['turns'] / stats['seconds'] if stats['seconds'] else 0,
+            sum(orders) / len(orders) * 1000 if orders else 0, max(orders, default=0) * 1000,
+            stats['bytes_sent'] / 1024, stats['wall']
+        ))
+
+    if failed:
+        sys.exit('{} games did not play through: {}'.format(len(failed), ', '.join(failed)))
+
+
+if __name__ == '__main__':
+    main()
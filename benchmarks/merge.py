@@ -0,0 +1,165 @@
+# Benchmarks GameManager.apply_delta_state against the original, uncached
+# recursive merger, and checks that both end up with the same game state.
+#
+#   python3 -m benchmarks.merge necrowar pirates --turns 200
+#   python3 -m benchmarks.merge --captured deltas.jsonl --verify
+import argparse
+import copy
+import json
+import time
+from joueur.delta_mergeable import DeltaMergeable
+from joueur.game_manager import GameManager
+from joueur.serializer import is_game_object_reference, is_object
+from joueur.utilities import camel_case_converter
+from benchmarks import synthetic
+
+
+class LegacyGameManager(GameManager):
+    """The recursive merger as it was before merge plans, kept as a baseline."""
+
+    def _set_member(self, state, state_key, value):
+        if isinstance(state_key, int) or isinstance(state, dict):
+            state[state_key] = value
+        else:
+            setattr(state, state_key, value)
+
+    def _merge_delta(self, state, delta, changes=None):
+        delta_length = -1
+        if self._DELTA_LIST_LENGTH in delta:
+            delta_length = delta[self._DELTA_LIST_LENGTH]
+            del delta[self._DELTA_LIST_LENGTH]
+
+        if delta_length > -1:
+            while len(state) > delta_length:
+                state.pop()
+            while len(state) < delta_length:
+                state.append(None)
+
+        for key in delta:
+            d = delta[key]
+            state_key = key
+            key_in_state = False
+
+            if isinstance(state, list):
+                state_key = int(key)
+                key_in_state = state_key < len(state)
+            else:
+                if isinstance(state, DeltaMergeable):
+                    state_key = "_" + camel_case_converter(state_key)
+                key_in_state = state_key in state
+
+            if d == self._DELTA_REMOVED:
+                if key_in_state:
+                    del state[state_key]
+            elif is_game_object_reference(d):
+                referenced_object = self.game.get_game_object(d['id'])
+                self._set_member(state, state_key, referenced_object)
+            elif is_object(d) and key_in_state and is_object(state[state_key]):
+                self._merge_delta(state[state_key], d)
+            elif not key_in_state and is_object(d):
+                if isinstance(d, dict):
+                    self._set_member(state, state_key, [] if self._DELTA_LIST_LENGTH in d else {})
+                    self._merge_delta(state[state_key], d)
+            else:
+                self._set_member(state, state_key, d)
+
+
+def snapshot(game):
+    """A plain, comparable copy of the whole game state, with game objects
+    replaced by their ids.
+    """
+    def plain(value):
+        if isinstance(value, DeltaMergeable):
+            return {'id': value.id}
+        if isinstance(value, list):
+            return [plain(v) for v in value]
+        if isinstance(value, dict):
+            return {k: plain(v) for k, v in value.items()}
+        return value
+
+    def state_of(obj):
+        return {
+            name: plain(getattr(obj, name))
+            for name, _ in synthetic.attributes(obj.__class__)
+            if name != 'game_objects'
+        }
+
+    state = state_of(game)
+    state['game_objects'] = {
+        id: state_of(obj) for id, obj in game.game_objects.items()
+    }
+    return state
+
+
+def merge_all(manager_class, game_name, constants, encoded_deltas):
+    """Merges every (JSON encoded) delta into a new game.
+
+    Returns:
+        tuple: (the game, seconds spent merging, not counting JSON parsing)
+    """
+    module = synthetic.load_game_module(game_name)
+    game = module.Game()
+    manager = manager_class(game)
+    manager.set_constants(constants)
+
+    deltas = [json.loads(encoded) for encoded in encoded_deltas]
+    start = time.perf_counter()
+    for delta in deltas:
+        manager.apply_delta_state(delta)
+    return game, time.perf_counter() - start
+
+
+def benchmark(game_name, constants, deltas, repeat, verify):
+    encoded = [json.dumps(delta) for delta in deltas]
+    objects = sum(len(delta.get('gameObjects', {})) for delta in deltas)
+
+    results = {}
+    for name, manager_class in (('legacy', LegacyGameManager),
+                                ('current', GameManager)):
+        best = min(
+            merge_all(manager_class, game_name, constants, encoded)[1]
+            for _ in range(repeat)
+        )
+        results[name] = best
+
+    print('{:<12} {:>5} deltas {:>7} objects | legacy {:8.1f} ms | current {:8.1f} ms | {:5.2f}x | {:9.0f} deltas/s {:10.0f} objects/s'.format(
+        game_name, len(deltas), objects,
+        results['legacy'] * 1000, results['current'] * 1000,
+        results['legacy'] / results['current'],
+        len(deltas) / results['current'], objects / results['current']
+    ))
+
+    if verify:
+        legacy_game = merge_all(LegacyGameManager, game_name, constants, encoded)[0]
+        current_game = merge_all(GameManager, game_name, constants, encoded)[0]
+        if snapshot(legacy_game) != snapshot(current_game):
+            raise AssertionError('{}: merged game states differ'.format(game_name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks merging delta states.')
+    parser.add_argument('games', nargs='*', default=synthetic.GAME_NAMES,
+                        help='the games to generate synthetic deltas for')
+    parser.add_argument('--captured', help='a file of server frames captured as JSON lines to merge instead')
+    parser.add_argument('--width', type=int, default=50)
+    parser.add_argument('--height', type=int, default=30)
+    parser.add_argument('--objects', type=int, default=100, help='game objects per class')
+    parser.add_argument('--turns', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0, help='the seed synthetic deltas are made with')
+    parser.add_argument('--verify', action='store_true', help='check the mergers end with identical states')
+    args = parser.parse_args()
+
+    if args.captured:
+        game_name, constants, deltas = synthetic.load_captured(args.captured)
+        benchmark(camel_case_converter(game_name), constants, deltas, args.repeat, args.verify)
+        return
+
+    for game_name in args.games:
+        world = synthetic.World(game_name, args.width, args.height, args.objects, seed=args.seed)
+        deltas = world.deltas(args.turns)
+        benchmark(game_name, synthetic.CONSTANTS, copy.deepcopy(deltas), args.repeat, args.verify)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# Measures how much time necrowar's logging adds to each turn, logging what
+# BaseController logs on a busy turn, with the develop (DEBUG) and release
+# (WARNING) loggers, written directly or via the background queue.
+#
+#   python3 -m benchmarks.necrowar_logging --moves 300 --turns 200
+import argparse
+import json
+import logging
+import logging.config
+import os
+import subprocess
+import sys
+import time
+import yaml
+
+MODES = [
+    ('develop', False),
+    ('release', False),
+    ('develop', True),
+    ('release', True),
+]
+
+
+class Job():
+    title = 'zombie'
+
+
+class Unit():
+    id = '42'
+    job = Job()
+
+
+def turn(logger, moves, spawns):
+    """Logs like BaseController.move_unit and spawn_unit do."""
+    unit = Unit()
+    for _ in range(moves):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Sucessfully moved unit of type `%s`', unit.job.title)
+    for _ in range(spawns):
+        logger.info('Attempting to spawn unit type `%s`...', 'zombie')
+        logger.info('Unit spawned successfully.')
+    logger.warning('Failed to move unit `%s`.', unit.id)
+
+
+def old_turn(logger, moves, spawns):
+    """Logs like BaseController did before, formatting every message up front."""
+    unit = Unit()
+    for _ in range(moves):
+        logger.info(f'Sucessfully moved unit of type `{unit.job.title}`')
+    for _ in range(spawns):
+        logger.info(f'Attempting to spawn unit type `{"zombie"}`...')
+        logger.info('Unit spawned successfully.')
+    logger.warning(f'Failed to move unit `{unit.id}`.')  # was warn(), an alias that newer Pythons removed
+
+
+def measure(logger_type, use_queue, moves, spawns, turns):
+    # in a fresh process, as logging is only configured once per process
+    results = sys.stdout
+    sys.stdout = open(os.devnull, 'w')  # the console handler writes here
+
+    from games.necrowar.util.logger import Logger, LoggerTypes, DEFAULT_LOGGER_CONFIG_FILE_PATH
+
+    logger_type = LoggerTypes.DEVELOP if logger_type == 'develop' else LoggerTypes.RELEASE
+    Logger.get(logger_type, use_queue=use_queue)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        Logger.get(LoggerTypes.DEVELOP)
+    cached_get = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    with open(DEFAULT_LOGGER_CONFIG_FILE_PATH) as config:
+        logging.config.dictConfig(yaml.safe_load(config.read()))  # what every Logger.get used to do
+    uncached_get = time.perf_counter() - start
+
+    # that replaced the handlers, so set logging up again
+    Logger.stop()
+    Logger._configured_path = None
+    logger = Logger.get(logger_type, use_queue=use_queue)
+
+    timings = {}
+    for name, function in (('current', turn), ('old', old_turn)):
+        start = time.perf_counter()
+        for _ in range(turns):
+            function(logger, moves, spawns)
+        timings[name] = (time.perf_counter() - start) / turns
+
+    Logger.stop()
+    sys.stdout = results
+    print(json.dumps({
+        'cached_get': cached_get, 'uncached_get': uncached_get, **timings
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the per turn overhead of necrowar logging.')
+    parser.add_argument('--moves', type=int, default=300, help='unit moves logged per turn')
+    parser.add_argument('--spawns', type=int, default=10, help='unit spawns logged per turn')
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--measure', nargs=2, metavar=('LOGGER', 'QUEUE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure[0], args.measure[1] == 'queue', args.moves, args.spawns, args.turns)
+        return
+
+    print('{} moves and {} spawns a turn'.format(args.moves, args.spawns))
+    for logger_type, use_queue in MODES:
+        output = subprocess.check_output([
+            sys.executable, '-m', 'benchmarks.necrowar_logging',
+            '--moves', str(args.moves), '--spawns', str(args.spawns), '--turns', str(args.turns),
+            '--measure', logger_type, 'queue' if use_queue else 'direct'
+        ])
+        result = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        print('{:<8} {:<7} | {:8.1f} us/turn (was {:8.1f}) | Logger.get {:6.1f} us (was {:8.1f} us)'.format(
+            logger_type, 'queued' if use_queue else 'direct',
+            result['current'] * 1e6, result['old'] * 1e6,
+            result['cached_get'] * 1e6, result['uncached_get'] * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
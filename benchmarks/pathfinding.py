@@ -0,0 +1,271 @@
+# Benchmarks the searches in joueur.pathfinding against the ones they
+# replaced, on a random map of walls: AStar against the A* necrowar's
+# BaseController used before it, and the breadth first searches against the
+# find_path each game's ai.py had. Checks every path found is a shortest one.
+# Also times updating necrowar's distance fields as random tiles open and
+# close against building them again, checking the updates match a rebuild.
+#
+#   python3 -m benchmarks.pathfinding necrowar --queries 500 --verify
+import argparse
+import collections
+import heapq
+import random
+import time
+from collections import defaultdict
+from joueur.game_manager import GameManager
+from joueur.pathfinding import AStar, BreadthFirstSearch, BidirectionalSearch, SearchTree
+from benchmarks import synthetic
+
+try:
+    import numpy as np  # the old A* scored with numpy scalars
+    inf = np.inf
+    absolute = np.abs
+except ImportError:
+    inf = float('inf')
+    absolute = abs
+
+
+def legacy_find_path(start, goal, passable):
+    """BaseController.find_path as it was, with can_move_unit_to swapped for passable."""
+    def distance(start, goal):
+        return absolute(start.x-goal.x) + absolute(start.y-goal.y)
+
+    def reconstruct_path(current_tile, came_from, start):
+        path = [current_tile]
+        while current_tile in came_from:
+            current_tile = came_from[current_tile]
+            if current_tile != start:
+                path.insert(0, current_tile)
+        return path
+
+    visited = set(start.id)
+    came_from = {}
+    g_score = defaultdict(lambda: inf)
+    g_score[start] = 0
+    f_score = defaultdict(lambda: inf)
+    f_score[start] = distance(start, goal)
+    priority_queue = [(f_score[start], start.id, start)]
+
+    while priority_queue:
+        _, tile_id, current_tile = heapq.heappop(priority_queue)
+
+        if current_tile == goal:
+            return reconstruct_path(current_tile, came_from, start)
+
+        unpathable = 0
+        for neighbor in current_tile.get_neighbors():
+            if neighbor != goal and not passable(neighbor):
+                unpathable += 1
+                continue
+
+            score = g_score[current_tile] + 1
+            if score < g_score[neighbor]:
+                came_from[neighbor] = current_tile
+                g_score[neighbor] = score
+                f_score[neighbor] = g_score[neighbor] + distance(current_tile, neighbor)
+
+                if neighbor not in visited:
+                    visited.add(neighbor.id)
+                    heapq.heappush(priority_queue, (f_score[neighbor], neighbor.id, neighbor))
+
+        if unpathable == len(current_tile.get_neighbors()):
+            return reconstruct_path(current_tile, came_from, start)
+
+    return []
+
+
+def legacy_bfs(start, goal, passable):
+    """find_path from the games' ai.py as it was, with is_pathable swapped for passable."""
+    if start == goal:
+        return []
+
+    fringe = []
+    came_from = {}
+    fringe.append(start)
+
+    while len(fringe) > 0:
+        inspect = fringe.pop(0)
+
+        for neighbor in inspect.get_neighbors():
+            if neighbor == goal:
+                path = [goal]
+                while inspect != start:
+                    path.insert(0, inspect)
+                    inspect = came_from[inspect.id]
+                return path
+
+            if neighbor and neighbor.id not in came_from and (
+                passable(neighbor)
+            ):
+                fringe.append(neighbor)
+                came_from[neighbor.id] = inspect
+
+    return []
+
+
+def shortest_distance(graph, start, goal, passable):
+    """The number of steps on a shortest path, by breadth first search, or None if unreachable."""
+    distances = {start: 0}
+    fringe = collections.deque([start])
+    while fringe:
+        current = fringe.popleft()
+        if current == goal:
+            return distances[current]
+        for neighbor in graph.adjacency[current]:
+            if neighbor not in distances and (neighbor == goal or passable(neighbor)):
+                distances[neighbor] = distances[current] + 1
+                fringe.append(neighbor)
+    return None
+
+
+def make_map(game_name, width, height, walls, seed):
+    """A merged game with its tiles, and the set of tile indexes that are walls."""
+    world = synthetic.World(game_name, width, height, objects_per_class=1, seed=seed)
+    game = synthetic.load_game_module(game_name).Game()
+    manager = GameManager(game)
+    manager.set_constants(synthetic.CONSTANTS)
+    manager.apply_delta_state(world.initial_delta())
+
+    rng = random.Random(seed)
+    blocked = {i for i in range(len(game.tiles)) if rng.random() < walls}
+    return game, blocked
+
+
+def verify(graph, start, goal, path, passable):
+    expected = shortest_distance(graph, start, goal, passable)
+    if expected is None:
+        return path is None
+    if expected == 0:
+        return path == []
+    if path is None or len(path) != expected or path[-1] != goal:
+        return False
+    previous = start
+    for index in path:
+        if index not in graph.adjacency[previous] or not (index == goal or passable(index)):
+            return False
+        previous = index
+    return True
+
+
+def distance_field_edits(graph, blocked, rounds, seed, goals=5):
+    """Opens and closes random tiles, some of them goals, updating a DistanceField after each batch.
+
+    Returns:
+        tuple: (seconds updating, seconds building the field again, rounds where the update differed from the rebuild)
+    """
+    from games.necrowar.controllers.distance_fields import DistanceField  # needs numpy, like necrowar
+
+    rng = random.Random(seed)
+    passable = [i not in blocked for i in range(len(graph))]
+    field = DistanceField(graph, passable, rng.sample(range(len(graph)), goals))
+    update_seconds = 0.0
+    build_seconds = 0.0
+    wrong = 0
+
+    for _ in range(rounds):
+        changed = rng.sample(range(len(graph)), rng.randint(1, 10))
+        for index in changed:
+            passable[index] = not passable[index]
+
+        start = time.perf_counter()
+        field.update(passable, changed)
+        update_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        built = DistanceField(graph, passable, field.goals)
+        build_seconds += time.perf_counter() - start
+
+        if field.distances != built.distances:
+            wrong += 1
+    return update_seconds, build_seconds, wrong
+
+
+def timed(function, queries):
+    start_time = time.perf_counter()
+    results = [function(start, goal) for start, goal in queries]
+    return results, time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks pathfinding on a tile map.')
+    parser.add_argument('game', nargs='?', default='necrowar', help='a game with tiles to build the map from')
+    parser.add_argument('--width', type=int, default=50)
+    parser.add_argument('--height', type=int, default=30)
+    parser.add_argument('--walls', type=float, default=0.25, help='the chance each tile is a wall')
+    parser.add_argument('--queries', type=int, default=300, help='paths to find between random open tiles')
+    parser.add_argument('--starts', type=int, default=10, help='how many tiles the queries start from, to show reusing a search tree')
+    parser.add_argument('--edits', type=int, default=500, help='batches of tiles to open and close in the distance field')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verify', action='store_true', help='check every path is a shortest one, and every distance field update matches a rebuild')
+    args = parser.parse_args()
+
+    game, blocked = make_map(args.game, args.width, args.height, args.walls, args.seed)
+    graph = game.tile_graph
+    tiles = graph.tiles
+    open_tiles = [i for i in range(len(tiles)) if i not in blocked]
+    rng = random.Random(args.seed)
+    starts = [rng.choice(open_tiles) for _ in range(args.starts)]
+    queries = sorted((rng.choice(starts), rng.choice(open_tiles)) for _ in range(args.queries))
+
+    blocked_tiles = {tiles[i] for i in blocked}
+    passable_tile = lambda tile: tile not in blocked_tiles
+    passable_index = lambda index: index not in blocked
+
+    def tile_search(find):
+        def search(start, goal):
+            path = find(tiles[start], tiles[goal], passable_tile)
+            return [graph.index_of(tile) for tile in path]
+        return search
+
+    trees = {}
+    def tree_search(start, goal):
+        if start not in trees:
+            trees[start] = SearchTree(graph, start, passable_index)
+        return trees[start].path_to(goal)
+
+    astar = AStar(graph)
+    bfs = BreadthFirstSearch(graph)
+    bidirectional = BidirectionalSearch(graph)
+    searches = [
+        ('legacy A*', tile_search(legacy_find_path), False),
+        ('A*', lambda start, goal: astar.search(start, goal, passable_index), True),
+        ('legacy BFS', tile_search(legacy_bfs), False),
+        ('BFS', lambda start, goal: bfs.search(start, goal, passable_index), True),
+        ('bidirectional', lambda start, goal: bidirectional.search(start, goal, passable_index), True),
+        ('search tree', tree_search, True),
+    ]
+
+    print('{} {}x{}, {:.0%} walls, {} queries from {} starts'.format(
+        args.game, args.width, args.height, args.walls, len(queries), len(starts)))
+
+    for name, search, checked in searches:
+        paths, seconds = timed(search, queries)
+        print('{:<14} {:8.1f} ms'.format(name, seconds * 1000))
+
+        if args.verify:
+            if checked:
+                wrong = [
+                    (start, goal) for (start, goal), path in zip(queries, paths)
+                    if not verify(graph, start, goal, path, passable_index)
+                ]
+                if wrong:
+                    raise AssertionError('{}: {} paths were not shortest paths, e.g. {}'.format(name, len(wrong), wrong[:5]))
+            else:
+                longer = sum(
+                    1 for (start, goal), path in zip(queries, paths)
+                    if path and path[-1] == goal and len(path) > shortest_distance(graph, start, goal, passable_index)
+                )
+                print('{:<14} {} paths longer than the shortest'.format('', longer))
+
+    update_seconds, build_seconds, wrong = distance_field_edits(graph, blocked, args.edits, args.seed)
+    print('{:<14} {:8.1f} ms updating, {:.1f} ms rebuilding, over {} batches of edits'.format(
+        'distance field', update_seconds * 1000, build_seconds * 1000, args.edits))
+    if args.verify and wrong:
+        raise AssertionError('distance field: {} of {} updates differed from building the field again'.format(wrong, args.edits))
+
+    if args.verify:
+        print('every path from joueur.pathfinding is a shortest path, and every distance field update matches a rebuild')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# Plays one necrowar turn against a local joueur.mock_server in which every
+# tower attacks a tile, once sending each attack and waiting for its result,
+# and again through joueur.client.pipeline(). With --verify, checks that both
+# get back the same results in the same order and end up in the same game
+# state, including when results are read in the middle of the pipeline block.
+#
+#   python3 -m benchmarks.pipeline --verify
+import argparse
+import sys
+import time
+import joueur.client as client
+from joueur.game_manager import GameManager
+from joueur.mock_server import MockServer
+from benchmarks import synthetic
+
+MODES = ('one at a time', 'pipelined', 'pipelined, reading every 10th')
+
+
+def respond_attack(run):
+    """The mock server's answer to an attack: whether it hit, and a delta with
+    the tower's new state, both worked out from the tile so every way of
+    sending the attacks gets the same answers.
+    """
+    tile_id = int(run['args']['tile']['id'])
+    changed = {'attacked': True, 'cooldown': tile_id % 7}
+    return [{'gameObjects': {run['caller']['id']: changed}}], tile_id % 3 != 0
+
+
+def attack(towers, tiles, mode):
+    """Has every tower attack a tile, returning the results."""
+    targets = [(tower, tiles[i * 37 % len(tiles)]) for i, tower in enumerate(towers)]
+    if mode == 'one at a time':
+        return [tower.attack(tile) for tower, tile in targets]
+
+    with client.pipeline():
+        pending = []
+        for i, (tower, tile) in enumerate(targets):
+            pending.append(tower.attack(tile))
+            if mode.endswith('10th') and i % 10 == 9:
+                pending[-1].result()  # sends the queued attacks in the middle of the block
+    return [result.result() for result in pending]
+
+
+def play(module, script, mode):
+    """Plays the turn, returning (results, the towers' state after, seconds taken)."""
+    server = MockServer(script, port=0)
+    server.start()
+    try:
+        game = module.Game()
+        manager = GameManager(game)
+        client.connect('localhost', server.port)
+        client.setup(game, module.AI(game), manager)
+
+        client.send('alias', script.game_name)
+        client.wait_for_event('named')
+        client.send('play', {'gameName': script.game_name, 'clientType': 'Python'})
+        manager.set_constants(client.wait_for_event('lobbied')['constants'])
+        client.wait_for_event('start')
+        order = client.wait_for_event('order')
+
+        towers = sorted(game.towers, key=lambda tower: int(tower.id))
+        start = time.perf_counter()
+        results = attack(towers, game.tiles, mode)
+        seconds = time.perf_counter() - start
+
+        client.send('finished', {'orderIndex': order['index'], 'returned': True})
+        client.wait_for_event('over')
+        state = [(tower.id, tower.attacked, tower.cooldown) for tower in towers]
+    finally:
+        client.disconnect()
+        server.shutdown()
+        server.server_close()
+
+    return results, state, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Times and checks pipelined game object functions against a mock server.')
+    parser.add_argument('--towers', type=int, default=200, help='towers attacking, one command each')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verify', action='store_true', help='check every mode gets the same results and game state')
+    args = parser.parse_args()
+
+    world = synthetic.World('necrowar', objects_per_class=args.towers, seed=args.seed)
+    script = world.script(1)  # made once, as making a script changes the world
+    script.responses['attack'] = respond_attack
+    played = {mode: play(world.module, script, mode) for mode in MODES}
+
+    print('necrowar, {} towers attacking'.format(args.towers))
+    for mode, (results, _, seconds) in played.items():
+        print('{:<30} {:8.1f} ms | {} hit'.format(mode, seconds * 1000, sum(1 for result in results if result)))
+
+    if args.verify:
+        results, state, _ = played[MODES[0]]
+        wrong = [mode for mode in MODES[1:] if played[mode][:2] != (results, state)]
+        if wrong:
+            sys.exit('pipelined results or game state differ from sending one at a time: {}'.format(', '.join(wrong)))
+        print('pipelined results match sending one at a time')
+
+
+if __name__ == '__main__':
+    main()
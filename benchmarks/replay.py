@@ -0,0 +1,239 @@
+# Replays delta sequences through GameManager.apply_delta_state for every
+# game, reporting merge throughput, peak memory, and the memory blocks the
+# merged game holds on to. The results are compared against the baseline
+# stored in benchmarks/baselines/replay.json, to catch regressions in the
+# game manager, serializer, codec, or regenerated game classes.
+#
+# Each game replays a synthetic game with a fixed seed, plus any games
+# captured with main.py --capture that are given with --captured or saved in
+# benchmarks/gamelogs/.
+#
+# Memory use differs between Python versions, so the baseline is only
+# compared against runs with the same settings and Python version as the
+# Makefile's (3.7). A run with nothing to compare a replay against fails,
+# unless --allow-missing-baseline is given.
+#
+#   python3.7 -m benchmarks.replay
+#   python3.7 -m benchmarks.replay necrowar --captured game.jsonl
+#   python3.7 -m benchmarks.replay --save  # after an intended change
+import argparse
+import functools
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import joueur.codec as codec
+from joueur.game_manager import GameManager
+from joueur.utilities import camel_case_converter
+from benchmarks import synthetic
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, 'baselines', 'replay.json')
+GAMELOGS = os.path.join(HERE, 'gamelogs')
+
+# how much worse than the baseline a result can be before it is a regression.
+# Memory use is the same from run to run, but timings vary between runs and
+# machines, so slower replays only fail the run with --check-speed
+MEMORY_TOLERANCE = 0.10
+SPEED_TOLERANCE = 0.30
+
+MEMORY_METRICS = ('peak_kb', 'retained_kb', 'retained_blocks')
+SPEED_METRICS = ('deltas_per_second', 'objects_per_second')
+
+
+def new_manager(game_name, constants):
+    game = synthetic.load_game_module(game_name).Game()
+    manager = GameManager(game)
+    manager.set_constants(constants)
+    return manager
+
+
+def merge_time(game_name, constants, deltas):
+    manager = new_manager(game_name, constants)
+    start = time.perf_counter()
+    for delta in deltas:
+        manager.apply_delta_state(delta)
+    return time.perf_counter() - start
+
+
+def merge_memory(game_name, constants, deltas):
+    """Merges with tracemalloc on, returning (peak KB while merging, KB and blocks the merged game kept)."""
+    tracemalloc.start()
+    try:
+        manager = new_manager(game_name, constants)
+        for delta in deltas:
+            manager.apply_delta_state(delta)
+        retained, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    return peak / 1024, retained / 1024, blocks
+
+
+def replay(game_name, constants, encoded_deltas, repeat):
+    """Measures replaying one sequence of (JSON encoded) deltas.
+
+    Returns:
+        dict: the counts and measurements, by metric name
+    """
+    start = time.perf_counter()
+    deltas = [codec.loads(encoded) for encoded in encoded_deltas]
+    parse_seconds = time.perf_counter() - start
+    objects = sum(len(delta.get('gameObjects', {})) for delta in deltas)
+
+    # merging never modifies the deltas, so the same ones can be merged again
+    seconds = min(merge_time(game_name, constants, deltas) for _ in range(repeat))
+    peak_kb, retained_kb, retained_blocks = merge_memory(game_name, constants, deltas)
+
+    return {
+        'deltas': len(deltas),
+        'objects': objects,
+        'megabytes': sum(len(encoded) for encoded in encoded_deltas) / (1024 * 1024),
+        'parse_ms': parse_seconds * 1000,
+        'merge_ms': seconds * 1000,
+        'deltas_per_second': len(deltas) / seconds,
+        'objects_per_second': objects / seconds,
+        'peak_kb': peak_kb,
+        'retained_kb': retained_kb,
+        'retained_blocks': retained_blocks,
+    }
+
+
+def regressions(result, baseline):
+    """Gets every metric of a result that is worse than its baseline by more than the tolerance.
+
+    Returns:
+        tuple: (descriptions of memory regressions, descriptions of speed regressions)
+    """
+    memory = [
+        '{} {:.0f} > {:.0f}'.format(metric, result[metric], baseline[metric])
+        for metric in MEMORY_METRICS
+        if result[metric] > baseline[metric] * (1 + MEMORY_TOLERANCE)
+    ]
+    speed = [
+        '{} {:.0f} < {:.0f}'.format(metric, result[metric], baseline[metric])
+        for metric in SPEED_METRICS
+        if result[metric] < baseline[metric] * (1 - SPEED_TOLERANCE)
+    ]
+    return memory, speed
+
+
+def settings_of(args):
+    return {
+        'turns': args.turns,
+        'objects': args.objects,
+        'width': args.width,
+        'height': args.height,
+        'seed': args.seed,
+        'python': platform.python_version_tuple()[0] + '.' + platform.python_version_tuple()[1],
+    }
+
+
+def synthetic_deltas(game_name, args):
+    world = synthetic.World(game_name, args.width, args.height, args.objects, seed=args.seed)
+    return [codec.dumps(delta) for delta in world.deltas(args.turns)]
+
+
+def sequences(args):
+    """Every (name, game name, constants, function getting its JSON encoded deltas) to replay.
+
+    Synthetic deltas are only made when asked for, as making them imports the game.
+    """
+    for game_name in args.games:
+        yield game_name, game_name, synthetic.CONSTANTS, functools.partial(synthetic_deltas, game_name, args)
+
+    paths = list(args.captured)
+    if os.path.isdir(GAMELOGS) and not args.captured:
+        paths += sorted(glob.glob(os.path.join(GAMELOGS, '*.jsonl')))
+    for path in paths:
+        game_name, constants, deltas = synthetic.load_captured(path)
+        name = 'captured/' + os.path.splitext(os.path.basename(path))[0]
+        encoded = [codec.dumps(delta) for delta in deltas]
+        yield name, camel_case_converter(game_name), constants, functools.partial(list, encoded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replays delta sequences for every game, comparing against the stored baseline.')
+    parser.add_argument('games', nargs='*', default=synthetic.GAME_NAMES, help='the games to replay synthetic games of')
+    parser.add_argument('--captured', action='append', default=[], help='a game captured with main.py --capture to replay too')
+    parser.add_argument('--turns', type=int, default=100)
+    parser.add_argument('--objects', type=int, default=100, help='game objects per class in synthetic games')
+    parser.add_argument('--width', type=int, default=50)
+    parser.add_argument('--height', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE, help='the stored results to compare against')
+    parser.add_argument('--save', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--allow-missing-baseline', action='store_true', help='pass even if the baseline is missing, was stored with other settings or Python version, or has no result for a replay')
+    parser.add_argument('--check-speed', action='store_true', help='also fail if replays are slower than the baseline, which is only meaningful on the machine it was stored on')
+    args = parser.parse_args()
+
+    settings = settings_of(args)
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline, 'r') as stored:
+            baseline = json.load(stored)
+    comparable = baseline.get('settings') == settings
+    if baseline and not comparable:
+        print('Not comparing against {}, it was stored with different settings: {}'.format(args.baseline, baseline.get('settings')))
+
+    print('{:<24} {:>6} {:>8} {:>7} | {:>8} {:>8} | {:>9} {:>10} | {:>9} {:>9} {:>8}'.format(
+        'replay', 'deltas', 'objects', 'MB', 'parse ms', 'merge ms', 'deltas/s', 'objects/s', 'peak KB', 'kept KB', 'blocks'))
+
+    results = {}
+    failed = []
+    unplayable = []
+    missing = []  # replays with no baseline result to compare against
+    for name, game_name, constants, encoded in sequences(args):
+        # a game that can't be imported (e.g. missing its requirements) is
+        # reported and the rest still replay
+        try:
+            result = results[name] = replay(game_name, constants, encoded(), args.repeat)
+        except ImportError as e:
+            unplayable.append(name)
+            print('{:<24} could not import games.{}: {}'.format(name, game_name, e))
+            continue
+        print('{:<24} {:>6} {:>8} {:>7.2f} | {:>8.1f} {:>8.1f} | {:>9.0f} {:>10.0f} | {:>9.0f} {:>9.0f} {:>8}'.format(
+            name, result['deltas'], result['objects'], result['megabytes'],
+            result['parse_ms'], result['merge_ms'],
+            result['deltas_per_second'], result['objects_per_second'],
+            result['peak_kb'], result['retained_kb'], result['retained_blocks']
+        ))
+
+        stored = baseline.get('results', {}).get(name)
+        if not (comparable and stored):
+            missing.append(name)
+        else:
+            memory, speed = regressions(result, stored)
+            if memory or (speed and args.check_speed):
+                failed.append(name)
+            if memory or speed:
+                print('{:<24} {}: {}'.format(
+                    '', 'regressed' if name in failed else 'slower than the baseline', ', '.join(memory + speed)))
+
+    if args.save and not unplayable:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as stored:
+            json.dump({'settings': settings, 'results': results}, stored, indent=2, sort_keys=True)
+            stored.write('\n')
+        print('Stored as the baseline in {}'.format(args.baseline))
+
+    errors = []
+    if unplayable:
+        # a baseline without them would stop them being checked
+        errors.append('{} games could not be imported{}: {}'.format(
+            len(unplayable), ', so the baseline was not stored' if args.save else '', ', '.join(unplayable)))
+    if failed and not args.save:
+        errors.append('{} replays regressed against {}: {}'.format(len(failed), args.baseline, ', '.join(failed)))
+    if missing and not (args.save or args.allow_missing_baseline):
+        errors.append('{} replays have no baseline to compare against in {}, store one with --save: {}'.format(
+            len(missing), args.baseline, ', '.join(missing)))
+    if errors:
+        sys.exit('\n'.join(errors))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+# Synthetic (and recorded) delta states to benchmark the client against,
+# shaped like what a Cadre game server sends
+import importlib
+import json
+import random
+import re
+from joueur.utilities import attribute_types
+
+DELTA_REMOVED = '&RM'
+DELTA_LIST_LENGTH = '&LEN'
+CONSTANTS = {
+    'DELTA_REMOVED': DELTA_REMOVED,
+    'DELTA_LIST_LENGTH': DELTA_LIST_LENGTH
+}
+
+# what games with a board in Forsyth-Edwards Notation (chess) start from, as
+# their AIs read it
+STARTING_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+# the titles of each job a game's server sends, which AIs look their jobs up
+# by, e.g. necrowar's AI finds the job to spawn workers with as "worker"
+JOB_TITLES = {
+    'necrowar': {
+        'UnitJob': ['worker', 'zombie', 'ghoul', 'hound', 'abomination', 'wraith', 'horseman'],
+        'TowerJob': ['arrow', 'ballista', 'cleansing', 'aoe', 'castle'],
+    },
+}
+
+GAME_NAMES = [
+    'anarchy', 'catastrophe', 'checkers', 'chess', 'necrowar', 'newtonian',
+    'pirates', 'saloon', 'spiders', 'stardash', 'stumped'
+]
+
+_first_lower_re = re.compile(r'_([a-z0-9])')
+
+
+def server_key(attribute_name):
+    """The camelCase key the server uses for a snake_case attribute name."""
+    return _first_lower_re.sub(lambda m: m.group(1).upper(), attribute_name)
+
+
+def load_game_module(game_name):
+    return importlib.import_module('games.' + game_name)
+
+
+def attributes(cls):
+    """Every (snake_case name, rtype string) the server sends for a game or
+    game object class, from the types Creer generated for it.
+    """
+    return sorted(attribute_types(cls).items())
+
+
+def _class_name(rtype):
+    # e.g. 'games.necrowar.tile.Tile' -> 'Tile'
+    return rtype.rsplit('.', 1)[-1] if rtype.startswith('games.') else None
+
+
+def _encode_list(items):
+    encoded = {DELTA_LIST_LENGTH: len(items)}
+    for i, item in enumerate(items):
+        encoded[str(i)] = item
+    return encoded
+
+
+def _reference(obj):
+    return {'id': obj['id']} if obj is not None else None
+
+
+class World():
+    """A made up game state for one of the games, plus the deltas a server
+    would send while playing it.
+    """
+
+    def __init__(self, game_name, width=50, height=30, objects_per_class=50,
+                 seed=0):
+        self.game_name = game_name
+        self.module = load_game_module(game_name)
+        self.random = random.Random(seed)
+        self.game = self.module.Game()
+        self.classes = self.game._game_object_classes
+        self.objects = {}  # id -> server side state of that game object
+        self.by_class = {name: [] for name in self.classes}
+        self.width = width
+        self.height = height
+        self.job_titles = JOB_TITLES.get(game_name, {})
+
+        self._tiled = 'Tile' in self.classes and hasattr(self.game, 'map_width')
+
+        for class_name in sorted(self.classes):
+            for i in range(self._count(class_name, objects_per_class)):
+                self._create(class_name)
+
+        if self._tiled:
+            self._link_tiles()
+
+        for obj in list(self.objects.values()):
+            self._fill(obj)
+
+    def _count(self, class_name, objects_per_class):
+        if class_name == 'GameObject':
+            return 0
+        if class_name == 'Player':
+            return 2
+        if class_name == 'Tile':
+            return self.width * self.height if self._tiled else 0
+        if class_name in self.job_titles:
+            return len(self.job_titles[class_name])
+        if class_name.endswith('Job'):
+            return 4
+        return objects_per_class
+
+    def _create(self, class_name):
+        id = str(len(self.objects))
+        obj = {'id': id, 'gameObjectName': class_name}
+        titles = self.job_titles.get(class_name)
+        if titles:
+            obj['title'] = titles[len(self.by_class[class_name])]
+        self.objects[id] = obj
+        self.by_class[class_name].append(obj)
+        return obj
+
+    def _instances_of(self, class_name):
+        cls = self.classes.get(class_name)
+        if cls is None:
+            return []
+        instances = []
+        for name, objs in self.by_class.items():
+            if issubclass(self.classes[name], cls):
+                instances.extend(objs)
+        return instances
+
+    def _link_tiles(self):
+        tiles = self.by_class['Tile']
+        w, h = self.width, self.height
+        for i, tile in enumerate(tiles):
+            x, y = i % w, i // w
+            tile['x'] = x
+            tile['y'] = y
+            tile['tileNorth'] = _reference(tiles[i - w]) if y > 0 else None
+            tile['tileSouth'] = _reference(tiles[i + w]) if y < h - 1 else None
+            tile['tileWest'] = _reference(tiles[i - 1]) if x > 0 else None
+            tile['tileEast'] = _reference(tiles[i + 1]) if x < w - 1 else None
+
+    def random_value(self, rtype):
+        r = self.random
+        if rtype == 'int':
+            return r.randint(0, 9)
+        if rtype == 'float':
+            return round(r.uniform(0, 100), 3)
+        if rtype == 'bool':
+            return r.random() < 0.5
+        if rtype == 'str':
+            return 'v{}'.format(r.randint(0, 999))
+        if rtype.startswith('list['):
+            inner = rtype[5:-1]
+            if _class_name(inner):
+                candidates = self._instances_of(_class_name(inner))
+                # lists change length between turns, so merging resizes them
+                items = r.sample(candidates, r.randint(0, min(len(candidates), 5)))
+                return [_reference(item) for item in items]
+            return []
+        if rtype.startswith('dict['):
+            return {}
+        class_name = _class_name(rtype)
+        if class_name:
+            candidates = self._instances_of(class_name)
+            return _reference(r.choice(candidates)) if candidates else None
+        return None
+
+    def _fill(self, obj):
+        cls = self.classes[obj['gameObjectName']]
+        for name, rtype in attributes(cls):
+            key = server_key(name)
+            if key in obj or name in ('game_object_name', 'id'):
+                continue
+            if name == 'logs':
+                obj[key] = []
+            else:
+                obj[key] = self.random_value(rtype)
+
+    def _encode(self, value):
+        if isinstance(value, list):
+            return _encode_list([self._encode(v) for v in value])
+        return value
+
+    def initial_delta(self):
+        """The first delta of a game, which creates every game object."""
+        delta = {'gameObjects': {}}
+        for id, obj in self.objects.items():
+            delta['gameObjects'][id] = {
+                key: self._encode(value) for key, value in obj.items()
+            }
+
+        for name, rtype in attributes(self.game.__class__):
+            key = server_key(name)
+            if name == 'game_objects':
+                continue
+            elif name == 'tiles':
+                delta[key] = _encode_list(
+                    [_reference(tile) for tile in self.by_class.get('Tile', [])])
+            elif name == 'map_width':
+                delta[key] = self.width
+            elif name == 'map_height':
+                delta[key] = self.height
+            elif rtype.startswith('list[') and _class_name(rtype[5:-1]):
+                delta[key] = _encode_list([
+                    _reference(obj)
+                    for obj in self._instances_of(_class_name(rtype[5:-1]))
+                ])
+            else:
+                delta[key] = self._encode(self.random_value(rtype))
+
+        if 'fen' in delta:
+            delta['fen'] = STARTING_FEN
+        if self._has_turns():
+            delta['currentTurn'] = 0
+        return delta
+
+    def _has_turns(self):
+        return any(name == 'current_turn' for name, _ in attributes(self.game.__class__))
+
+    def turn_delta(self, turn, changes=None):
+        """A delta for one turn, changing a few attributes of some objects."""
+        r = self.random
+        changes = changes or max(1, len(self.objects) // 20)
+        delta = {'gameObjects': {}}
+        if self._has_turns():
+            delta['currentTurn'] = turn
+        ids = list(self.objects)
+        for id in r.sample(ids, min(changes, len(ids))):
+            obj = self.objects[id]
+            changeable = [
+                (name, rtype)
+                for name, rtype in attributes(self.classes[obj['gameObjectName']])
+                if name not in ('id', 'game_object_name', 'logs', 'x', 'y', 'title')
+                and not name.startswith('tile_')
+            ]
+            if not changeable:
+                continue
+            changed = delta['gameObjects'][id] = {}
+            for name, rtype in r.sample(changeable, min(3, len(changeable))):
+                value = self.random_value(rtype)
+                changed[server_key(name)] = self._encode(value)
+                obj[server_key(name)] = value
+
+        # the game's lists of game objects (e.g. every unit) grow and shrink
+        # as they are made and destroyed, but the board itself stays put
+        for name, rtype in attributes(self.game.__class__):
+            if name in ('tiles', 'players') or not (rtype.startswith('list[') and _class_name(rtype[5:-1])):
+                continue
+            if r.random() < 0.5:
+                instances = self._instances_of(_class_name(rtype[5:-1]))
+                kept = sorted(r.sample(range(len(instances)), r.randint(len(instances) // 2, len(instances))))
+                delta[server_key(name)] = _encode_list([_reference(instances[i]) for i in kept])
+        return delta
+
+    def final_delta(self):
+        """The delta sent just before the game is over, with the first Player winning."""
+        players = self.by_class['Player']
+        delta = {'gameObjects': {}}
+        for player, won in zip(players, (True, False)):
+            delta['gameObjects'][player['id']] = {
+                'won': won,
+                'lost': not won,
+                'reasonWon': 'synthetic win' if won else '',
+                'reasonLost': '' if won else 'synthetic loss',
+            }
+        return delta
+
+    def order_name(self):
+        """The order the server sends each turn, e.g. "runTurn", or "makeMove" for chess."""
+        return 'makeMove' if hasattr(self.module.AI, 'make_move') else 'runTurn'
+
+    def script(self, turns=100, changes=None):
+        """A joueur.mock_server.Script playing this world as its first Player for `turns` turns."""
+        from joueur.mock_server import Script
+        return Script(
+            self.game.name,
+            self.by_class['Player'][0]['id'],
+            [self.initial_delta()],
+            [([self.turn_delta(turn, changes)], {'name': self.order_name(), 'args': []})
+             for turn in range(1, turns + 1)],
+            CONSTANTS,
+            final_deltas=[self.final_delta()]
+        )
+
+    def deltas(self, turns=100, changes=None):
+        """The initial delta followed by `turns` turn deltas."""
+        return [self.initial_delta()] + [
+            self.turn_delta(turn, changes) for turn in range(1, turns + 1)
+        ]
+
+
+def load_captured(path):
+    """Loads server frames captured as JSON lines, one {'event', 'data'} per line.
+
+    Returns:
+        tuple: (game name, delta constants, list of the delta states in order)
+    """
+    game_name = None
+    constants = CONSTANTS
+    deltas = []
+    with open(path, 'r') as captured:
+        for line in captured:
+            if not line.strip():
+                continue
+            frame = json.loads(line)
+            if frame['event'] == 'named':
+                game_name = frame['data']
+            elif frame['event'] == 'lobbied':
+                constants = frame['data']['constants']
+            elif frame['event'] == 'delta':
+                deltas.append(frame['data'])
+    return game_name, constants, deltas
@@ -16,6 +16,41 @@ class Building(GameObject):
     A basic building. It does nothing besides burn down. Other Buildings inherit from this class.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_bribed',
+        '_building_east',
+        '_building_north',
+        '_building_south',
+        '_building_west',
+        '_fire',
+        '_health',
+        '_is_headquarters',
+        '_owner',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'bribed': 'bool',
+        'building_east': 'games.anarchy.building.Building',
+        'building_north': 'games.anarchy.building.Building',
+        'building_south': 'games.anarchy.building.Building',
+        'building_west': 'games.anarchy.building.Building',
+        'fire': 'int',
+        'health': 'int',
+        'is_headquarters': 'bool',
+        'owner': 'games.anarchy.player.Player',
+        'x': 'int',
+        'y': 'int',
+    }
+
     def __init__(self):
         """Initializes a Building with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,21 @@ class FireDepartment(Building):
     Can put out fires completely.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_fire_extinguished',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'fire_extinguished': 'int',
+    }
+
     def __init__(self):
         """Initializes a FireDepartment with basic logic as provided by the Creer code generator."""
         Building.__init__(self)
@@ -16,6 +16,25 @@ class Forecast(GameObject):
     The weather effect that will be applied at the end of a turn, which causes fires to spread.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_controlling_player',
+        '_direction',
+        '_intensity',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'controlling_player': 'games.anarchy.player.Player',
+        'direction': 'str',
+        'intensity': 'int',
+    }
+
     def __init__(self):
         """Initializes a Forecast with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -26,6 +26,53 @@ class Game(BaseGame):
     Two player grid based game where each player tries to burn down the other player's buildings. Let it burn.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_base_bribes_per_turn',
+        '_buildings',
+        '_current_forecast',
+        '_current_player',
+        '_current_turn',
+        '_forecasts',
+        '_game_objects',
+        '_map_height',
+        '_map_width',
+        '_max_fire',
+        '_max_forecast_intensity',
+        '_max_turns',
+        '_next_forecast',
+        '_players',
+        '_session',
+        '_time_added_per_turn',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'base_bribes_per_turn': 'int',
+        'buildings': 'list[games.anarchy.building.Building]',
+        'current_forecast': 'games.anarchy.forecast.Forecast',
+        'current_player': 'games.anarchy.player.Player',
+        'current_turn': 'int',
+        'forecasts': 'list[games.anarchy.forecast.Forecast]',
+        'game_objects': 'dict[str, games.anarchy.game_object.GameObject]',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_fire': 'int',
+        'max_forecast_intensity': 'int',
+        'max_turns': 'int',
+        'next_forecast': 'games.anarchy.forecast.Forecast',
+        'players': 'list[games.anarchy.player.Player]',
+        'session': 'str',
+        'time_added_per_turn': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -16,6 +16,49 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_bribes_remaining',
+        '_buildings',
+        '_client_type',
+        '_fire_departments',
+        '_headquarters',
+        '_lost',
+        '_name',
+        '_opponent',
+        '_police_departments',
+        '_reason_lost',
+        '_reason_won',
+        '_time_remaining',
+        '_warehouses',
+        '_weather_stations',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'bribes_remaining': 'int',
+        'buildings': 'list[games.anarchy.building.Building]',
+        'client_type': 'str',
+        'fire_departments': 'list[games.anarchy.fire_department.FireDepartment]',
+        'headquarters': 'games.anarchy.warehouse.Warehouse',
+        'lost': 'bool',
+        'name': 'str',
+        'opponent': 'games.anarchy.player.Player',
+        'police_departments': 'list[games.anarchy.police_department.PoliceDepartment]',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'time_remaining': 'float',
+        'warehouses': 'list[games.anarchy.warehouse.Warehouse]',
+        'weather_stations': 'list[games.anarchy.weather_station.WeatherStation]',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
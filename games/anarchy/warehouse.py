@@ -16,6 +16,23 @@ class Warehouse(Building):
     A typical abandoned warehouse... that anarchists hang out in and can be bribed to burn down Buildings.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_exposure',
+        '_fire_added',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'exposure': 'int',
+        'fire_added': 'int',
+    }
+
     def __init__(self):
         """Initializes a Warehouse with basic logic as provided by the Creer code generator."""
         Building.__init__(self)
@@ -24,6 +24,73 @@ class Game(BaseGame):
     Convert as many humans to as you can to survive in this post-apocalyptic wasteland.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_cat_energy_mult',
+        '_current_player',
+        '_current_turn',
+        '_game_objects',
+        '_harvest_cooldown',
+        '_jobs',
+        '_lower_harvest_amount',
+        '_map_height',
+        '_map_width',
+        '_max_turns',
+        '_monument_cost_mult',
+        '_monument_materials',
+        '_neutral_materials',
+        '_players',
+        '_session',
+        '_shelter_materials',
+        '_starting_food',
+        '_starving_energy_mult',
+        '_structures',
+        '_tiles',
+        '_time_added_per_turn',
+        '_turns_between_harvests',
+        '_turns_to_create_human',
+        '_turns_to_lower_harvest',
+        '_units',
+        '_wall_materials',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'cat_energy_mult': 'float',
+        'current_player': 'games.catastrophe.player.Player',
+        'current_turn': 'int',
+        'game_objects': 'dict[str, games.catastrophe.game_object.GameObject]',
+        'harvest_cooldown': 'int',
+        'jobs': 'list[games.catastrophe.job.Job]',
+        'lower_harvest_amount': 'int',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_turns': 'int',
+        'monument_cost_mult': 'float',
+        'monument_materials': 'int',
+        'neutral_materials': 'int',
+        'players': 'list[games.catastrophe.player.Player]',
+        'session': 'str',
+        'shelter_materials': 'int',
+        'starting_food': 'int',
+        'starving_energy_mult': 'float',
+        'structures': 'list[games.catastrophe.structure.Structure]',
+        'tiles': 'list[games.catastrophe.tile.Tile]',
+        'time_added_per_turn': 'int',
+        'turns_between_harvests': 'int',
+        'turns_to_create_human': 'int',
+        'turns_to_lower_harvest': 'int',
+        'units': 'list[games.catastrophe.unit.Unit]',
+        'wall_materials': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -16,6 +16,25 @@ class GameObject(BaseGameObject):
     An object in the game. The most basic class that all game classes should inherit from automatically.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_game_object_name',
+        '_id',
+        '_logs',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'game_object_name': 'str',
+        'id': 'str',
+        'logs': 'list[str]',
+    }
+
     def __init__(self):
         """Initializes a GameObject with basic logic as provided by the Creer code generator."""
         BaseGameObject.__init__(self)
@@ -16,6 +16,31 @@ class Job(GameObject):
     Information about a Unit's job.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_action_cost',
+        '_carry_limit',
+        '_moves',
+        '_regen_rate',
+        '_title',
+        '_upkeep',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'action_cost': 'float',
+        'carry_limit': 'int',
+        'moves': 'int',
+        'regen_rate': 'float',
+        'title': 'str',
+        'upkeep': 'int',
+    }
+
     def __init__(self):
         """Initializes a Job with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
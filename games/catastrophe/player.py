@@ -16,6 +16,45 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_cat',
+        '_client_type',
+        '_food',
+        '_lost',
+        '_name',
+        '_opponent',
+        '_reason_lost',
+        '_reason_won',
+        '_structures',
+        '_time_remaining',
+        '_units',
+        '_upkeep',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'cat': 'games.catastrophe.unit.Unit',
+        'client_type': 'str',
+        'food': 'int',
+        'lost': 'bool',
+        'name': 'str',
+        'opponent': 'games.catastrophe.player.Player',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'structures': 'list[games.catastrophe.structure.Structure]',
+        'time_remaining': 'float',
+        'units': 'list[games.catastrophe.unit.Unit]',
+        'upkeep': 'int',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,29 @@ class Structure(GameObject):
     A structure on a Tile.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_effect_radius',
+        '_materials',
+        '_owner',
+        '_tile',
+        '_type',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'effect_radius': 'int',
+        'materials': 'int',
+        'owner': 'games.catastrophe.player.Player',
+        'tile': 'games.catastrophe.tile.Tile',
+        'type': 'str',
+    }
+
     def __init__(self):
         """Initializes a Structure with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,43 @@ class Unit(GameObject):
     A unit in the game.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_acted',
+        '_energy',
+        '_food',
+        '_job',
+        '_materials',
+        '_movement_target',
+        '_moves',
+        '_owner',
+        '_squad',
+        '_starving',
+        '_tile',
+        '_turns_to_die',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'acted': 'bool',
+        'energy': 'float',
+        'food': 'int',
+        'job': 'games.catastrophe.job.Job',
+        'materials': 'int',
+        'movement_target': 'games.catastrophe.tile.Tile',
+        'moves': 'int',
+        'owner': 'games.catastrophe.player.Player',
+        'squad': 'list[games.catastrophe.unit.Unit]',
+        'starving': 'bool',
+        'tile': 'games.catastrophe.tile.Tile',
+        'turns_to_die': 'int',
+    }
+
     def __init__(self):
         """Initializes a Unit with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
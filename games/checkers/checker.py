@@ -16,6 +16,27 @@ class Checker(GameObject):
     A checker on the game board.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_kinged',
+        '_owner',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'kinged': 'bool',
+        'owner': 'games.checkers.player.Player',
+        'x': 'int',
+        'y': 'int',
+    }
+
     def __init__(self):
         """Initializes a Checker with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -21,6 +21,45 @@ class Game(BaseGame):
     The simple version of American Checkers. An 8x8 board with 12 checkers on each side that must move diagonally to the opposing side until kinged.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_board_height',
+        '_board_width',
+        '_checker_moved',
+        '_checker_moved_jumped',
+        '_checkers',
+        '_current_player',
+        '_current_turn',
+        '_game_objects',
+        '_max_turns',
+        '_players',
+        '_session',
+        '_time_added_per_turn',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'board_height': 'int',
+        'board_width': 'int',
+        'checker_moved': 'games.checkers.checker.Checker',
+        'checker_moved_jumped': 'bool',
+        'checkers': 'list[games.checkers.checker.Checker]',
+        'current_player': 'games.checkers.player.Player',
+        'current_turn': 'int',
+        'game_objects': 'dict[str, games.checkers.game_object.GameObject]',
+        'max_turns': 'int',
+        'players': 'list[games.checkers.player.Player]',
+        'session': 'str',
+        'time_added_per_turn': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -4,6 +4,16 @@ from joueur.base_ai import BaseAI
 
 # <<-- Creer-Merge: imports -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
 # you can add additional import(s) here
+import os
+from games.chess.engine.book import OpeningBook
+from games.chess.engine.ponder import Ponderer
+from games.chess.engine.search import Searcher
+from games.chess.engine.sync import GameSync
+
+# seconds to leave after searching, for writing the move and sending it
+SEARCH_RESERVE = 0.05
+# the opening book used unless one is given with --aiSettings book=<path>
+DEFAULT_BOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'book.bin')
 # <<-- /Creer-Merge: imports -->>
 
 class AI(BaseAI):
@@ -42,6 +52,13 @@ class AI(BaseAI):
         """
         # <<-- Creer-Merge: start -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
         # replace with your start logic
+        self.searcher = Searcher()  # kept between moves, so what it learned carries over
+        self.sync = GameSync()  # the position, updated with each move rather than reparsed
+        # searches on the opponent's time with --aiSettings ponder
+        self.pondering = self.get_setting('ponder') is not None
+        self.ponderer = Ponderer(self.searcher)
+        book = self.get_setting('book') or DEFAULT_BOOK
+        self.book = OpeningBook(book) if os.path.isfile(book) else None
         # <<-- /Creer-Merge: start -->>
 
     def game_updated(self):
@@ -50,6 +67,7 @@ class AI(BaseAI):
         """
         # <<-- Creer-Merge: game-updated -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
         # replace with your game updated logic
+        self.ponderer.update(self.game.history)  # stops pondering as soon as the opponent surprises us
         # <<-- /Creer-Merge: game-updated -->>
 
     def end(self, won, reason):
@@ -63,6 +81,9 @@ class AI(BaseAI):
         """
         # <<-- Creer-Merge: end -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
         # replace with your end logic
+        self.ponderer.stop()
+        if self.book is not None:
+            self.book.close()
         # <<-- /Creer-Merge: end -->>
     def make_move(self):
         """ This is called every time it is this AI.player's turn to make a move.
@@ -72,7 +93,23 @@ class AI(BaseAI):
         """
         # <<-- Creer-Merge: makeMove -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
         # Put your game logic here for makeMove
-        return ""
+        position = self.sync.update(self.game.history, self.game.fen)
+        move = self.book.choose(position) if self.book is not None else None
+        if move is not None:
+            self.ponderer.stop()
+            return position.san(move)
+
+        deadline = self.budget.deadline
+        if deadline is not None:
+            deadline -= SEARCH_RESERVE
+        result = self.ponderer.take(position, deadline)
+        if result is None:
+            result = self.searcher.search(position, deadline, max_depth=4 if deadline is None else 64)
+
+        san = position.san(result.move)
+        if self.pondering and len(result.pv) > 1:
+            self.ponderer.start(position, result.pv[:2], len(self.game.history))
+        return san
         # <<-- /Creer-Merge: makeMove -->>
 
     # <<-- Creer-Merge: functions -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
@@ -0,0 +1,165 @@
+# Bitboards: sets of squares as 64 bit ints, one bit per square with a1 as
+# bit 0, h1 as bit 7, and h8 as bit 63, plus the attack tables built from
+# them when this is first imported.
+#
+# Sliding pieces look their attacks up by the occupancy of the squares that
+# can block them. Where a C engine would hash that occupancy with a magic
+# multiply into a flat array, a dict per square does the same job here in one
+# lookup, as Python ints don't wrap at 64 bits.
+
+FILES = 'abcdefgh'
+RANKS = '12345678'
+
+FULL = (1 << 64) - 1
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+RANK_1 = 0xFF
+RANK_2 = RANK_1 << 8
+RANK_7 = RANK_1 << 48
+RANK_8 = RANK_1 << 56
+
+KNIGHT_DELTAS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+KING_DELTAS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (-1, -1), (1, -1), (-1, 1))
+
+
+def square(name):
+    """Gets the index of a square from its name, e.g. "e4" -> 28."""
+    return FILES.index(name[0]) + 8 * RANKS.index(name[1])
+
+
+def square_name(index):
+    """Gets the name of a square from its index, e.g. 28 -> "e4"."""
+    return FILES[index & 7] + RANKS[index >> 3]
+
+
+def squares(bitboard):
+    """Yields the index of every square in a bitboard, lowest first."""
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def _on_board(file, rank):
+    return 0 <= file < 8 and 0 <= rank < 8
+
+
+def _leaper_attacks(deltas):
+    attacks = []
+    for index in range(64):
+        file, rank = index & 7, index >> 3
+        bitboard = 0
+        for df, dr in deltas:
+            if _on_board(file + df, rank + dr):
+                bitboard |= 1 << (file + df + 8 * (rank + dr))
+        attacks.append(bitboard)
+    return tuple(attacks)
+
+
+def _ray(index, direction):
+    # the squares from index (not included) to the edge of the board
+    file, rank = index & 7, index >> 3
+    df, dr = direction
+    ray = []
+    file, rank = file + df, rank + dr
+    while _on_board(file, rank):
+        ray.append(file + 8 * rank)
+        file, rank = file + df, rank + dr
+    return ray
+
+
+def _subsets(mask):
+    # every subset of the bits in mask, by the carry-rippler trick
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            return
+
+
+def _line_table(index, directions):
+    # the attacks along two opposite directions, for every occupancy of the squares that can block them
+    rays = [_ray(index, direction) for direction in directions]
+    mask = 0
+    for ray in rays:
+        for blocker in ray[:-1]:  # a piece on the edge blocks nothing past it
+            mask |= 1 << blocker
+
+    table = {}
+    for occupancy in _subsets(mask):
+        attacks = 0
+        for ray in rays:
+            for target in ray:
+                attacks |= 1 << target
+                if occupancy >> target & 1:
+                    break
+        table[occupancy] = attacks
+    return mask, table
+
+
+def _slider_tables(line_directions):
+    masks = []
+    tables = []
+    for index in range(64):
+        lines = [_line_table(index, directions) for directions in line_directions]
+        mask = 0
+        for line_mask, _ in lines:
+            mask |= line_mask
+
+        table = {}
+        for occupancy in _subsets(mask):
+            attacks = 0
+            for line_mask, line_table in lines:
+                attacks |= line_table[occupancy & line_mask]
+            table[occupancy] = attacks
+
+        masks.append(mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+
+def _between_and_lines():
+    between = [[0] * 64 for _ in range(64)]
+    lines = [[0] * 64 for _ in range(64)]
+    for index in range(64):
+        for direction in ROOK_DIRECTIONS + BISHOP_DIRECTIONS:
+            ray = _ray(index, direction)
+            opposite = _ray(index, (-direction[0], -direction[1]))
+            line = 1 << index
+            for target in ray + opposite:
+                line |= 1 << target
+
+            passed = 0
+            for target in ray:
+                between[index][target] = passed
+                lines[index][target] = line
+                passed |= 1 << target
+    return tuple(map(tuple, between)), tuple(map(tuple, lines))
+
+
+KNIGHT_ATTACKS = _leaper_attacks(KNIGHT_DELTAS)
+KING_ATTACKS = _leaper_attacks(KING_DELTAS)
+# the squares a pawn of each color attacks, by [color][square]
+PAWN_ATTACKS = (_leaper_attacks(((-1, 1), (1, 1))), _leaper_attacks(((-1, -1), (1, -1))))
+
+# attacks of a rook or bishop on a square: TABLES[square][occupied & MASKS[square]]
+ROOK_MASKS, ROOK_TABLES = _slider_tables((ROOK_DIRECTIONS[:2], ROOK_DIRECTIONS[2:]))
+BISHOP_MASKS, BISHOP_TABLES = _slider_tables((BISHOP_DIRECTIONS[:2], BISHOP_DIRECTIONS[2:]))
+
+# BETWEEN[a][b] is the squares strictly between two squares on a shared rank,
+# file, or diagonal, and LINE[a][b] that whole line across the board; both are
+# 0 if the squares don't share one
+BETWEEN, LINE = _between_and_lines()
+
+
+def rook_attacks(index, occupied):
+    """The squares a rook on a square attacks, given every occupied square."""
+    return ROOK_TABLES[index][occupied & ROOK_MASKS[index]]
+
+
+def bishop_attacks(index, occupied):
+    """The squares a bishop on a square attacks, given every occupied square."""
+    return BISHOP_TABLES[index][occupied & BISHOP_MASKS[index]]
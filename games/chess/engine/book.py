@@ -0,0 +1,135 @@
+# Book: opening moves looked up by position instead of searched for. A book
+# file is a sorted array of 16 byte entries, laid out like a Polyglot book:
+#
+#   key     8 bytes  the Zobrist hash of the position (Position.hash)
+#   move    2 bytes  the to square in bits 0-5, the from square in bits 6-11,
+#                    and the piece type promoted to in bits 12-14
+#   weight  2 bytes  how good the move is; moves are picked in proportion to it
+#   learn   4 bytes  unused, 0
+#
+# all big endian, sorted by key then by weight, best first. The file is
+# memory mapped and binary searched, so opening a book costs nothing however
+# big it is, and a lookup reads about log2(entries) of them.
+#
+# Books are compiled from PGN games or lines of SAN moves by
+# games/chess/engine/build_book.py.
+import mmap
+import os
+import random
+import struct
+from games.chess.engine.position import CASTLE
+
+ENTRY = struct.Struct('>QHHI')
+_KEY = struct.Struct('>Q')
+
+MAX_WEIGHT = 0xFFFF
+
+
+def book_move(move):
+    """Gets a move as stored in a book. Castling is written as the king taking its own rook, as in Polyglot books."""
+    start = move & 63
+    end = move >> 6 & 63
+    if move >> 15 == CASTLE:
+        end = start + 3 if end > start else start - 4
+    return end | start << 6 | (move >> 12 & 7) << 12
+
+
+# @class OpeningBook: a book file, memory mapped
+class OpeningBook():
+    """The moves stored in a book file for each position."""
+
+    def __init__(self, path):
+        """Opens a book.
+
+        Args:
+            path (str): the book file, e.g. from write_book()
+        Raises:
+            ValueError: if the file isn't a whole number of entries
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size % ENTRY.size:
+            self._file.close()
+            raise ValueError('"{}" is not a book, its size is not a multiple of {} bytes'.format(path, ENTRY.size))
+        # an empty file can't be mapped, but is a valid book of nothing
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._length = size // ENTRY.size
+
+    def __len__(self):
+        return self._length
+
+    def close(self):
+        if self._map:
+            self._map.close()
+        self._file.close()
+
+    def entries(self, key):
+        """Gets every entry stored for a position.
+
+        Args:
+            key (int): the position's Zobrist hash
+        Returns:
+            list[tuple]: (book move, weight, learn) of each entry, best first
+        """
+        data = self._map
+        low, high = 0, self._length
+        while low < high:  # the first entry with a key at least this one
+            middle = (low + high) >> 1
+            if _KEY.unpack_from(data, middle * ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        found = []
+        for index in range(low, self._length):
+            entry_key, move, weight, learn = ENTRY.unpack_from(data, index * ENTRY.size)
+            if entry_key != key:
+                break
+            found.append((move, weight, learn))
+        return found
+
+    def moves(self, position):
+        """Gets the legal moves the book has for a position.
+
+        Returns:
+            list[tuple]: (move, weight) of each, best first
+        """
+        found = self.entries(position.hash)
+        if not found:
+            return []
+        legal = {book_move(move): move for move in position.legal_moves()}
+        # a hash collision with another position could give moves that aren't legal here
+        return [(legal[move], weight) for move, weight, _ in found if move in legal]
+
+    def choose(self, position, rng=random):
+        """Picks one of the book's moves for a position, at random in proportion to their weights.
+
+        Returns:
+            Optional[int]: the move, or None if the book has none
+        """
+        moves = self.moves(position)
+        total = sum(weight for _, weight in moves)
+        if not total:
+            return None
+        pick = rng.randrange(total)
+        for move, weight in moves:
+            pick -= weight
+            if pick < 0:
+                return move
+
+
+def write_book(path, weights):
+    """Writes a book file.
+
+    Args:
+        path (str): where to write it
+        weights (dict): the weight of each (position hash, move) to store, capped at MAX_WEIGHT
+    """
+    entries = sorted(
+        ((key, book_move(move), min(weight, MAX_WEIGHT)) for (key, move), weight in weights.items() if weight > 0),
+        key=lambda entry: (entry[0], -entry[2], entry[1])
+    )
+    with open(path, 'wb') as book:
+        for key, move, weight in entries:
+            book.write(ENTRY.pack(key, move, weight, 0))
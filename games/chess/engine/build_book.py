@@ -0,0 +1,113 @@
+# Build book: compiles PGN games, or lines of SAN moves, into an opening book
+# file for games/chess/engine/book.py. Each move's weight is how many of the
+# lines play it from that position.
+#
+#   python3 -m games.chess.engine.build_book openings.pgn
+#   python3 -m games.chess.engine.build_book lines.txt -o book.bin --plies 16
+import argparse
+import collections
+import os
+import re
+from games.chess.engine.book import write_book
+from games.chess.engine.position import Position
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'book.bin')
+
+_COMMENT_RE = re.compile(r'\{[^}]*\}|;[^\n]*')
+_MOVE_NUMBER_RE = re.compile(r'^\d+\.+')
+_RESULTS = ('1-0', '0-1', '1/2-1/2', '*')
+
+
+def _strip_variations(text):
+    # drop (...) side lines, which can nest
+    kept = []
+    depth = 0
+    for letter in text:
+        if letter == '(':
+            depth += 1
+        elif letter == ')':
+            depth = max(depth - 1, 0)
+        elif not depth:
+            kept.append(letter)
+    return ''.join(kept)
+
+
+def read_lines(text):
+    """Reads the lines of moves in PGN games, or in text with one line of SAN moves per line.
+
+    Returns:
+        list[list[str]]: the SAN moves of each game or line
+    """
+    text = _strip_variations(_COMMENT_RE.sub(' ', text))
+    pgn = any(line.startswith('[') for line in text.splitlines())
+
+    lines = []
+    moves = []
+    for row in text.splitlines():
+        row = row.strip()
+        if row.startswith('['):
+            if moves:  # the headers of the next game
+                lines.append(moves)
+                moves = []
+            continue
+        for token in row.split():
+            token = _MOVE_NUMBER_RE.sub('', token)
+            if token in _RESULTS:
+                if moves:
+                    lines.append(moves)
+                moves = []
+            elif token and not token.startswith('$'):
+                moves.append(token)
+        if not pgn and moves:
+            lines.append(moves)
+            moves = []
+    if moves:
+        lines.append(moves)
+    return lines
+
+
+def build(lines, plies=20, start_fen=None):
+    """Counts how often each move is played from each position in lines of SAN moves.
+
+    Args:
+        lines (list[list[str]]): the moves of each game or line, e.g. from read_lines()
+        plies (int): how many moves of each line to store
+        start_fen (Optional[str]): the position the lines start from, if not the usual one
+    Returns:
+        dict: the times each (position hash, move) was played, for write_book()
+    Raises:
+        ValueError: if a move isn't legal
+    """
+    weights = collections.Counter()
+    for moves in lines:
+        position = Position(start_fen) if start_fen else Position()
+        for number, san in enumerate(moves[:plies]):
+            try:
+                move = position.parse_san(san)
+            except ValueError as error:
+                raise ValueError('move {} of line "{}": {}'.format(number + 1, ' '.join(moves), error))
+            weights[position.hash, move] += 1
+            position.make(move)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compiles PGN games or lines of SAN moves into an opening book.')
+    parser.add_argument('sources', nargs='+', help='PGN files, or text files with one line of SAN moves per line')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help='where to write the book, by default where the chess AI looks for one')
+    parser.add_argument('--plies', type=int, default=20, help='how many moves of each game to store')
+    args = parser.parse_args()
+
+    lines = []
+    for source in args.sources:
+        with open(source, 'r') as opened:
+            lines += read_lines(opened.read())
+
+    weights = build(lines, args.plies)
+    write_book(args.output, weights)
+    print('Wrote {} moves in {} positions from {} lines to {}'.format(
+        len(weights), len({key for key, _ in weights}), len(lines), args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# Ponder: thinks on the opponent's time. After we move, the position after
+# the reply our search expects is searched in a background thread while the
+# client waits for the opponent. If they play that reply, the search carries
+# on as our next move's search until its deadline. If they play anything else
+# it is stopped as soon as the delta with their move arrives, having still
+# filled the transposition table with positions near the real one.
+import threading
+import time
+
+
+def _bare(san):
+    # servers and Position.san() can differ on check marks
+    return san.rstrip('+#')
+
+
+# @class Ponderer: runs a Searcher in a background thread between our moves
+class Ponderer():
+    """Searches the position we expect to move in next while the opponent thinks.
+
+    The searcher is shared with the AI's own searches, so it only ever runs
+    one search at a time: take() or stop() always ends the background
+    search before another can start.
+    """
+
+    def __init__(self, searcher):
+        """Makes a ponderer.
+
+        Args:
+            searcher (Searcher): the searcher the AI moves with, so pondering fills its transposition table
+        """
+        self.searcher = searcher
+        self.hits = 0  # times the opponent played the expected reply
+        self.misses = 0
+        self._thread = None
+        self._result = None
+        self._hash = None  # of the position being pondered
+        self._expected = []  # the moves leading there, in SAN without check marks
+        self._history_length = 0  # how long game.history was before them
+
+    @property
+    def running(self):
+        """bool: If a background search is running."""
+        return self._thread is not None
+
+    def start(self, position, moves, history_length):
+        """Starts searching in the background.
+
+        Args:
+            position (Position): the position we are moving in, which is not changed
+            moves (list[int]): our move then the opponent's expected reply, e.g. the start of a SearchResult's pv
+            history_length (int): the length of game.history before our move
+        """
+        self.stop()
+        pondered = position.copy()
+        pondered._undo = list(position._undo)  # so it still sees repetitions of earlier positions
+        self._expected = []
+        for move in moves:
+            self._expected.append(_bare(pondered.san(move)))
+            pondered.make(move)
+        self._hash = pondered.hash
+        self._history_length = history_length
+        self._result = None
+
+        self._thread = threading.Thread(target=self._run, args=(pondered,), name='ponder', daemon=True)
+        self._thread.start()
+
+    def _run(self, position):
+        self._result = self.searcher.search(position)
+
+    def update(self, history):
+        """Stops pondering if the game's history has a move we did not expect, e.g. from AI.game_updated()."""
+        if self._thread is None:
+            return
+        played = [_bare(san) for san in history[self._history_length:]]
+        if played != self._expected[:len(played)]:
+            self.misses += 1
+            self.stop()
+
+    def take(self, position, deadline):
+        """Gets the background search's result if it is of the position we are now moving in.
+
+        On a hit the search carries on until the deadline, then its result is
+        used as this move's. Otherwise it is stopped.
+
+        Args:
+            position (Position): the position to move in
+            deadline (Optional[float]): the time.perf_counter() time to stop by
+        Returns:
+            Optional[SearchResult]: the result, or None if there is none to use
+        """
+        if self._thread is None:
+            return None
+        if position.hash != self._hash:
+            self.misses += 1
+            self.stop()
+            return None
+        if deadline is None:
+            self.stop()  # it would never finish
+            return None
+
+        self.hits += 1
+        self.searcher.set_deadline(deadline)
+        self._thread.join(max(deadline - time.perf_counter(), 0) + 0.1)
+        self.stop()  # in case it started after the deadline was set, and missed it
+        result = self._result
+        return result if result is not None and result.depth else None
+
+    def stop(self):
+        """Stops any background search, waiting for it to end."""
+        if self._thread is None:
+            return
+        self.searcher.stopped = True
+        self._thread.join()
+        self.searcher.stopped = False
+        self._thread = None
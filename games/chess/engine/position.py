@@ -0,0 +1,638 @@
+# Position: a chess position as bitboards, built from a FEN string like
+# game.fen, with a legal move generator and moves made and unmade in place.
+#
+# Moves are ints: the from square in bits 0-5, the to square in bits 6-11,
+# the piece type promoted to in bits 12-14, and a flag for special moves in
+# bits 15-16. Use san() or uci() to turn them into what the server expects.
+import random
+from games.chess.engine.bitboards import (
+    FILES, RANKS, FULL, RANK_1, RANK_8, squares, square, square_name,
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS,
+    ROOK_MASKS, ROOK_TABLES, BISHOP_MASKS, BISHOP_TABLES, BETWEEN, LINE
+)
+
+STARTING_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+WHITE = 0
+BLACK = 1
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+EMPTY = -1
+
+# pieces are their type plus 6 for black, e.g. a black rook is ROOK + 6
+PIECE_LETTERS = 'PNBRQKpnbrqk'
+PIECE_TYPE_LETTERS = 'PNBRQK'
+
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+CASTLING_LETTERS = ((WHITE_KINGSIDE, 'K'), (WHITE_QUEENSIDE, 'Q'), (BLACK_KINGSIDE, 'k'), (BLACK_QUEENSIDE, 'q'))
+
+# flags for moves that do more than move (and maybe capture with) one piece
+QUIET = 0
+DOUBLE_PUSH = 1
+CASTLE = 2
+EN_PASSANT = 3
+
+
+def encode_move(start, end, promotion=0, flag=QUIET):
+    """Makes a move int from its from square, to square, piece type promoted to (0 if none), and flag."""
+    return start | end << 6 | promotion << 12 | flag << 15
+
+
+def move_start(move):
+    return move & 63
+
+
+def move_end(move):
+    return move >> 6 & 63
+
+
+def move_promotion(move):
+    return move >> 12 & 7
+
+
+def move_flag(move):
+    return move >> 15
+
+
+def _castling_kept():
+    # the castling rights left after a move to or from each square
+    kept = [0b1111] * 64
+    kept[square('e1')] &= ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+    kept[square('h1')] &= ~WHITE_KINGSIDE
+    kept[square('a1')] &= ~WHITE_QUEENSIDE
+    kept[square('e8')] &= ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+    kept[square('h8')] &= ~BLACK_KINGSIDE
+    kept[square('a8')] &= ~BLACK_QUEENSIDE
+    return tuple(kept)
+
+
+CASTLING_KEPT = _castling_kept()
+
+
+def _zobrist_keys():
+    # random numbers for each thing that can be in a position, from a fixed
+    # seed so hashes are the same every run (and in opening books)
+    rng = random.Random(0x5EED)
+    pieces = tuple(tuple(rng.getrandbits(64) for _ in range(64)) for _ in range(12))
+    castling = tuple(rng.getrandbits(64) for _ in range(16))
+    en_passant = tuple(rng.getrandbits(64) for _ in range(8))
+    return pieces, castling, en_passant, rng.getrandbits(64)
+
+
+# Zobrist hashing: a position's hash is the XOR of the keys of every piece on
+# its square, the castling rights, the en passant file, and black to move
+ZOBRIST_PIECES, ZOBRIST_CASTLING, ZOBRIST_EN_PASSANT, ZOBRIST_BLACK = _zobrist_keys()
+
+# for each color: (castling right, squares that must be empty, squares the king passes that can't be attacked, king's from and to squares)
+CASTLES = (
+    (
+        (WHITE_KINGSIDE, 0x60, (square('f1'), square('g1')), square('e1'), square('g1')),
+        (WHITE_QUEENSIDE, 0x0E, (square('d1'), square('c1')), square('e1'), square('c1')),
+    ),
+    (
+        (BLACK_KINGSIDE, 0x60 << 56, (square('f8'), square('g8')), square('e8'), square('g8')),
+        (BLACK_QUEENSIDE, 0x0E << 56, (square('d8'), square('c8')), square('e8'), square('c8')),
+    ),
+)
+
+
+# @class Position: a chess board, made from and turned back into FEN
+class Position():
+    """A chess position: where every piece is, whose turn it is, and the
+    castling, en passant, and move clocks.
+
+    Each piece has a bitboard of its squares, and each square also has the
+    piece on it, so both "where are the knights" and "what is on e4" are
+    one lookup. make() and unmake() change the position in place, so
+    searching does not copy it.
+    """
+
+    __slots__ = (
+        'hash',
+        'bitboards',
+        'occupied',
+        'board',
+        'side',
+        'castling',
+        'en_passant',
+        'halfmove_clock',
+        'fullmove_number',
+        '_undo',
+    )
+
+    def __init__(self, fen=STARTING_FEN):
+        """Sets up a position.
+
+        Args:
+            fen (str): the position in Forsyth-Edwards Notation, e.g. game.fen
+        """
+        self.set_fen(fen)
+
+    def set_fen(self, fen):
+        """Replaces this position with one in Forsyth-Edwards Notation.
+
+        Raises:
+            ValueError: if the FEN can't be read
+        """
+        fields = fen.split()
+        if len(fields) < 4:
+            raise ValueError('FEN "{}" needs at least 4 fields'.format(fen))
+
+        self.bitboards = [0] * 12
+        self.occupied = [0, 0]
+        self.board = [EMPTY] * 64
+        self._undo = []
+
+        ranks = fields[0].split('/')
+        if len(ranks) != 8:
+            raise ValueError('FEN "{}" needs 8 ranks'.format(fen))
+        for row, pieces in enumerate(ranks):
+            rank = 7 - row
+            file = 0
+            for letter in pieces:
+                if letter.isdigit():
+                    file += int(letter)
+                    continue
+                if letter not in PIECE_LETTERS or file > 7:
+                    raise ValueError('FEN "{}" has a bad rank "{}"'.format(fen, pieces))
+                self._put(PIECE_LETTERS.index(letter), file + 8 * rank)
+                file += 1
+
+        if fields[1] not in ('w', 'b'):
+            raise ValueError('FEN "{}" has no side to move'.format(fen))
+        self.side = WHITE if fields[1] == 'w' else BLACK
+
+        self.castling = 0
+        for right, letter in CASTLING_LETTERS:
+            if letter in fields[2]:
+                self.castling |= right
+
+        self.en_passant = square(fields[3]) if fields[3] != '-' else EMPTY
+        self.halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        self.fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+
+        if self.bitboards[KING].bit_length() == 0 or self.bitboards[KING + 6].bit_length() == 0:
+            raise ValueError('FEN "{}" is missing a king'.format(fen))
+
+        self.hash = self.compute_hash()
+
+    def compute_hash(self):
+        """Computes this position's Zobrist hash from scratch, which make() and unmake() keep up to date in `hash`."""
+        key = ZOBRIST_CASTLING[self.castling]
+        for index, piece in enumerate(self.board):
+            if piece != EMPTY:
+                key ^= ZOBRIST_PIECES[piece][index]
+        if self.en_passant != EMPTY:
+            key ^= ZOBRIST_EN_PASSANT[self.en_passant & 7]
+        if self.side == BLACK:
+            key ^= ZOBRIST_BLACK
+        return key
+
+    def is_repetition(self):
+        """Checks if this position has happened before since the last capture or pawn move, counting moves made before a search."""
+        undo = self._undo
+        # only positions with the same side to move, and since the last irreversible move, can repeat
+        earliest = max(len(undo) - self.halfmove_clock, 0)
+        for entry in range(len(undo) - 2, earliest - 1, -2):
+            if undo[entry][5] == self.hash:
+                return True
+        return False
+
+    def fen(self):
+        """Gets this position in Forsyth-Edwards Notation.
+
+        Returns:
+            str: the FEN, in the same form as game.fen
+        """
+        rows = []
+        for rank in range(7, -1, -1):
+            row = ''
+            empty = 0
+            for file in range(8):
+                piece = self.board[file + 8 * rank]
+                if piece == EMPTY:
+                    empty += 1
+                    continue
+                if empty:
+                    row += str(empty)
+                    empty = 0
+                row += PIECE_LETTERS[piece]
+            rows.append(row + (str(empty) if empty else ''))
+
+        castling = ''.join(letter for right, letter in CASTLING_LETTERS if self.castling & right) or '-'
+        return '{} {} {} {} {} {}'.format(
+            '/'.join(rows),
+            'w' if self.side == WHITE else 'b',
+            castling,
+            square_name(self.en_passant) if self.en_passant != EMPTY else '-',
+            self.halfmove_clock,
+            self.fullmove_number
+        )
+
+    def copy(self):
+        """Gets a copy of this position, without its undo history."""
+        copied = Position.__new__(Position)
+        copied.hash = self.hash
+        copied.bitboards = list(self.bitboards)
+        copied.occupied = list(self.occupied)
+        copied.board = list(self.board)
+        copied.side = self.side
+        copied.castling = self.castling
+        copied.en_passant = self.en_passant
+        copied.halfmove_clock = self.halfmove_clock
+        copied.fullmove_number = self.fullmove_number
+        copied._undo = []
+        return copied
+
+    def __repr__(self):
+        return '<Position {}>'.format(self.fen())
+
+    def _put(self, piece, index):
+        bit = 1 << index
+        self.bitboards[piece] |= bit
+        self.occupied[piece >= 6] |= bit
+        self.board[index] = piece
+
+    # Attacks
+    def king_square(self, color):
+        """Gets the square a color's king is on."""
+        return self.bitboards[KING + 6 * color].bit_length() - 1
+
+    def attackers(self, index, color, occupied=None):
+        """Gets a bitboard of a color's pieces that attack a square.
+
+        Args:
+            index (int): the square
+            color (int): WHITE or BLACK
+            occupied (Optional[int]): the occupied squares, if not the ones on the board
+        """
+        bitboards = self.bitboards
+        if occupied is None:
+            occupied = self.occupied[0] | self.occupied[1]
+        offset = 6 * color
+        return (
+            (PAWN_ATTACKS[color ^ 1][index] & bitboards[PAWN + offset])
+            | (KNIGHT_ATTACKS[index] & bitboards[KNIGHT + offset])
+            | (KING_ATTACKS[index] & bitboards[KING + offset])
+            | (ROOK_TABLES[index][occupied & ROOK_MASKS[index]] & (bitboards[ROOK + offset] | bitboards[QUEEN + offset]))
+            | (BISHOP_TABLES[index][occupied & BISHOP_MASKS[index]] & (bitboards[BISHOP + offset] | bitboards[QUEEN + offset]))
+        )
+
+    def is_attacked(self, index, color, occupied=None):
+        """Checks if any of a color's pieces attack a square."""
+        return self.attackers(index, color, occupied) != 0
+
+    def in_check(self):
+        """Checks if the side to move is in check."""
+        return self.is_attacked(self.king_square(self.side), self.side ^ 1)
+
+    # Move generation
+    def legal_moves(self):
+        """Gets every legal move for the side to move.
+
+        Returns:
+            list[int]: the moves, in no particular order
+        """
+        us = self.side
+        them = us ^ 1
+        bitboards = self.bitboards
+        board = self.board
+        ours = self.occupied[us]
+        theirs = self.occupied[them]
+        occupied = ours | theirs
+        us_offset = 6 * us
+        them_offset = 6 * them
+        moves = []
+        append = moves.append
+
+        king = bitboards[KING + us_offset].bit_length() - 1
+        checkers = self.attackers(king, them, occupied)
+
+        # the king can't step onto an attacked square, including ones only its own body blocks
+        without_king = occupied ^ (1 << king)
+        for end in squares(KING_ATTACKS[king] & ~ours):
+            if not self.attackers(end, them, without_king):
+                append(king | end << 6)
+
+        if checkers & (checkers - 1):  # double check, so only the king can move
+            return moves
+
+        if checkers:
+            checker = checkers.bit_length() - 1
+            targets = checkers | BETWEEN[king][checker]
+        else:
+            targets = FULL
+
+        # pieces pinned to the king may only move along the pin
+        pinned = 0
+        pin_lines = {}
+        their_rooks = bitboards[ROOK + them_offset] | bitboards[QUEEN + them_offset]
+        their_bishops = bitboards[BISHOP + them_offset] | bitboards[QUEEN + them_offset]
+        snipers = (
+            (ROOK_TABLES[king][theirs & ROOK_MASKS[king]] & their_rooks)
+            | (BISHOP_TABLES[king][theirs & BISHOP_MASKS[king]] & their_bishops)
+        )
+        for sniper in squares(snipers):
+            blockers = BETWEEN[king][sniper] & occupied
+            if blockers and not blockers & (blockers - 1) and blockers & ours:
+                pinned |= blockers
+                pin_lines[blockers.bit_length() - 1] = LINE[king][sniper]
+
+        not_ours = ~ours & targets
+        for start in squares(bitboards[KNIGHT + us_offset] & ~pinned):  # a pinned knight can never move
+            for end in squares(KNIGHT_ATTACKS[start] & not_ours):
+                append(start | end << 6)
+
+        for start in squares(bitboards[BISHOP + us_offset] | bitboards[QUEEN + us_offset]):
+            attacks = BISHOP_TABLES[start][occupied & BISHOP_MASKS[start]] & not_ours
+            if pinned >> start & 1:
+                attacks &= pin_lines[start]
+            for end in squares(attacks):
+                append(start | end << 6)
+
+        for start in squares(bitboards[ROOK + us_offset] | bitboards[QUEEN + us_offset]):
+            attacks = ROOK_TABLES[start][occupied & ROOK_MASKS[start]] & not_ours
+            if pinned >> start & 1:
+                attacks &= pin_lines[start]
+            for end in squares(attacks):
+                append(start | end << 6)
+
+        self._pawn_moves(moves, us, king, occupied, theirs, targets, pinned, pin_lines)
+
+        if not checkers and self.castling:
+            for right, between, passed, start, end in CASTLES[us]:
+                if self.castling & right and not occupied & between and not any(
+                    self.attackers(index, them, occupied) for index in passed
+                ):
+                    append(start | end << 6 | CASTLE << 15)
+
+        return moves
+
+    def _pawn_moves(self, moves, us, king, occupied, theirs, targets, pinned, pin_lines):
+        append = moves.append
+        pawns = self.bitboards[PAWN + 6 * us]
+        forward = 8 if us == WHITE else -8
+        start_rank = 1 if us == WHITE else 6
+        last_rank = RANK_8 if us == WHITE else RANK_1
+        attacks = PAWN_ATTACKS[us]
+        en_passant = self.en_passant
+
+        for start in squares(pawns):
+            allowed = targets
+            if pinned >> start & 1:
+                allowed &= pin_lines[start]
+
+            ends = []
+            end = start + forward
+            if not occupied >> end & 1:
+                ends.append(end)
+                if start >> 3 == start_rank:
+                    double = end + forward
+                    if not occupied >> double & 1 and allowed >> double & 1:
+                        append(start | double << 6 | DOUBLE_PUSH << 15)
+            ends.extend(squares(attacks[start] & theirs))
+
+            for end in ends:
+                if not allowed >> end & 1:
+                    continue
+                if last_rank >> end & 1:
+                    for promotion in (QUEEN, KNIGHT, ROOK, BISHOP):
+                        append(start | end << 6 | promotion << 12)
+                else:
+                    append(start | end << 6)
+
+            if en_passant != EMPTY and attacks[start] >> en_passant & 1:
+                captured = en_passant - forward
+                # checked by playing it out, as it removes two pieces from the same rank
+                after = occupied ^ (1 << start) ^ (1 << captured) | (1 << en_passant)
+                if not self.attackers(king, us ^ 1, after) & ~(1 << captured):
+                    append(start | en_passant << 6 | EN_PASSANT << 15)
+
+    # Making moves
+    def make(self, move):
+        """Plays a legal move on this position, which unmake() takes back."""
+        start = move & 63
+        end = move >> 6 & 63
+        flag = move >> 15
+        bitboards = self.bitboards
+        occupied = self.occupied
+        board = self.board
+        us = self.side
+        them = us ^ 1
+
+        piece = board[start]
+        if flag == EN_PASSANT:
+            captured_at = end - 8 if us == WHITE else end + 8
+        else:
+            captured_at = end
+        captured = board[captured_at]
+
+        self._undo.append((move, captured, self.castling, self.en_passant, self.halfmove_clock, self.hash))
+        key = self.hash ^ ZOBRIST_BLACK ^ ZOBRIST_CASTLING[self.castling]
+        if self.en_passant != EMPTY:
+            key ^= ZOBRIST_EN_PASSANT[self.en_passant & 7]
+
+        start_bit = 1 << start
+        end_bit = 1 << end
+        if captured != EMPTY:
+            captured_bit = 1 << captured_at
+            bitboards[captured] ^= captured_bit
+            occupied[them] ^= captured_bit
+            board[captured_at] = EMPTY
+            key ^= ZOBRIST_PIECES[captured][captured_at]
+
+        key ^= ZOBRIST_PIECES[piece][start]
+        bitboards[piece] ^= start_bit
+        occupied[us] ^= start_bit | end_bit
+        board[start] = EMPTY
+        promotion = move >> 12 & 7
+        if promotion:
+            piece = promotion + 6 * us
+        bitboards[piece] |= end_bit
+        board[end] = piece
+        key ^= ZOBRIST_PIECES[piece][end]
+
+        if flag == CASTLE:
+            rook = ROOK + 6 * us
+            if end > start:
+                rook_start, rook_end = start + 3, start + 1
+            else:
+                rook_start, rook_end = start - 4, start - 1
+            rook_bits = (1 << rook_start) | (1 << rook_end)
+            bitboards[rook] ^= rook_bits
+            occupied[us] ^= rook_bits
+            board[rook_start] = EMPTY
+            board[rook_end] = rook
+            key ^= ZOBRIST_PIECES[rook][rook_start] ^ ZOBRIST_PIECES[rook][rook_end]
+
+        self.castling &= CASTLING_KEPT[start] & CASTLING_KEPT[end]
+        key ^= ZOBRIST_CASTLING[self.castling]
+        if flag == DOUBLE_PUSH:
+            self.en_passant = (start + end) >> 1
+            key ^= ZOBRIST_EN_PASSANT[start & 7]
+        else:
+            self.en_passant = EMPTY
+        self.hash = key
+        if captured != EMPTY or piece % 6 == PAWN or promotion:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if us == BLACK:
+            self.fullmove_number += 1
+        self.side = them
+
+    def unmake(self):
+        """Takes back the last move made."""
+        move, captured, self.castling, self.en_passant, self.halfmove_clock, self.hash = self._undo.pop()
+        start = move & 63
+        end = move >> 6 & 63
+        flag = move >> 15
+        bitboards = self.bitboards
+        occupied = self.occupied
+        board = self.board
+        them = self.side
+        us = them ^ 1
+        self.side = us
+        if us == BLACK:
+            self.fullmove_number -= 1
+
+        piece = board[end]
+        start_bit = 1 << start
+        end_bit = 1 << end
+        bitboards[piece] ^= end_bit
+        occupied[us] ^= start_bit | end_bit
+        board[end] = EMPTY
+        if move >> 12 & 7:
+            piece = PAWN + 6 * us
+        bitboards[piece] |= start_bit
+        board[start] = piece
+
+        if captured != EMPTY:
+            captured_at = (end - 8 if us == WHITE else end + 8) if flag == EN_PASSANT else end
+            captured_bit = 1 << captured_at
+            bitboards[captured] |= captured_bit
+            occupied[them] |= captured_bit
+            board[captured_at] = captured
+
+        if flag == CASTLE:
+            rook = ROOK + 6 * us
+            if end > start:
+                rook_start, rook_end = start + 3, start + 1
+            else:
+                rook_start, rook_end = start - 4, start - 1
+            rook_bits = (1 << rook_start) | (1 << rook_end)
+            bitboards[rook] ^= rook_bits
+            occupied[us] ^= rook_bits
+            board[rook_end] = EMPTY
+            board[rook_start] = rook
+
+    # Notation
+    def uci(self, move):
+        """Gets a move in UCI long algebraic notation, e.g. "e2e4" or "e7e8q"."""
+        promotion = move >> 12 & 7
+        return square_name(move & 63) + square_name(move >> 6 & 63) + (
+            PIECE_LETTERS[promotion + 6] if promotion else '')
+
+    def san(self, move, legal_moves=None):
+        """Gets a legal move in Standard Algebraic Notation, which is what make_move() returns to the server, e.g. "Nbd7", "exd6", "e8=Q+", or "O-O".
+
+        Args:
+            move (int): a legal move in this position
+            legal_moves (Optional[list[int]]): every legal move, if already generated
+        """
+        san = self._san_body(move, legal_moves)
+        self.make(move)
+        if self.in_check():
+            san += '+' if self.legal_moves() else '#'
+        self.unmake()
+        return san
+
+    def _san_body(self, move, legal_moves=None):
+        start = move & 63
+        end = move >> 6 & 63
+        flag = move >> 15
+        if flag == CASTLE:
+            return 'O-O' if end > start else 'O-O-O'
+
+        piece = self.board[start]
+        piece_type = piece % 6
+        capture = self.board[end] != EMPTY or flag == EN_PASSANT
+        promotion = move >> 12 & 7
+
+        if piece_type == PAWN:
+            san = (FILES[start & 7] + 'x' if capture else '') + square_name(end)
+            if promotion:
+                san += '=' + PIECE_TYPE_LETTERS[promotion]
+            return san
+
+        # name the from file, rank, or both only if another piece of the same type can also move there
+        if legal_moves is None:
+            legal_moves = self.legal_moves()
+        rivals = [
+            other & 63 for other in legal_moves
+            if other >> 6 & 63 == end and other & 63 != start and self.board[other & 63] == piece
+        ]
+        disambiguation = ''
+        if rivals:
+            if all(rival & 7 != start & 7 for rival in rivals):
+                disambiguation = FILES[start & 7]
+            elif all(rival >> 3 != start >> 3 for rival in rivals):
+                disambiguation = RANKS[start >> 3]
+            else:
+                disambiguation = square_name(start)
+
+        return PIECE_TYPE_LETTERS[piece_type] + disambiguation + ('x' if capture else '') + square_name(end)
+
+    def parse_san(self, san):
+        """Gets the legal move written in Standard Algebraic Notation, e.g. an entry of game.history.
+
+        Raises:
+            ValueError: if it isn't a legal move here
+        """
+        wanted = san.rstrip('+#!?').replace('0-0-0', 'O-O-O').replace('0-0', 'O-O')
+        legal_moves = self.legal_moves()
+        # only write out the moves to the square named, which ends every SAN but castling
+        end = wanted.split('=')[0][-2:] if not wanted.startswith('O-O') else None
+        for move in legal_moves:
+            if end is not None and square_name(move >> 6 & 63) != end:
+                continue
+            if self._san_body(move, legal_moves) == wanted:
+                return move
+        raise ValueError('"{}" is not a legal move in {}'.format(san, self.fen()))
+
+    def parse_uci(self, uci):
+        """Gets the legal move written in UCI long algebraic notation, e.g. "e2e4".
+
+        Raises:
+            ValueError: if it isn't a legal move here
+        """
+        for move in self.legal_moves():
+            if self.uci(move) == uci.lower():
+                return move
+        raise ValueError('"{}" is not a legal move in {}'.format(uci, self.fen()))
+
+    # Perft
+    def perft(self, depth):
+        """Counts the leaf nodes of the move tree to a depth, to check the move generator against known counts."""
+        moves = self.legal_moves()
+        if depth <= 1:
+            return len(moves) if depth == 1 else 1
+
+        nodes = 0
+        for move in moves:
+            self.make(move)
+            nodes += self.perft(depth - 1)
+            self.unmake()
+        return nodes
+
+    def divide(self, depth):
+        """Gets the perft count under each legal move, by its UCI, for finding which move a generator gets wrong."""
+        counts = {}
+        for move in self.legal_moves():
+            self.make(move)
+            counts[self.uci(move)] = self.perft(depth - 1)
+            self.unmake()
+        return counts
@@ -0,0 +1,463 @@
+# Search: picks a move for a Position by iterative deepening alpha-beta, so
+# it always has a best move ready and can stop as soon as time is up.
+#
+# Positions it has searched are kept in a fixed size transposition table,
+# keyed by Zobrist hash, which both cuts off transpositions and gives the
+# best move found so far to search first on the next, deeper iteration.
+import time
+from array import array
+from games.chess.engine.bitboards import squares
+from games.chess.engine.position import WHITE, PAWN, EMPTY, EN_PASSANT
+
+MATE = 100000
+MATE_BOUND = MATE - 1000  # scores past this are mates, counted in plies
+INFINITY = MATE + 1
+
+# centipawn values of each piece type, used to score material and order captures
+PIECE_VALUES = (100, 320, 330, 500, 900, 20000)
+
+# Piece-square tables, from the Chess Programming Wiki's simplified evaluation
+# function: a bonus for each piece type on each square from white's side of
+# the board, with rank 8 first
+_PIECE_SQUARE_TABLES = (
+    (  # pawn
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ),
+    (  # knight
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ),
+    (  # bishop
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ),
+    (  # rook
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ),
+    (  # queen
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ),
+    (  # king, in the middlegame
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ),
+)
+
+
+def _piece_square_values():
+    # the value of each piece (white positive, black negative) on each square, material included
+    values = []
+    for color in (WHITE, 1 - WHITE):
+        for piece_type, table in enumerate(_PIECE_SQUARE_TABLES):
+            row = []
+            for index in range(64):
+                file, rank = index & 7, index >> 3
+                bonus = table[(7 - rank) * 8 + file] if color == WHITE else table[rank * 8 + file]
+                value = PIECE_VALUES[piece_type] + bonus
+                row.append(value if color == WHITE else -value)
+            values.append(tuple(row))
+    return tuple(values)
+
+
+PIECE_SQUARE_VALUES = _piece_square_values()
+
+
+def evaluate(position):
+    """Scores a position in centipawns for the side to move, by material and piece placement."""
+    score = 0
+    for piece, bitboard in enumerate(position.bitboards):
+        values = PIECE_SQUARE_VALUES[piece]
+        for index in squares(bitboard):
+            score += values[index]
+    return score if position.side == WHITE else -score
+
+
+# transposition table entry bounds
+EXACT = 0
+LOWER = 1  # the score is at least this (a beta cutoff)
+UPPER = 2  # the score is at most this (no move raised alpha)
+
+_SCORE_OFFSET = 1 << 20
+
+
+# @class TranspositionTable: a fixed size hash table of searched positions
+class TranspositionTable():
+    """Positions already searched, by Zobrist hash, in two flat arrays.
+
+    Each entry is the full hash, to check a slot holds the position asked
+    for, and one int packing the best move, depth searched, bound, search
+    age, and score. When two positions want the same slot the deeper search
+    is kept, unless the stored one is from an older search.
+    """
+
+    def __init__(self, size=1 << 18):
+        """Allocates the table.
+
+        Args:
+            size (int): how many entries to hold, rounded down to a power of 2, 16 bytes each
+        """
+        size = 1 << (max(size, 1).bit_length() - 1)
+        self._mask = size - 1
+        self._keys = array('Q', bytes(8 * size))
+        self._entries = array('q', bytes(8 * size))
+        self.age = 0
+
+    def __len__(self):
+        return self._mask + 1
+
+    def new_search(self):
+        """Marks entries stored from now on as newer than every existing one."""
+        self.age = (self.age + 1) & 63
+
+    def clear(self):
+        size = len(self)
+        self._keys = array('Q', bytes(8 * size))
+        self._entries = array('q', bytes(8 * size))
+
+    def get(self, key):
+        """Gets what was stored for a position.
+
+        Returns:
+            Optional[tuple]: (move, depth, bound, score), or None if it isn't stored
+        """
+        slot = key & self._mask
+        if self._keys[slot] != key:
+            return None
+        entry = self._entries[slot]
+        return entry & 0x1FFFF, entry >> 17 & 127, entry >> 24 & 3, (entry >> 32) - _SCORE_OFFSET
+
+    def put(self, key, move, depth, bound, score):
+        """Stores a position's search result, if it is worth more than what is in its slot."""
+        slot = key & self._mask
+        stored = self._entries[slot]
+        if self._keys[slot] != key and stored >> 17 & 127 > depth and stored >> 26 & 63 == self.age:
+            return  # keep the deeper entry from this search
+        if not move and self._keys[slot] == key:
+            move = stored & 0x1FFFF  # keep the best move we already knew
+        self._keys[slot] = key
+        self._entries[slot] = move | depth << 17 | bound << 24 | self.age << 26 | (score + _SCORE_OFFSET) << 32
+
+
+class _Timeout(Exception):
+    pass
+
+
+# @class SearchResult: what a search found
+class SearchResult():
+    """The best move a search found, and how hard it looked."""
+
+    def __init__(self, move, score, depth, nodes, seconds, pv):
+        self.move = move
+        self.score = score
+        self.depth = depth  # the deepest iteration that finished
+        self.nodes = nodes
+        self.seconds = seconds
+        self.pv = pv  # the moves both sides are expected to play, starting with move
+
+    def __repr__(self):
+        return '<SearchResult move {} score {} depth {} nodes {}>'.format(
+            self.move, self.score, self.depth, self.nodes)
+
+
+# @class Searcher: iterative deepening alpha-beta search, keeping its tables between moves
+class Searcher():
+    """Searches a position one ply deeper at a time until out of time.
+
+    Moves are tried best first: the transposition table's move, then captures
+    by most valuable victim and least valuable attacker, then the killer
+    moves that caused cutoffs at the same ply, then by history. Captures are
+    searched past the depth limit (quiescence) so a position is never scored
+    in the middle of an exchange.
+    """
+
+    def __init__(self, table_size=1 << 18, quiescence=True, check_extensions=True):
+        """Makes a searcher.
+
+        Args:
+            table_size (int): transposition table entries
+            quiescence (bool): if captures are searched past the depth limit
+            check_extensions (bool): if moves out of check are searched a ply deeper
+        """
+        self.table = TranspositionTable(table_size)
+        self.quiescence = quiescence
+        self.check_extensions = check_extensions
+        self.nodes = 0
+        self.stopped = False  # set from another thread to end a running search early, until set back
+        self._deadline = None
+        self._killers = []
+        self._history = [[0] * 64 for _ in range(12)]
+
+    def search(self, position, deadline=None, max_depth=64, on_iteration=None):
+        """Finds the best move in a position.
+
+        Args:
+            position (Position): the position to search, which is left as it was
+            deadline (Optional[float]): the time.perf_counter() time to stop by, e.g. AI.budget.deadline
+            max_depth (int): the deepest iteration to search
+            on_iteration (Optional[function]): called with the SearchResult of each iteration that finishes
+        Returns:
+            Optional[SearchResult]: the result of the deepest finished iteration, or None if there are no legal moves
+        """
+        legal_moves = position.legal_moves()
+        if not legal_moves:
+            return None
+
+        start = time.perf_counter()
+        self.nodes = 0
+        self._deadline = deadline
+        self._killers = [[0, 0] for _ in range(max_depth + 64)]
+        for row in self._history:
+            for index in range(64):
+                row[index] >>= 3  # keep some of what was learned last move
+        self.table.new_search()
+
+        result = SearchResult(legal_moves[0], 0, 0, 0, 0, [legal_moves[0]])
+        undo_length = len(position._undo)
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self._negamax(position, depth, -INFINITY, INFINITY, 0)
+            except _Timeout:
+                while len(position._undo) > undo_length:
+                    position.unmake()
+                break
+
+            pv = self._principal_variation(position, depth)
+            if pv:
+                result = SearchResult(pv[0], score, depth, self.nodes, time.perf_counter() - start, pv)
+                if on_iteration is not None:
+                    on_iteration(result)
+            if abs(score) >= MATE_BOUND or len(legal_moves) == 1:
+                break  # nothing more to find
+            if self.stopped or (self._deadline is not None and time.perf_counter() >= self._deadline):
+                break
+
+        # the deepest finished iteration's move, with the work done by every iteration
+        return SearchResult(result.move, result.score, result.depth, self.nodes, time.perf_counter() - start, result.pv)
+
+    def set_deadline(self, deadline):
+        """Changes when a search running in another thread stops, e.g. once a ponder search becomes the real one."""
+        self._deadline = deadline
+
+    def _check_time(self):
+        if self.stopped or (self._deadline is not None and time.perf_counter() >= self._deadline):
+            raise _Timeout()
+
+    def _principal_variation(self, position, depth):
+        # follow the best moves stored in the table
+        pv = []
+        for _ in range(depth):
+            entry = self.table.get(position.hash)
+            if entry is None or not entry[0] or entry[0] not in position.legal_moves():
+                break
+            pv.append(entry[0])
+            position.make(entry[0])
+        for _ in pv:
+            position.unmake()
+        return pv
+
+    def _order(self, position, moves, best_move, ply):
+        board = position.board
+        killers = self._killers[ply]
+        history = self._history
+        keys = {}
+        for move in moves:
+            if move == best_move:
+                keys[move] = 1 << 30
+                continue
+            victim = board[move >> 6 & 63]
+            promotion = move >> 12 & 7
+            if victim != EMPTY or promotion or move >> 15 == EN_PASSANT:
+                victim_value = PIECE_VALUES[victim % 6] if victim != EMPTY else PIECE_VALUES[PAWN]
+                keys[move] = (1 << 24) + victim_value * 16 - board[move & 63] % 6 + (PIECE_VALUES[promotion] if promotion else 0)
+            elif move == killers[0]:
+                keys[move] = 1 << 23
+            elif move == killers[1]:
+                keys[move] = (1 << 23) - 1
+            else:
+                keys[move] = history[board[move & 63]][move >> 6 & 63]
+        moves.sort(key=keys.__getitem__, reverse=True)
+        return moves
+
+    def _negamax(self, position, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check_time()
+
+        if ply and (position.halfmove_clock >= 100 or position.is_repetition()):
+            return 0
+
+        in_check = position.in_check()
+        if in_check and self.check_extensions:
+            depth += 1  # don't let a check push a threat past the horizon
+
+        if depth <= 0:
+            return self._quiescence(position, alpha, beta, ply) if self.quiescence else evaluate(position)
+
+        original_alpha = alpha
+        best_move = 0
+        entry = self.table.get(position.hash)
+        if entry is not None:
+            best_move, stored_depth, bound, score = entry
+            if ply and stored_depth >= depth:
+                if score >= MATE_BOUND:
+                    score -= ply
+                elif score <= -MATE_BOUND:
+                    score += ply
+                if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+                    return score
+
+        moves = position.legal_moves()
+        if not moves:
+            return -MATE + ply if in_check else 0
+
+        board = position.board
+        best_score = -INFINITY
+        first = True
+        for move in self._order(position, moves, best_move, ply):
+            position.make(move)
+            if first:
+                score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            else:
+                # principal variation search: prove the move is no better with a null window first
+                score = -self._negamax(position, depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            position.unmake()
+            first = False
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if board[move >> 6 & 63] == EMPTY and not move >> 12 & 7:
+                            killers = self._killers[ply]
+                            if killers[0] != move:
+                                killers[1] = killers[0]
+                                killers[0] = move
+                            self._history[board[move & 63]][move >> 6 & 63] += depth * depth
+                        break
+
+        if best_score >= beta:
+            bound = LOWER
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+        stored = best_score
+        if stored >= MATE_BOUND:
+            stored += ply  # mates are stored as plies from this position, not from the root
+        elif stored <= -MATE_BOUND:
+            stored -= ply
+        self.table.put(position.hash, best_move, depth, bound, stored)
+        return best_score
+
+    def _quiescence(self, position, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check_time()
+
+        in_check = position.in_check()
+        if not in_check:
+            stand_pat = evaluate(position)
+            if stand_pat >= beta:
+                return stand_pat
+            if stand_pat > alpha:
+                alpha = stand_pat
+
+        moves = position.legal_moves()
+        if not moves:
+            return -MATE + ply if in_check else 0
+
+        board = position.board
+        if not in_check:  # only captures and promotions, everything else is assumed no better than standing pat
+            moves = [
+                move for move in moves
+                if board[move >> 6 & 63] != EMPTY or move >> 12 & 7 or move >> 15 == EN_PASSANT
+            ]
+
+        best_score = alpha if not in_check else -INFINITY
+        for move in self._order(position, moves, 0, ply):
+            position.make(move)
+            score = -self._quiescence(position, -beta, -alpha, ply + 1)
+            position.unmake()
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
+
+
+def minimax(position, depth):
+    """A plain negamax search with no pruning, tables, or quiescence, as a
+    baseline to compare Searcher against. A Searcher without quiescence or
+    check extensions finds the same score to the same depth.
+
+    Returns:
+        tuple: (best score for the side to move, best move, nodes searched)
+    """
+    nodes = [0]
+
+    def negamax(depth, ply):
+        nodes[0] += 1
+        if ply and (position.halfmove_clock >= 100 or position.is_repetition()):
+            return 0, 0
+        if depth <= 0:
+            return evaluate(position), 0
+        moves = position.legal_moves()
+        if not moves:
+            return (-MATE + ply if position.in_check() else 0), 0
+
+        best_score, best_move = -INFINITY, 0
+        for move in moves:
+            position.make(move)
+            score = -negamax(depth - 1, ply + 1)[0]
+            position.unmake()
+            if score > best_score:
+                best_score, best_move = score, move
+        return best_score, best_move
+
+    score, move = negamax(depth, 0)
+    return score, move, nodes[0]
@@ -0,0 +1,64 @@
+# Sync: keeps one Position in step with the game from turn to turn, by
+# playing the moves appended to game.history since the last turn rather than
+# reparsing game.fen. The position then remembers every move of the game, so
+# the search can see repetitions, and its hashes match the positions already
+# in the searcher's transposition table.
+from games.chess.engine.position import Position, STARTING_FEN
+
+# the FEN fields that must match game.fen: pieces, side to move, and castling.
+# Servers differ on when they write an en passant square, and the clocks don't
+# change which moves are legal
+_COMPARED_FIELDS = 3
+
+
+def same_position(fen, other):
+    """Checks if two FENs have the same pieces, side to move, and castling rights."""
+    return fen.split()[:_COMPARED_FIELDS] == other.split()[:_COMPARED_FIELDS]
+
+
+# @class GameSync: a Position that follows game.history
+class GameSync():
+    """A Position kept up to date with the game's history and FEN.
+
+    Each update() plays only the moves added to the history since the last
+    one, then checks the result against the FEN. If the moves can't be
+    played or the result differs, the position is reparsed from the FEN, and
+    the moves before it are forgotten.
+    """
+
+    def __init__(self):
+        self.position = None
+        self.synced = 0  # how many moves of the history the position has played
+        self.reparses = 0  # how many times the history couldn't be followed
+
+    def update(self, history, fen):
+        """Brings the position up to date with the game.
+
+        Args:
+            history (list[str]): every move of the game in SAN, e.g. game.history
+            fen (str): the current position, e.g. game.fen
+        Returns:
+            Position: the current position, with every move since the last reparse made on it
+        """
+        position = self.position
+        if position is None:
+            # if the game started from the usual position, the whole history can be kept
+            position = Position(STARTING_FEN)
+            self.synced = 0
+
+        if len(history) >= self.synced:
+            try:
+                for san in history[self.synced:]:
+                    position.make(position.parse_san(san))
+                    self.synced += 1
+            except ValueError:
+                position = None
+
+        if position is None or not same_position(position.fen(), fen):
+            if self.position is not None:
+                self.reparses += 1
+            position = Position(fen)
+            self.synced = len(history)
+
+        self.position = position
+        return position
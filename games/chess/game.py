@@ -20,6 +20,31 @@ class Game(BaseGame):
     The traditional 8x8 chess board with pieces.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_fen',
+        '_game_objects',
+        '_history',
+        '_players',
+        '_session',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'fen': 'str',
+        'game_objects': 'dict[str, games.chess.game_object.GameObject]',
+        'history': 'list[str]',
+        'players': 'list[games.chess.player.Player]',
+        'session': 'str',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -1,6 +1,7 @@
 # This is where you build your AI for the Necrowar game.
 
 from joueur.base_ai import BaseAI
+import joueur.pathfinding
 from .util.logger import Logger, LoggerTypes
 from .controllers.central_command import BaseController
 from .controllers.chris_controller import ChrisController
@@ -84,7 +85,7 @@ class AI(BaseAI):
             or lost.
         """
         # <<-- Creer-Merge: end -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
-        # replace with your end logic
+        Logger.stop() # the client exits right after this, so write out any queued log records now
         # <<-- /Creer-Merge: end -->>
     def run_turn(self):
         """ This is called every time it is this AI.player's turn.
@@ -97,8 +98,8 @@ class AI(BaseAI):
         return True
 
     def find_path(self, start, goal):
-        """A very basic path finding algorithm (Breadth First Search) that when
-            given a starting Tile, will return a valid path to the goal Tile.
+        """Finds a shortest path (Breadth First Search) from the starting
+            Tile to the goal Tile, only going through Tiles that are pathable.
 
         Args:
             start (games.necrowar.tile.Tile): the starting Tile
@@ -109,54 +110,9 @@ class AI(BaseAI):
             Tile to the start, and the last element being the goal.
         """
 
-        if start == goal:
-            # no need to make a path to here...
-            return []
-
-        # queue of the tiles that will have their neighbors searched for 'goal'
-        fringe = []
-
-        # How we got to each tile that went into the fringe.
-        came_from = {}
-
-        # Enqueue start as the first tile to have its neighbors searched.
-        fringe.append(start)
-
-        # keep exploring neighbors of neighbors... until there are no more.
-        while len(fringe) > 0:
-            # the tile we are currently exploring.
-            inspect = fringe.pop(0)
-
-            # cycle through the tile's neighbors.
-            for neighbor in inspect.get_neighbors():
-                # if we found the goal, we have the path!
-                if neighbor == goal:
-                    # Follow the path backward to the start from the goal and
-                    # # return it.
-                    path = [goal]
-
-                    # Starting at the tile we are currently at, insert them
-                    # retracing our steps till we get to the starting tile
-                    while inspect != start:
-                        path.insert(0, inspect)
-                        inspect = came_from[inspect.id]
-                    return path
-                # else we did not find the goal, so enqueue this tile's
-                # neighbors to be inspected
-
-                # if the tile exists, has not been explored or added to the
-                # fringe yet, and it is pathable
-                if neighbor and neighbor.id not in came_from and (
-                    neighbor.is_pathable()
-                ):
-                    # add it to the tiles to be explored and add where it came
-                    # from for path reconstruction.
-                    fringe.append(neighbor)
-                    came_from[neighbor.id] = inspect
-
-        # if you're here, that means that there was not a path to get to where
-        # you want to go; in that case, we'll just return an empty path.
-        return []
+        # joueur.pathfinding also has A* and bidirectional search, and
+        # SearchTree to find many paths from the same start
+        return joueur.pathfinding.find_path(self.game, start, goal, lambda tile: tile.is_pathable())
 
     # <<-- Creer-Merge: functions -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
     # if you need additional functions for your AI you can add them here
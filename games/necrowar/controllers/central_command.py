@@ -1,8 +1,12 @@
 import logging
-import heapq
 import numpy as np
 from enum import Enum, auto
 from collections import defaultdict
+import joueur.client
+from joueur.grid import NO_ID
+from joueur.pathfinding import AStar
+from .distance_fields import DistanceFields
+from .targeting import TowerTargeting, lowest_health
 from ..game import Game
 from ..tile import Tile
 from ..player import Player
@@ -33,6 +37,13 @@ class UnitTypes(Enum):
         
         return mapping.get(self.value)
 
+# the tile attribute counting how many of a type of unit are stacked on it, other types only fit one per tile
+STACKED_COUNTS = {
+    UnitTypes.GHOUL: 'num_ghouls',
+    UnitTypes.HOUND: 'num_hounds',
+    UnitTypes.ZOMBIE: 'num_zombies'
+}
+
 class BaseController():
     def __init__(self, logger: logging.Logger, game: Game, player: Player):
         self._logger = logger
@@ -61,6 +72,11 @@ class BaseController():
             'aoe': 'aoe'
         }
         self._enemy_castle = None
+        self._castle = None
+        self._target_priority = lowest_health
+        self._passability = {}
+        self._pathfinder = None
+        self._distance_fields = None
         self.miners = []
         self.fishers = []
         self.builders = []
@@ -78,16 +94,34 @@ class BaseController():
                 self._gold_mine_coordinates.append([tile.x, tile.y])
             if self.is_enemy_castle(tile):
                 self._enemy_castle = tile
+            elif tile.is_castle and tile.owner == self.player:
+                self._castle = tile
     
         self._gold_mine_coordinates = np.asarray(self._gold_mine_coordinates)
     
-    def towers_attack(self):
-        for tower in self.player.towers:
-            for unit in self.player.opponent.units:
-                a = abs(tower.tile.x - unit.tile.x)
-                b = abs(tower.tile.y - unit.tile.y)
-                if a + b <= tower.job.range or unit.tile in tower.tile.get_neighbors():
-                    tower.attack(unit.tile)
+    def towers_attack(self, priority=None):
+        """Has every tower that hasn't attacked yet this turn shoot one enemy unit in range, picked by priority (the lowest health by default).
+
+        No attack needs another's result, so they are pipelined: sent to the
+        server together rather than waiting on each in turn. Each tower's
+        damage is counted against its target as it shoots, so later towers
+        don't waste their shots on units the earlier ones have killed.
+        """
+        targeting = TowerTargeting(self.player.opponent.units, self._castle, priority or self._target_priority)
+
+        with joueur.client.pipeline():
+            for tower in self.player.towers:
+                if tower.attacked or tower.tile is None:
+                    continue
+
+                target = targeting.target_for(tower)
+                if target is not None:
+                    tower.attack(target.tile)
+                    targeting.hit(target, tower.job.damage)
+
+    def set_target_priority(self, priority):
+        """Replaces how towers pick who to shoot, e.g. targeting.closest_to_castle. priority takes a unit and a TowerTargeting, and the lowest is shot first."""
+        self._target_priority = priority
     
     def select_random_tower_type(self):
         choice = random.choice(list(self._tower_types))
@@ -184,15 +218,14 @@ class BaseController():
                 self.move_unit(worker, self.find_nearest_shore(worker))
 
     def get_unoccupied_gold_mine_coordinates(self):
-        coords = []
-        indices = []
+        if not self._gold_mines:
+            return [], np.asarray([])
 
-        for i, gold_mine in enumerate(self._gold_mines):
-            if gold_mine.unit is None:
-                coords.append([gold_mine.x, gold_mine.y])
-                indices.append(i)
+        # look up every gold mine's unit at once in the grid instead of looping over the tiles
+        units = self.game.grid.unit[self._gold_mine_coordinates[:, 1], self._gold_mine_coordinates[:, 0]]
+        indices = np.flatnonzero(units == NO_ID)
 
-        return indices, np.asarray(coords)
+        return indices, self._gold_mine_coordinates[indices]
     
     def spawn_miner(self):
         if self.can_afford_unit(self._jobs_by_title[str(UnitTypes.WORKER)]):
@@ -216,7 +249,7 @@ class BaseController():
                 worker.mine(worker.tile)
 
             elif worker.tile.is_gold_mine == False and worker.tile.is_island_gold_mine == False:
-                self.move_unit(worker, self.get_closest_gold_mine(worker))
+                self.move_unit_along(worker, 'gold')
             
         for dead_miner in dead_miners:
             self.miners.remove(dead_miner)
@@ -234,23 +267,6 @@ class BaseController():
                 units.append(unit)
         return units
 
-    def get_closest_gold_mine(self, unit):
-        tile = self.get_tile_from(unit)
-
-        if self.is_gold_mine(tile) or tile is None:
-            return tile if tile is not None else unit.tile
-        
-        coords = np.array([[tile.x, tile.y]])
-        indices, gold_mine_coordinates = self.get_unoccupied_gold_mine_coordinates()
-
-        if len(gold_mine_coordinates):
-            dist = self.distance_vectorized(coords, gold_mine_coordinates)
-        else:
-            dist = self.distance_vectorized(coords, self._gold_mine_coordinates)
-            return self._gold_mines[np.argmin(dist)]
-        
-        return self._gold_mines[indices[np.argmin(dist)]]
-    
     def can_afford_unit(self, job):
         output = False
         if self.player.gold >= job.gold_cost and self.player.mana >= job.mana_cost:
@@ -328,99 +344,111 @@ class BaseController():
         
         return None
 
-    def move_cost(self, start, goal):
-        return 1
-
     def distance_vectorized(self, start_coords, goal_coords):
         return np.sum(np.abs(start_coords - goal_coords), axis=1)
 
     def distance(self, start, goal):
         return np.abs(start.x-goal.x) + np.abs(start.y-goal.y)
 
-    def _reconstruct_path(self, current_tile, came_from, start):
-        path = [current_tile]
-
-        while current_tile in came_from:
-            current_tile = came_from[current_tile]
-
-            if current_tile != start:
-                path.insert(0, current_tile)
-    
-        return path
-
     def get_unit_type(self, unit: Unit):
         return self._unit_types[unit.job.title]
 
     def can_move_unit_to(self, tile: Tile, unit_type: UnitTypes):
-        num_unit_on_tile = defaultdict(lambda: tile.unit.job.title == str(unit_type) if tile.unit is not None else 0)
-        num_unit_on_tile[UnitTypes.GHOUL] = tile.num_ghouls
-        num_unit_on_tile[UnitTypes.HOUND] = tile.num_hounds
-        num_unit_on_tile[UnitTypes.ZOMBIE] = tile.num_zombies
-
-        if tile.unit is not None and tile.unit.job.title != str(unit_type):
-            return False
         if tile.tower is not None:
             return False
-        if not (num_unit_on_tile[unit_type] < self._jobs_by_title[str(unit_type)].per_tile):
+        if unit_type is None:
+            return tile.unit is None
+        if tile.unit is not None and tile.unit.job.title != str(unit_type):
+            return False
+
+        stacked_count = STACKED_COUNTS.get(unit_type)
+        num_unit_on_tile = getattr(tile, stacked_count) if stacked_count else int(tile.unit is not None)
+        if not (num_unit_on_tile < self._jobs_by_title[str(unit_type)].per_tile):
             return False
 
-        if unit_type is None:
-            return True
         if unit_type != UnitTypes.WORKER:
             return tile.is_path
         else:
             return tile.is_grass or tile.is_gold_mine or tile.is_island_gold_mine
-        
+
+    def passability(self, unit_type: UnitTypes):
+        passable = self._passability.get(unit_type)
+        if passable is None:
+            return lambda tile: self.can_move_unit_to(tile, unit_type)
+        return passable
+
+    def set_passability(self, unit_type: UnitTypes, passable):
+        """Replaces which tiles a type of unit can path through. passable takes a Tile and returns a bool."""
+        self._passability[unit_type] = passable
+
+    @property
+    def pathfinder(self):
+        graph = self.game.tile_graph
+        if self._pathfinder is None or self._pathfinder.graph is not graph:
+            self._pathfinder = AStar(graph)
+        return self._pathfinder
+
     def find_path(self, start, goal, f_metric=None):
-        f_metric = f_metric if f_metric else self.distance
         unit_type = None
 
         if isinstance(start, Unit):
             unit_type = self.get_unit_type(start)
-        elif isinstance(start, Tile):
-            unit_type = start.unit
-        
+        elif isinstance(start, Tile) and start.unit is not None:
+            unit_type = self.get_unit_type(start.unit)
+
         start = self.get_tile_from(start)
         goal = self.get_tile_from(goal)
-        visited = set(start.id)
+        pathfinder = self.pathfinder
+        graph = pathfinder.graph
+        tiles = graph.tiles
+        passable = self.passability(unit_type)
+        heuristic = None
+        if f_metric:
+            heuristic = lambda index, goal_index: f_metric(tiles[index], tiles[goal_index])
 
-        came_from = {}
-        g_score = defaultdict(lambda: np.inf)
-        g_score[start] = 0
-        f_score = defaultdict(lambda: np.inf)
-        f_score[start] = f_metric(start, goal)
-        priority_queue = [(f_score[start], start.id, start)]
-        unpathable = 0
+        # when the goal can't be reached, head to the closest tile that can be
+        path = pathfinder.search(graph.index_of(start), graph.index_of(goal),
+                                 lambda index: passable(tiles[index]), heuristic, partial=True)
 
-        while priority_queue:
-            _, tile_id, current_tile = heapq.heappop(priority_queue)
+        if path is None:
+            self.logger.warning('Failed to find path for unit `%s`.%s %s %s', unit_type, start.unit, goal.x, goal.y)
+            return []
 
-            if current_tile == goal:
-                return self._reconstruct_path(current_tile, came_from, start)
-            
-            unpathable = 0
+        return [tiles[index] for index in path]
 
-            for neighbor in current_tile.get_neighbors():
-                if neighbor != goal and not self.can_move_unit_to(neighbor, unit_type):
-                    unpathable += 1
-                    continue
-                
-                score = g_score[current_tile] + self.move_cost(start, goal)
-
-                if score < g_score[neighbor]:
-                    came_from[neighbor] = current_tile
-                    g_score[neighbor] = score
-                    f_score[neighbor] = g_score[neighbor] + f_metric(current_tile, neighbor)
-                    
-                    if neighbor not in visited:
-                        visited.add(neighbor.id)
-                        heapq.heappush(priority_queue, (f_score[neighbor], neighbor.id, neighbor))
-            
-            if unpathable == len(current_tile.get_neighbors()):
-                return self._reconstruct_path(current_tile, came_from, start)
-            
-        self.logger.warn(f'Failed to find path for unit `{unit_type}`.' + str(start.unit) + ' ' + str(goal.x) + ' ' + str(goal.y))
-        return []
+    @property
+    def distance_fields(self):
+        if self._distance_fields is None:
+            self._distance_fields = DistanceFields(self)
+        return self._distance_fields
+
+    def move_unit_along(self, unit: Unit, field_name, number_of_moves=None):
+        """Moves a unit toward the closest goal of a distance field, e.g. 'castle' or 'gold', one step at a time."""
+        field = self.distance_fields.get(field_name)
+        graph = self.pathfinder.graph
+        tiles = graph.tiles
+        start = graph.index_of(unit.tile)
+
+        if field.distance(start) is None: # e.g. off the field's tiles on a spawner, so search instead
+            if field.goals:
+                goal = min(field.goals, key=lambda index: self.pathfinder.distance(start, index))
+                self.move_unit(unit, tiles[goal], number_of_moves)
+            return
+
+        unit_type = self.get_unit_type(unit)
+        passable = self.passability(unit_type)
+        can_enter = lambda index: passable(tiles[index])
+        moved = 0
+
+        while unit.moves > 0 and (number_of_moves is None or moved < number_of_moves):
+            step = field.downhill(graph.index_of(unit.tile), can_enter)
+            if step is None:
+                break
+
+            if not unit.move(tiles[step]):
+                self.logger.warning('Failed to move unit `%s`.', unit.id)
+                break
+            moved += 1
 
     def move_unit(self, unit: Unit, goal, number_of_moves=None):
         path = self.find_path(unit, goal)
@@ -438,16 +466,16 @@ class BaseController():
                 break
         
             if not unit.move(path[i]):
-                self.logger.warn(f'Failed to move unit `{unit.id}`.')
+                self.logger.warning('Failed to move unit `%s`.', unit.id)
                 break
-            else:
-                self.logger.info(f'Sucessfully moved unit of type `{unit.job.title}`')
+            elif self.logger.isEnabledFor(logging.INFO): # every move, so skip looking up the job unless it will be logged
+                self.logger.info('Sucessfully moved unit of type `%s`', unit.job.title)
 
     def spawn_unit(self, unit_type: UnitTypes, where=None):
         where: Tile = where if where is not None else \
                                     self.select_spawner_for_unit(unit_type)
         
-        self.logger.info(f'Attempting to spawn unit type `{unit_type}`...')
+        self.logger.info('Attempting to spawn unit type `%s`...', unit_type)
 
         if where:
             unit_was_spawned = False
@@ -461,9 +489,9 @@ class BaseController():
                 self.logger.info('Unit spawned successfully.')
                 self._units[unit_type].append(where.unit)
             else:
-                self.logger.warn('Failed to spawn unit.')
+                self.logger.warning('Failed to spawn unit.')
         else:
-            self.logger.warn('No base was found for the current player.')
+            self.logger.warning('No base was found for the current player.')
 
         return where
 
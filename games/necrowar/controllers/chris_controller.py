@@ -6,7 +6,7 @@ from .central_command import BaseController, UnitTypes
 class ChrisController(BaseController):
     def __init__(self, logger: logging.Logger, game: Game, player: Player):
         super().__init__(logger, game, player)
-        logger.info(f'Starting game as {player.name}.')
+        logger.info('Starting game as %s.', player.name)
 
     def run_turn(self):
         pass
@@ -0,0 +1,257 @@
+import heapq
+import collections
+import numpy as np
+from joueur.grid import NO_ID, id_of
+
+# passability classes, units of each class can walk on the same tiles
+WORKER = 'worker'
+FIGHTER = 'fighter'
+
+UNREACHABLE = 1 << 30
+
+
+class DistanceField():
+    """The number of steps from every tile to the closest of a set of goal tiles,
+    by breadth first search out from all the goals at once.
+
+    Any unit can walk to the closest goal by stepping to a neighbor with a
+    lower distance, without searching. When tiles open up or get blocked only
+    the distances that depended on them are recomputed.
+    """
+
+    def __init__(self, graph, passable, goals):
+        self._adjacency = graph.adjacency
+        self._passable = list(passable)
+        self._goals = frozenset(goals)
+        self._distances = [UNREACHABLE] * len(graph)
+        self._build()
+
+    @property
+    def goals(self):
+        return self._goals
+
+    @property
+    def distances(self):
+        """The distance of every tile index, UNREACHABLE if it can't get to a goal."""
+        return self._distances
+
+    def distance(self, index):
+        distance = self._distances[index]
+        return None if distance == UNREACHABLE else distance
+
+    def downhill(self, index, can_enter=None):
+        """Gets the neighbor to step to from a tile to get closer to a goal.
+
+        Args:
+            index (int): the tile index to step from
+            can_enter (function): takes a tile index and returns if the unit can move there right now
+        Returns:
+            int: the tile index to step to, or None if there isn't one
+        """
+        distances = self._distances
+        best = None
+        best_distance = distances[index]
+        for neighbor in self._adjacency[index]:
+            if distances[neighbor] < best_distance and (can_enter is None or can_enter(neighbor)):
+                best, best_distance = neighbor, distances[neighbor]
+        return best
+
+    def update(self, passable, changed):
+        """Updates the distances after the passability of some tiles changed.
+
+        Args:
+            passable (list[bool]): if each tile index can be walked through now
+            changed (list[int]): the tile indexes that changed since the last update
+        """
+        opened = []
+        closed = []
+        for index in changed:
+            self._passable[index] = passable[index]
+            (opened if passable[index] else closed).append(index)
+
+        seeds = self._invalidate(closed) if closed else []
+        seeds.extend(opened)
+        if seeds:
+            self._relax(seeds)
+
+    def _build(self):
+        distances = self._distances
+        adjacency = self._adjacency
+        passable = self._passable
+        for i in range(len(distances)):
+            distances[i] = UNREACHABLE
+
+        fringe = collections.deque(self._goals)
+        for goal in self._goals:
+            distances[goal] = 0
+
+        while fringe:
+            current = fringe.popleft()
+            distance = distances[current] + 1
+            for neighbor in adjacency[current]:
+                if distances[neighbor] == UNREACHABLE and passable[neighbor]:
+                    distances[neighbor] = distance
+                    fringe.append(neighbor)
+
+    def _invalidate(self, closed):
+        # forgets the distance of every tile that only got it through a closed tile, nearest to the goals first
+        distances = self._distances
+        adjacency = self._adjacency
+        goals = self._goals
+        invalidated = []
+        to_check = []
+
+        for index in closed:
+            distance = distances[index]
+            if index in goals or distance == UNREACHABLE:
+                continue
+            distances[index] = UNREACHABLE
+            invalidated.append(index)
+            for neighbor in adjacency[index]:
+                if distances[neighbor] == distance + 1:
+                    heapq.heappush(to_check, (distance + 1, neighbor))
+
+        while to_check:
+            distance, index = heapq.heappop(to_check)
+            if distances[index] != distance:
+                continue  # already forgotten
+            if any(distances[neighbor] == distance - 1 for neighbor in adjacency[index]):
+                continue  # still has a way to a goal just as short
+
+            distances[index] = UNREACHABLE
+            invalidated.append(index)
+            for neighbor in adjacency[index]:
+                if distances[neighbor] == distance + 1:
+                    heapq.heappush(to_check, (distance + 1, neighbor))
+
+        return invalidated
+
+    def _relax(self, seeds):
+        # lowers distances out from tiles that may now have a shorter way to a goal
+        distances = self._distances
+        adjacency = self._adjacency
+        passable = self._passable
+        goals = self._goals
+        to_lower = []
+
+        for index in seeds:
+            if index in goals or not passable[index]:
+                continue
+            distance = min(distances[neighbor] for neighbor in adjacency[index]) + 1 if adjacency[index] else UNREACHABLE
+            if distance < distances[index]:
+                distances[index] = distance
+                heapq.heappush(to_lower, (distance, index))
+
+        while to_lower:
+            distance, index = heapq.heappop(to_lower)
+            if distances[index] != distance:
+                continue
+            for neighbor in adjacency[index]:
+                if distances[neighbor] > distance + 1 and passable[neighbor] and neighbor not in goals:
+                    distances[neighbor] = distance + 1
+                    heapq.heappush(to_lower, (distance + 1, neighbor))
+
+
+class DistanceFields():
+    """Distance fields toward the places units head to, shared by every unit
+    of a passability class and brought up to date once per turn.
+
+    Tiles a unit can't walk on, tiles with a tower, and tiles with an enemy
+    unit are blocked. Tiles with our own units are not, as they move during
+    the turn; units check where they can step when they step.
+    """
+
+    def __init__(self, controller):
+        self._controller = controller
+        self._game = controller.game
+        self._graph = None
+        self._turn = None
+        self._passable = {}
+        self._fields = {}
+        self._goals = {}
+
+        self.add('castle', FIGHTER, self.castle_goals)
+        self.add('gold', WORKER, self.gold_goals)
+        self.add('shore', WORKER, self.shore_goals)
+
+    def add(self, name, passability_class, goals):
+        """Adds a field to keep up to date.
+
+        Args:
+            name (str): the name to get it by
+            passability_class (str): WORKER or FIGHTER, which tiles paths can go through
+            goals (function): returns the tile indexes to head to, called each turn
+        """
+        self._goals[name] = (passability_class, goals)
+        self._fields.pop(name, None)
+
+    def get(self, name):
+        """Gets a field by name, e.g. 'castle', 'gold', or 'shore'.
+
+        Returns:
+            DistanceField: the field, up to date for this turn
+        """
+        if self._turn != self._game.current_turn or self._graph is not self._game.tile_graph:
+            self.refresh()
+
+        field = self._fields.get(name)
+        if field is None:
+            passability_class, goals = self._goals[name]
+            field = self._fields[name] = DistanceField(self._graph, self._passable[passability_class], goals())
+        return field
+
+    def refresh(self):
+        """Brings every field up to date with the game, only recomputing distances where tiles were opened or blocked."""
+        game = self._game
+        self._turn = game.current_turn
+        if self._graph is not game.tile_graph:  # a new map, so nothing can be reused
+            self._graph = game.tile_graph
+            self._passable = {}
+            self._fields = {}
+
+        grid = game.grid
+        blocked = (grid.tower != NO_ID) | (grid.unit_owner == id_of(self._controller.player.opponent))
+        terrain = {
+            WORKER: grid.is_grass | grid.is_gold_mine | grid.is_island_gold_mine,
+            FIGHTER: grid.is_path,
+        }
+
+        changed = {}
+        for passability_class, walkable in terrain.items():
+            passable = (walkable & ~blocked).ravel()
+            previous = self._passable.get(passability_class)
+            if previous is not None:
+                changed[passability_class] = np.flatnonzero(passable != np.asarray(previous)).tolist()
+            self._passable[passability_class] = passable.tolist()
+
+        for name, field in list(self._fields.items()):
+            passability_class, goals = self._goals[name]
+            goals = frozenset(goals())
+            if goals != field.goals:  # every distance could change
+                self._fields[name] = DistanceField(self._graph, self._passable[passability_class], goals)
+            elif changed.get(passability_class):
+                field.update(self._passable[passability_class], changed[passability_class])
+
+    def castle_goals(self):
+        castle = self._controller.enemy_castle
+        return [self._graph.index_of(castle)] if castle is not None else []
+
+    def gold_goals(self):
+        # the gold mines no one is mining, or all of them if every one is taken
+        mines = self._controller._gold_mine_coordinates
+        if not len(mines):
+            return []
+
+        indexes = mines[:, 0] + mines[:, 1] * self._game.map_width
+        free = self._game.grid.unit.ravel()[indexes] == NO_ID
+        return (indexes[free] if free.any() else indexes).tolist()
+
+    def shore_goals(self):
+        # the tiles workers can fish from
+        grid = self._game.grid
+        river = grid.is_river.ravel()
+        adjacency = self._graph.adjacency
+        return [
+            index for index, passable in enumerate(self._passable[WORKER])
+            if passable and any(river[neighbor] for neighbor in adjacency[index])
+        ]
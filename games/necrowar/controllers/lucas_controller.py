@@ -15,7 +15,7 @@ class LucasController(BaseController):
     
     def move_attackers(self):
         for unit in self.get_attack_units():
-            self.move_unit(unit, self.enemy_castle)
+            self.move_unit_along(unit, 'castle')
     
     def attackers_attack(self):
         for unit in self.get_attack_units():
@@ -48,7 +48,7 @@ class LucasController(BaseController):
         self.towers_attack()
         self.enemy_health = self.enemy_castle.tower.health
         self.turn = self.game.current_turn
-        self.logger.info(f'Hello from Lucas!')
+        self.logger.info('Hello from Lucas!')
     
     def end_game(self):
         pass
\ No newline at end of file
@@ -0,0 +1,100 @@
+from collections import defaultdict
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def range_offsets(tower_range):
+    """Every (dx, dy) within a Manhattan distance of a tower, nearest first, not including its own tile."""
+    offsets = [
+        (dx, dy)
+        for dx in range(-tower_range, tower_range + 1)
+        for dy in range(-(tower_range - abs(dx)), tower_range - abs(dx) + 1)
+        if dx or dy
+    ]
+    offsets.sort(key=lambda offset: abs(offset[0]) + abs(offset[1]))
+    return tuple(offsets)
+
+
+def lowest_health(unit, targeting):
+    """Target priority: finish off the weakest unit first."""
+    return targeting.health_left(unit)
+
+
+def closest_to_castle(unit, targeting):
+    """Target priority: shoot the unit that is closest to our castle first."""
+    castle = targeting.castle
+    if castle is None:
+        return 0
+    return abs(unit.tile.x - castle.x) + abs(unit.tile.y - castle.y)
+
+
+class TowerTargeting():
+    """The enemy units bucketed by the tile they are on, so each tower only
+    looks at the tiles in its range instead of at every enemy unit.
+
+    Build one per turn, before any tower attacks, and tell it about each
+    attack with hit(), so later towers know what earlier ones will have done
+    even before the server has said so.
+    """
+
+    def __init__(self, units, castle=None, priority=lowest_health):
+        """Buckets the units.
+
+        Args:
+            units (list[Unit]): the units towers can shoot at, e.g. player.opponent.units
+            castle (Tile): our castle's tile, for priorities that defend it
+            priority (function): takes a unit and this and returns its priority, the unit with the lowest is shot first
+        """
+        self._castle = castle
+        self._priority = priority
+        self._units_at = defaultdict(list)
+        self._damage = defaultdict(int)  # unit -> damage it is taking from this turn's attacks
+        for unit in units:
+            if unit.tile is not None:
+                self._units_at[(unit.tile.x, unit.tile.y)].append(unit)
+
+    @property
+    def castle(self):
+        return self._castle
+
+    def units_in_range(self, tower):
+        """Gets the enemy units a tower can shoot at, nearest first."""
+        tile = tower.tile
+        tower_range = max(tower.job.range, 1)  # every tower can hit the tiles next to it
+        units_at = self._units_at
+        offsets = range_offsets(tower_range)
+
+        if len(units_at) < len(offsets):  # fewer occupied tiles than tiles in range, so check them instead
+            return [
+                unit
+                for (x, y), units in sorted(units_at.items(), key=lambda item: abs(item[0][0] - tile.x) + abs(item[0][1] - tile.y))
+                if 0 < abs(x - tile.x) + abs(y - tile.y) <= tower_range
+                for unit in units
+            ]
+
+        in_range = []
+        for dx, dy in offsets:
+            units = units_at.get((tile.x + dx, tile.y + dy))
+            if units:
+                in_range.extend(units)
+        return in_range
+
+    def health_left(self, unit):
+        """Gets a unit's health once this turn's attacks on it so far have hit."""
+        return unit.health - self._damage[unit]
+
+    def hit(self, unit, damage):
+        """Records an attack on a unit, e.g. one the server hasn't answered yet."""
+        self._damage[unit] += damage
+
+    def target_for(self, tower):
+        """Gets the unit a tower should shoot at, or None if there are none in range."""
+        best = None
+        best_priority = None
+        for unit in self.units_in_range(tower):
+            if unit.tile is None or self.health_left(unit) <= 0:  # killed by another tower this turn
+                continue
+            priority = self._priority(unit, self)
+            if best is None or priority < best_priority:
+                best, best_priority = unit, priority
+        return best
@@ -25,6 +25,57 @@ class Game(BaseGame):
     Send hordes of the undead at your opponent while defending yourself against theirs to win.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_current_player',
+        '_current_turn',
+        '_game_objects',
+        '_gold_income_per_unit',
+        '_island_income_per_unit',
+        '_mana_income_per_unit',
+        '_map_height',
+        '_map_width',
+        '_max_turns',
+        '_players',
+        '_river_phase',
+        '_session',
+        '_tiles',
+        '_time_added_per_turn',
+        '_tower_jobs',
+        '_towers',
+        '_unit_jobs',
+        '_units',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'current_player': 'games.necrowar.player.Player',
+        'current_turn': 'int',
+        'game_objects': 'dict[str, games.necrowar.game_object.GameObject]',
+        'gold_income_per_unit': 'int',
+        'island_income_per_unit': 'int',
+        'mana_income_per_unit': 'int',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_turns': 'int',
+        'players': 'list[games.necrowar.player.Player]',
+        'river_phase': 'int',
+        'session': 'str',
+        'tiles': 'list[games.necrowar.tile.Tile]',
+        'time_added_per_turn': 'int',
+        'tower_jobs': 'list[games.necrowar.tower_job.TowerJob]',
+        'towers': 'list[games.necrowar.tower.Tower]',
+        'unit_jobs': 'list[games.necrowar.unit_job.UnitJob]',
+        'units': 'list[games.necrowar.unit.Unit]',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
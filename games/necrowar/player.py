@@ -16,6 +16,49 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_client_type',
+        '_gold',
+        '_health',
+        '_home_base',
+        '_lost',
+        '_mana',
+        '_name',
+        '_opponent',
+        '_reason_lost',
+        '_reason_won',
+        '_side',
+        '_time_remaining',
+        '_towers',
+        '_units',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'client_type': 'str',
+        'gold': 'int',
+        'health': 'int',
+        'home_base': 'list[games.necrowar.tile.Tile]',
+        'lost': 'bool',
+        'mana': 'int',
+        'name': 'str',
+        'opponent': 'games.necrowar.player.Player',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'side': 'list[games.necrowar.tile.Tile]',
+        'time_remaining': 'float',
+        'towers': 'list[games.necrowar.tower.Tower]',
+        'units': 'list[games.necrowar.unit.Unit]',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,31 @@ class Tower(GameObject):
     A tower in the game. Used to combat enemy waves.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_attacked',
+        '_cooldown',
+        '_health',
+        '_job',
+        '_owner',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'attacked': 'bool',
+        'cooldown': 'int',
+        'health': 'int',
+        'job': 'games.necrowar.tower_job.TowerJob',
+        'owner': 'games.necrowar.player.Player',
+        'tile': 'games.necrowar.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Tower with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
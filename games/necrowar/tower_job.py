@@ -16,6 +16,35 @@ class TowerJob(GameObject):
     Information about a tower's job/type.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_all_units',
+        '_damage',
+        '_gold_cost',
+        '_health',
+        '_mana_cost',
+        '_range',
+        '_title',
+        '_turns_between_attacks',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'all_units': 'bool',
+        'damage': 'int',
+        'gold_cost': 'int',
+        'health': 'int',
+        'mana_cost': 'int',
+        'range': 'int',
+        'title': 'str',
+        'turns_between_attacks': 'int',
+    }
+
     def __init__(self):
         """Initializes a TowerJob with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,31 @@ class Unit(GameObject):
     A unit in the game. May be a worker, zombie, ghoul, hound, abomination, wraith or horseman.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_acted',
+        '_health',
+        '_job',
+        '_moves',
+        '_owner',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'acted': 'bool',
+        'health': 'int',
+        'job': 'games.necrowar.unit_job.UnitJob',
+        'moves': 'int',
+        'owner': 'games.necrowar.player.Player',
+        'tile': 'games.necrowar.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Unit with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
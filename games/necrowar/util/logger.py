@@ -1,5 +1,8 @@
 import logging, coloredlogs, colorama
 import logging.config
+import logging.handlers
+import queue
+import threading
 import yaml
 
 from enum import Enum, auto
@@ -11,6 +14,9 @@ import os
 DEFAULT_LOGGER_CONFIG_FILE = 'logging.conf'
 DEFAULT_LOGGER_CONFIG_FILE_PATH = get_path(__file__, DEFAULT_LOGGER_CONFIG_FILE)
 
+# set to 1 to have a background thread write log records, so run_turn never waits on the console
+QUEUE_ENV_VAR = 'NECROWAR_LOG_QUEUE'
+
 class LoggerTypes(Enum):
     DEVELOP = auto()
     RELEASE = auto()
@@ -24,19 +30,69 @@ class LoggerTypes(Enum):
         return mapping.get(self.value)
 
 class Logger():
-    def __init__(self, config_file_path=DEFAULT_LOGGER_CONFIG_FILE_PATH):
-        self._config = None
-        
-        colorama.init()
-        
-        if not os.path.isfile(config_file_path):
-            raise FileNotFoundError(config_file_path)
-        
-        with open(config_file_path, 'r') as config:
-            self._config = yaml.safe_load(config.read())
-            logging.config.dictConfig(self._config)
-    
+    # logging is configured once per process, no matter how many times it is asked for
+    _lock = threading.Lock()
+    _configured_path = None
+    _listener = None
+
+    def __init__(self, config_file_path=DEFAULT_LOGGER_CONFIG_FILE_PATH, use_queue=None):
+        Logger.configure(config_file_path, use_queue)
+
+    @staticmethod
+    def configure(config_file_path=DEFAULT_LOGGER_CONFIG_FILE_PATH, use_queue=None):
+        """Reads the config and sets up logging, only the first time it is called.
+
+        Args:
+            config_file_path (str): the YAML logging config to use
+            use_queue (bool): if records should be handed to a background thread to write, defaults to the NECROWAR_LOG_QUEUE environment variable
+        """
+        with Logger._lock:
+            if Logger._configured_path is not None:
+                return
+
+            colorama.init()
+
+            if not os.path.isfile(config_file_path):
+                raise FileNotFoundError(config_file_path)
+
+            with open(config_file_path, 'r') as config:
+                config = yaml.safe_load(config.read())
+                logging.config.dictConfig(config)
+
+            if use_queue is None:
+                use_queue = os.environ.get(QUEUE_ENV_VAR, '') not in ('', '0')
+            if use_queue:
+                Logger._start_queue(list(config.get('loggers', {})))
+
+            Logger._configured_path = config_file_path
+
+    @staticmethod
+    def _start_queue(logger_names):
+        # every configured logger hands its records to one queue, and a listener thread passes them to the real handlers
+        loggers = [logging.getLogger(name) for name in logger_names] + [logging.getLogger()]
+        handlers = []
+        for logger in loggers:
+            for handler in logger.handlers:
+                if handler not in handlers:
+                    handlers.append(handler)
+
+        records = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(records)
+        for logger in loggers:
+            logger.handlers = [queue_handler]
+
+        Logger._listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        Logger._listener.start()
+
+    @staticmethod
+    def stop():
+        """Writes out any queued log records and stops the background thread. Call before the process exits, as it ends via os._exit()."""
+        with Logger._lock:
+            if Logger._listener is not None:
+                Logger._listener.stop()
+                Logger._listener = None
+
     @staticmethod
-    def get(type: LoggerTypes, config_file_path=DEFAULT_LOGGER_CONFIG_FILE_PATH) -> logging.Logger:
-        logger = Logger(config_file_path)
-        return logging.getLogger(str(type))
\ No newline at end of file
+    def get(type: LoggerTypes, config_file_path=DEFAULT_LOGGER_CONFIG_FILE_PATH, use_queue=None) -> logging.Logger:
+        Logger.configure(config_file_path, use_queue)
+        return logging.getLogger(str(type))
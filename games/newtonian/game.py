@@ -24,6 +24,67 @@ class Game(BaseGame):
     Combine elements and be the first scientists to create fusion.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_current_player',
+        '_current_turn',
+        '_game_objects',
+        '_intern_cap',
+        '_jobs',
+        '_machines',
+        '_manager_cap',
+        '_map_height',
+        '_map_width',
+        '_material_spawn',
+        '_max_turns',
+        '_physicist_cap',
+        '_players',
+        '_refined_value',
+        '_regenerate_rate',
+        '_session',
+        '_spawn_time',
+        '_stun_time',
+        '_tiles',
+        '_time_added_per_turn',
+        '_time_immune',
+        '_units',
+        '_victory_amount',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'current_player': 'games.newtonian.player.Player',
+        'current_turn': 'int',
+        'game_objects': 'dict[str, games.newtonian.game_object.GameObject]',
+        'intern_cap': 'int',
+        'jobs': 'list[games.newtonian.job.Job]',
+        'machines': 'list[games.newtonian.machine.Machine]',
+        'manager_cap': 'int',
+        'map_height': 'int',
+        'map_width': 'int',
+        'material_spawn': 'int',
+        'max_turns': 'int',
+        'physicist_cap': 'int',
+        'players': 'list[games.newtonian.player.Player]',
+        'refined_value': 'int',
+        'regenerate_rate': 'float',
+        'session': 'str',
+        'spawn_time': 'int',
+        'stun_time': 'int',
+        'tiles': 'list[games.newtonian.tile.Tile]',
+        'time_added_per_turn': 'int',
+        'time_immune': 'int',
+        'units': 'list[games.newtonian.unit.Unit]',
+        'victory_amount': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
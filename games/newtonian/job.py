@@ -16,6 +16,29 @@ class Job(GameObject):
     Information about a unit's job.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_carry_limit',
+        '_damage',
+        '_health',
+        '_moves',
+        '_title',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'carry_limit': 'int',
+        'damage': 'int',
+        'health': 'int',
+        'moves': 'int',
+        'title': 'str',
+    }
+
     def __init__(self):
         """Initializes a Job with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,31 @@ class Machine(GameObject):
     A machine in the game. Used to refine ore.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_ore_type',
+        '_refine_input',
+        '_refine_output',
+        '_refine_time',
+        '_tile',
+        '_worked',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'ore_type': 'str',
+        'refine_input': 'int',
+        'refine_output': 'int',
+        'refine_time': 'int',
+        'tile': 'games.newtonian.tile.Tile',
+        'worked': 'int',
+    }
+
     def __init__(self):
         """Initializes a Machine with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,51 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_client_type',
+        '_generator_tiles',
+        '_heat',
+        '_intern_spawn',
+        '_lost',
+        '_manager_spawn',
+        '_name',
+        '_opponent',
+        '_physicist_spawn',
+        '_pressure',
+        '_reason_lost',
+        '_reason_won',
+        '_spawn_tiles',
+        '_time_remaining',
+        '_units',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'client_type': 'str',
+        'generator_tiles': 'list[games.newtonian.tile.Tile]',
+        'heat': 'int',
+        'intern_spawn': 'int',
+        'lost': 'bool',
+        'manager_spawn': 'int',
+        'name': 'str',
+        'opponent': 'games.newtonian.player.Player',
+        'physicist_spawn': 'int',
+        'pressure': 'int',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'spawn_tiles': 'list[games.newtonian.tile.Tile]',
+        'time_remaining': 'float',
+        'units': 'list[games.newtonian.unit.Unit]',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,43 @@ class Unit(GameObject):
     A unit in the game. May be a manager, intern, or physicist.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_acted',
+        '_blueium',
+        '_blueium_ore',
+        '_health',
+        '_job',
+        '_moves',
+        '_owner',
+        '_redium',
+        '_redium_ore',
+        '_stun_immune',
+        '_stun_time',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'acted': 'bool',
+        'blueium': 'int',
+        'blueium_ore': 'int',
+        'health': 'int',
+        'job': 'games.newtonian.job.Job',
+        'moves': 'int',
+        'owner': 'games.newtonian.player.Player',
+        'redium': 'int',
+        'redium_ore': 'int',
+        'stun_immune': 'int',
+        'stun_time': 'int',
+        'tile': 'games.newtonian.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Unit with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
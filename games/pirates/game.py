@@ -23,6 +23,77 @@ class Game(BaseGame):
     Steal from merchants and become the most infamous pirate.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_bury_interest_rate',
+        '_crew_cost',
+        '_crew_damage',
+        '_crew_health',
+        '_crew_moves',
+        '_crew_range',
+        '_current_player',
+        '_current_turn',
+        '_game_objects',
+        '_heal_factor',
+        '_map_height',
+        '_map_width',
+        '_max_turns',
+        '_merchant_gold_rate',
+        '_merchant_interest_rate',
+        '_min_interest_distance',
+        '_players',
+        '_ports',
+        '_rest_range',
+        '_session',
+        '_ship_cost',
+        '_ship_damage',
+        '_ship_health',
+        '_ship_moves',
+        '_ship_range',
+        '_tiles',
+        '_time_added_per_turn',
+        '_units',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'bury_interest_rate': 'float',
+        'crew_cost': 'int',
+        'crew_damage': 'int',
+        'crew_health': 'int',
+        'crew_moves': 'int',
+        'crew_range': 'float',
+        'current_player': 'games.pirates.player.Player',
+        'current_turn': 'int',
+        'game_objects': 'dict[str, games.pirates.game_object.GameObject]',
+        'heal_factor': 'float',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_turns': 'int',
+        'merchant_gold_rate': 'float',
+        'merchant_interest_rate': 'float',
+        'min_interest_distance': 'float',
+        'players': 'list[games.pirates.player.Player]',
+        'ports': 'list[games.pirates.port.Port]',
+        'rest_range': 'float',
+        'session': 'str',
+        'ship_cost': 'int',
+        'ship_damage': 'int',
+        'ship_health': 'int',
+        'ship_moves': 'int',
+        'ship_range': 'float',
+        'tiles': 'list[games.pirates.tile.Tile]',
+        'time_added_per_turn': 'int',
+        'units': 'list[games.pirates.unit.Unit]',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -16,6 +16,27 @@ class Port(GameObject):
     A port on a Tile.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_gold',
+        '_investment',
+        '_owner',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'gold': 'int',
+        'investment': 'int',
+        'owner': 'games.pirates.player.Player',
+        'tile': 'games.pirates.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Port with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
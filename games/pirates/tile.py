@@ -16,6 +16,42 @@ class Tile(GameObject):
     A Tile in the game that makes up the 2D map grid.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_decoration',
+        '_gold',
+        '_port',
+        '_tile_east',
+        '_tile_north',
+        '_tile_south',
+        '_tile_west',
+        '_type',
+        '_unit',
+        '_x',
+        '_y',
+        '_neighbors',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'decoration': 'bool',
+        'gold': 'int',
+        'port': 'games.pirates.port.Port',
+        'tile_east': 'games.pirates.tile.Tile',
+        'tile_north': 'games.pirates.tile.Tile',
+        'tile_south': 'games.pirates.tile.Tile',
+        'tile_west': 'games.pirates.tile.Tile',
+        'type': 'str',
+        'unit': 'games.pirates.unit.Unit',
+        'x': 'int',
+        'y': 'int',
+    }
+
     def __init__(self):
         """Initializes a Tile with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -32,6 +68,7 @@ class Tile(GameObject):
         self._unit = None
         self._x = 0
         self._y = 0
+        self._neighbors = None # cached by get_neighbors()
 
     @property
     def decoration(self):
@@ -129,14 +166,14 @@ class Tile(GameObject):
     def get_neighbors(self):
         """Gets the neighbors of this Tile
 
-        :rtype list[games.pirates.tile.Tile]
+        :rtype tuple[games.pirates.tile.Tile]
         """
-        neighbors = []
-
-        for direction in Tile.directions:
-            neighbor = getattr(self, "tile_" + direction.lower())
-            if neighbor:
-                neighbors.append(neighbor)
+        neighbors = self._neighbors
+        if neighbors is None: # tiles are only linked once, so look them up once
+            neighbors = self._neighbors = tuple(
+                neighbor for neighbor in (self._tile_north, self._tile_east, self._tile_south, self._tile_west)
+                if neighbor
+            )
 
         return neighbors
 
@@ -157,7 +194,7 @@ class Tile(GameObject):
         Returns:
             bool: True if the tile is a neighbor of this Tile, False otherwise
         """
-        return bool(tile and tile in self.get_neighbors())
+        return tile is not None and tile in self.get_neighbors()
 
     # <<-- Creer-Merge: functions -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
     # if you want to add any client side logic (such as state checking functions) this is where you can add them
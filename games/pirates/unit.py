@@ -16,6 +16,41 @@ class Unit(GameObject):
     A unit group in the game. This may consist of a ship and any number of crew.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_acted',
+        '_crew',
+        '_crew_health',
+        '_gold',
+        '_moves',
+        '_owner',
+        '_path',
+        '_ship_health',
+        '_stun_turns',
+        '_target_port',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'acted': 'bool',
+        'crew': 'int',
+        'crew_health': 'int',
+        'gold': 'int',
+        'moves': 'int',
+        'owner': 'games.pirates.player.Player',
+        'path': 'list[games.pirates.tile.Tile]',
+        'ship_health': 'int',
+        'stun_turns': 'int',
+        'target_port': 'games.pirates.port.Port',
+        'tile': 'games.pirates.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Unit with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,27 @@ class Bottle(GameObject):
     A bottle thrown by a bartender at a Tile.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_direction',
+        '_drunk_direction',
+        '_is_destroyed',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'direction': 'str',
+        'drunk_direction': 'str',
+        'is_destroyed': 'bool',
+        'tile': 'games.saloon.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Bottle with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,41 @@ class Cowboy(GameObject):
     A person on the map that can move around and interact within the saloon.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_can_move',
+        '_drunk_direction',
+        '_focus',
+        '_health',
+        '_is_dead',
+        '_is_drunk',
+        '_job',
+        '_owner',
+        '_tile',
+        '_tolerance',
+        '_turns_busy',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'can_move': 'bool',
+        'drunk_direction': 'str',
+        'focus': 'int',
+        'health': 'int',
+        'is_dead': 'bool',
+        'is_drunk': 'bool',
+        'job': 'str',
+        'owner': 'games.saloon.player.Player',
+        'tile': 'games.saloon.tile.Tile',
+        'tolerance': 'int',
+        'turns_busy': 'int',
+    }
+
     def __init__(self):
         """Initializes a Cowboy with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
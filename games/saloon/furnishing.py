@@ -16,6 +16,29 @@ class Furnishing(GameObject):
     An furnishing in the Saloon that must be pathed around, or destroyed.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_health',
+        '_is_destroyed',
+        '_is_piano',
+        '_is_playing',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'health': 'int',
+        'is_destroyed': 'bool',
+        'is_piano': 'bool',
+        'is_playing': 'bool',
+        'tile': 'games.saloon.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a Furnishing with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -25,6 +25,63 @@ class Game(BaseGame):
     Use cowboys to have a good time and play some music on a Piano, while brawling with enemy Cowboys.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_bartender_cooldown',
+        '_bottles',
+        '_brawler_damage',
+        '_cowboys',
+        '_current_player',
+        '_current_turn',
+        '_furnishings',
+        '_game_objects',
+        '_jobs',
+        '_map_height',
+        '_map_width',
+        '_max_cowboys_per_job',
+        '_max_turns',
+        '_players',
+        '_rowdiness_to_siesta',
+        '_session',
+        '_sharpshooter_damage',
+        '_siesta_length',
+        '_tiles',
+        '_time_added_per_turn',
+        '_turns_drunk',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'bartender_cooldown': 'int',
+        'bottles': 'list[games.saloon.bottle.Bottle]',
+        'brawler_damage': 'int',
+        'cowboys': 'list[games.saloon.cowboy.Cowboy]',
+        'current_player': 'games.saloon.player.Player',
+        'current_turn': 'int',
+        'furnishings': 'list[games.saloon.furnishing.Furnishing]',
+        'game_objects': 'dict[str, games.saloon.game_object.GameObject]',
+        'jobs': 'list[str]',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_cowboys_per_job': 'int',
+        'max_turns': 'int',
+        'players': 'list[games.saloon.player.Player]',
+        'rowdiness_to_siesta': 'int',
+        'session': 'str',
+        'sharpshooter_damage': 'int',
+        'siesta_length': 'int',
+        'tiles': 'list[games.saloon.tile.Tile]',
+        'time_added_per_turn': 'int',
+        'turns_drunk': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
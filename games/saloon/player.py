@@ -16,6 +16,47 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_client_type',
+        '_cowboys',
+        '_kills',
+        '_lost',
+        '_name',
+        '_opponent',
+        '_reason_lost',
+        '_reason_won',
+        '_rowdiness',
+        '_score',
+        '_siesta',
+        '_time_remaining',
+        '_won',
+        '_young_gun',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'client_type': 'str',
+        'cowboys': 'list[games.saloon.cowboy.Cowboy]',
+        'kills': 'int',
+        'lost': 'bool',
+        'name': 'str',
+        'opponent': 'games.saloon.player.Player',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'rowdiness': 'int',
+        'score': 'int',
+        'siesta': 'int',
+        'time_remaining': 'float',
+        'won': 'bool',
+        'young_gun': 'games.saloon.young_gun.YoungGun',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
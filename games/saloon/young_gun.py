@@ -16,6 +16,27 @@ class YoungGun(GameObject):
     An eager young person that wants to join your gang, and will call in the veteran Cowboys you need to win the brawl in the saloon.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_call_in_tile',
+        '_can_call_in',
+        '_owner',
+        '_tile',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'call_in_tile': 'games.saloon.tile.Tile',
+        'can_call_in': 'bool',
+        'owner': 'games.saloon.player.Player',
+        'tile': 'games.saloon.tile.Tile',
+    }
+
     def __init__(self):
         """Initializes a YoungGun with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
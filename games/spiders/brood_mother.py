@@ -16,6 +16,23 @@ class BroodMother(Spider):
     The Spider Queen. She alone can spawn Spiderlings for each Player, and if she dies the owner loses.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_eggs',
+        '_health',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'eggs': 'int',
+        'health': 'int',
+    }
+
     def __init__(self):
         """Initializes a BroodMother with basic logic as provided by the Creer code generator."""
         Spider.__init__(self)
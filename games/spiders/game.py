@@ -28,6 +28,55 @@ class Game(BaseGame):
     There's an infestation of enemy spiders challenging your queen broodmother spider! Protect her and attack the other broodmother in this turn based, node based, game.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_current_player',
+        '_current_turn',
+        '_cut_speed',
+        '_eggs_scalar',
+        '_game_objects',
+        '_initial_web_strength',
+        '_max_turns',
+        '_max_web_strength',
+        '_movement_speed',
+        '_nests',
+        '_players',
+        '_session',
+        '_spit_speed',
+        '_time_added_per_turn',
+        '_weave_power',
+        '_weave_speed',
+        '_webs',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'current_player': 'games.spiders.player.Player',
+        'current_turn': 'int',
+        'cut_speed': 'int',
+        'eggs_scalar': 'float',
+        'game_objects': 'dict[str, games.spiders.game_object.GameObject]',
+        'initial_web_strength': 'int',
+        'max_turns': 'int',
+        'max_web_strength': 'int',
+        'movement_speed': 'int',
+        'nests': 'list[games.spiders.nest.Nest]',
+        'players': 'list[games.spiders.player.Player]',
+        'session': 'str',
+        'spit_speed': 'int',
+        'time_added_per_turn': 'int',
+        'weave_power': 'int',
+        'weave_speed': 'int',
+        'webs': 'list[games.spiders.web.Web]',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
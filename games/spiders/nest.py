@@ -16,6 +16,29 @@ class Nest(GameObject):
     A location (node) connected to other Nests via Webs (edges) in the game that Spiders can converge on, regardless of owner.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_controlling_player',
+        '_spiders',
+        '_webs',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'controlling_player': 'games.spiders.player.Player',
+        'spiders': 'list[games.spiders.spider.Spider]',
+        'webs': 'list[games.spiders.web.Web]',
+        'x': 'int',
+        'y': 'int',
+    }
+
     def __init__(self):
         """Initializes a Nest with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,43 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_brood_mother',
+        '_client_type',
+        '_lost',
+        '_max_spiderlings',
+        '_name',
+        '_number_of_nests_controlled',
+        '_opponent',
+        '_reason_lost',
+        '_reason_won',
+        '_spiders',
+        '_time_remaining',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'brood_mother': 'games.spiders.brood_mother.BroodMother',
+        'client_type': 'str',
+        'lost': 'bool',
+        'max_spiderlings': 'int',
+        'name': 'str',
+        'number_of_nests_controlled': 'int',
+        'opponent': 'games.spiders.player.Player',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'spiders': 'list[games.spiders.spider.Spider]',
+        'time_remaining': 'float',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,25 @@ class Spider(GameObject):
     A Spider in the game. The most basic unit.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_is_dead',
+        '_nest',
+        '_owner',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'is_dead': 'bool',
+        'nest': 'games.spiders.nest.Nest',
+        'owner': 'games.spiders.player.Player',
+    }
+
     def __init__(self):
         """Initializes a Spider with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
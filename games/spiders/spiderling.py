@@ -16,6 +16,29 @@ class Spiderling(Spider):
     A Spider spawned by the BroodMother.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_busy',
+        '_moving_on_web',
+        '_moving_to_nest',
+        '_number_of_coworkers',
+        '_work_remaining',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'busy': 'str',
+        'moving_on_web': 'games.spiders.web.Web',
+        'moving_to_nest': 'games.spiders.nest.Nest',
+        'number_of_coworkers': 'int',
+        'work_remaining': 'float',
+    }
+
     def __init__(self):
         """Initializes a Spiderling with basic logic as provided by the Creer code generator."""
         Spider.__init__(self)
@@ -16,6 +16,21 @@ class Spitter(Spiderling):
     A Spiderling that creates and spits new Webs from the Nest it is on to another Nest, connecting them.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_spitting_web_to_nest',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'spitting_web_to_nest': 'games.spiders.nest.Nest',
+    }
+
     def __init__(self):
         """Initializes a Spitter with basic logic as provided by the Creer code generator."""
         Spiderling.__init__(self)
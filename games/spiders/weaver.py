@@ -16,6 +16,23 @@ class Weaver(Spiderling):
     A Spiderling that can alter existing Webs by weaving to add or remove silk from the Webs, thus altering its strength.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_strengthening_web',
+        '_weakening_web',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'strengthening_web': 'games.spiders.web.Web',
+        'weakening_web': 'games.spiders.web.Web',
+    }
+
     def __init__(self):
         """Initializes a Weaver with basic logic as provided by the Creer code generator."""
         Spiderling.__init__(self)
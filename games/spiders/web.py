@@ -16,6 +16,31 @@ class Web(GameObject):
     A connection (edge) to a Nest (node) in the game that Spiders can converge on (regardless of owner). Spiders can travel in either direction on Webs.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_length',
+        '_load',
+        '_nest_a',
+        '_nest_b',
+        '_spiderlings',
+        '_strength',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'length': 'float',
+        'load': 'int',
+        'nest_a': 'games.spiders.nest.Nest',
+        'nest_b': 'games.spiders.nest.Nest',
+        'spiderlings': 'list[games.spiders.spiderling.Spiderling]',
+        'strength': 'int',
+    }
+
     def __init__(self):
         """Initializes a Web with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
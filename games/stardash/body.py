@@ -16,6 +16,33 @@ class Body(GameObject):
     A celestial body located within the game.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_amount',
+        '_body_type',
+        '_material_type',
+        '_owner',
+        '_radius',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'amount': 'int',
+        'body_type': 'str',
+        'material_type': 'str',
+        'owner': 'games.stardash.player.Player',
+        'radius': 'float',
+        'x': 'float',
+        'y': 'float',
+    }
+
     def __init__(self):
         """Initializes a Body with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -24,6 +24,87 @@ class Game(BaseGame):
     Collect of the most of the rarest mineral orbiting aroung the sun and outcompete your competetor.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_bodies',
+        '_current_player',
+        '_current_turn',
+        '_dash_cost',
+        '_dash_distance',
+        '_game_objects',
+        '_genarium_value',
+        '_jobs',
+        '_legendarium_value',
+        '_max_asteroid',
+        '_max_turns',
+        '_min_asteroid',
+        '_mining_speed',
+        '_mythicite_amount',
+        '_orbits_protected',
+        '_ore_rarity_genarium',
+        '_ore_rarity_legendarium',
+        '_ore_rarity_rarium',
+        '_planet_energy_cap',
+        '_planet_recharge_rate',
+        '_players',
+        '_projectile_radius',
+        '_projectile_speed',
+        '_projectiles',
+        '_rarium_value',
+        '_regenerate_rate',
+        '_session',
+        '_ship_radius',
+        '_size_x',
+        '_size_y',
+        '_time_added_per_turn',
+        '_turns_to_orbit',
+        '_units',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'bodies': 'list[games.stardash.body.Body]',
+        'current_player': 'games.stardash.player.Player',
+        'current_turn': 'int',
+        'dash_cost': 'int',
+        'dash_distance': 'int',
+        'game_objects': 'dict[str, games.stardash.game_object.GameObject]',
+        'genarium_value': 'float',
+        'jobs': 'list[games.stardash.job.Job]',
+        'legendarium_value': 'float',
+        'max_asteroid': 'int',
+        'max_turns': 'int',
+        'min_asteroid': 'int',
+        'mining_speed': 'int',
+        'mythicite_amount': 'float',
+        'orbits_protected': 'int',
+        'ore_rarity_genarium': 'float',
+        'ore_rarity_legendarium': 'float',
+        'ore_rarity_rarium': 'float',
+        'planet_energy_cap': 'int',
+        'planet_recharge_rate': 'int',
+        'players': 'list[games.stardash.player.Player]',
+        'projectile_radius': 'int',
+        'projectile_speed': 'int',
+        'projectiles': 'list[games.stardash.projectile.Projectile]',
+        'rarium_value': 'float',
+        'regenerate_rate': 'float',
+        'session': 'str',
+        'ship_radius': 'int',
+        'size_x': 'int',
+        'size_y': 'int',
+        'time_added_per_turn': 'int',
+        'turns_to_orbit': 'int',
+        'units': 'list[games.stardash.unit.Unit]',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
@@ -16,6 +16,45 @@ class Player(GameObject):
     A player in this game. Every AI controls one player.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_client_type',
+        '_home_base',
+        '_lost',
+        '_money',
+        '_name',
+        '_opponent',
+        '_projectiles',
+        '_reason_lost',
+        '_reason_won',
+        '_time_remaining',
+        '_units',
+        '_victory_points',
+        '_won',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'client_type': 'str',
+        'home_base': 'games.stardash.body.Body',
+        'lost': 'bool',
+        'money': 'int',
+        'name': 'str',
+        'opponent': 'games.stardash.player.Player',
+        'projectiles': 'list[games.stardash.projectile.Projectile]',
+        'reason_lost': 'str',
+        'reason_won': 'str',
+        'time_remaining': 'float',
+        'units': 'list[games.stardash.unit.Unit]',
+        'victory_points': 'int',
+        'won': 'bool',
+    }
+
     def __init__(self):
         """Initializes a Player with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
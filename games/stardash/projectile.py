@@ -16,6 +16,31 @@ class Projectile(GameObject):
     Tracks any projectiles moving through space.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_energy',
+        '_fuel',
+        '_owner',
+        '_target',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'energy': 'int',
+        'fuel': 'int',
+        'owner': 'games.stardash.player.Player',
+        'target': 'games.stardash.unit.Unit',
+        'x': 'float',
+        'y': 'float',
+    }
+
     def __init__(self):
         """Initializes a Projectile with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,51 @@ class Unit(GameObject):
     A unit in the game. May be a corvette, missleboat, martyr, transport, miner.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_acted',
+        '_dash_x',
+        '_dash_y',
+        '_energy',
+        '_genarium',
+        '_is_busy',
+        '_job',
+        '_legendarium',
+        '_moves',
+        '_mythicite',
+        '_owner',
+        '_protector',
+        '_rarium',
+        '_shield',
+        '_x',
+        '_y',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'acted': 'bool',
+        'dash_x': 'float',
+        'dash_y': 'float',
+        'energy': 'int',
+        'genarium': 'int',
+        'is_busy': 'bool',
+        'job': 'games.stardash.job.Job',
+        'legendarium': 'int',
+        'moves': 'float',
+        'mythicite': 'int',
+        'owner': 'games.stardash.player.Player',
+        'protector': 'games.stardash.unit.Unit',
+        'rarium': 'int',
+        'shield': 'int',
+        'x': 'float',
+        'y': 'float',
+    }
+
     def __init__(self):
         """Initializes a Unit with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
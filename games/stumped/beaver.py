@@ -16,6 +16,39 @@ class Beaver(GameObject):
     A beaver in the game.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_actions',
+        '_branches',
+        '_food',
+        '_health',
+        '_job',
+        '_moves',
+        '_owner',
+        '_recruited',
+        '_tile',
+        '_turns_distracted',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'actions': 'int',
+        'branches': 'int',
+        'food': 'int',
+        'health': 'int',
+        'job': 'games.stumped.job.Job',
+        'moves': 'int',
+        'owner': 'games.stumped.player.Player',
+        'recruited': 'bool',
+        'tile': 'games.stumped.tile.Tile',
+        'turns_distracted': 'int',
+    }
+
     def __init__(self):
         """Initializes a Beaver with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -24,6 +24,57 @@ class Game(BaseGame):
     Gather branches and build up your lodge as beavers fight to survive.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_beavers',
+        '_current_player',
+        '_current_turn',
+        '_free_beavers_count',
+        '_game_objects',
+        '_jobs',
+        '_lodge_cost_constant',
+        '_lodges_to_win',
+        '_map_height',
+        '_map_width',
+        '_max_turns',
+        '_players',
+        '_session',
+        '_spawner',
+        '_spawner_harvest_constant',
+        '_spawner_types',
+        '_tiles',
+        '_time_added_per_turn',
+        'name',
+        '_game_object_classes',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'beavers': 'list[games.stumped.beaver.Beaver]',
+        'current_player': 'games.stumped.player.Player',
+        'current_turn': 'int',
+        'free_beavers_count': 'int',
+        'game_objects': 'dict[str, games.stumped.game_object.GameObject]',
+        'jobs': 'list[games.stumped.job.Job]',
+        'lodge_cost_constant': 'float',
+        'lodges_to_win': 'int',
+        'map_height': 'int',
+        'map_width': 'int',
+        'max_turns': 'int',
+        'players': 'list[games.stumped.player.Player]',
+        'session': 'str',
+        'spawner': 'list[games.stumped.spawner.Spawner]',
+        'spawner_harvest_constant': 'float',
+        'spawner_types': 'list[str]',
+        'tiles': 'list[games.stumped.tile.Tile]',
+        'time_added_per_turn': 'int',
+    }
+
     def __init__(self):
         """Initializes a Game with basic logic as provided by the Creer code generator."""
         BaseGame.__init__(self)
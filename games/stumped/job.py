@@ -16,6 +16,39 @@ class Job(GameObject):
     Information about a beaver's job.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_actions',
+        '_carry_limit',
+        '_chopping',
+        '_cost',
+        '_damage',
+        '_distraction_power',
+        '_health',
+        '_moves',
+        '_munching',
+        '_title',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'actions': 'int',
+        'carry_limit': 'int',
+        'chopping': 'int',
+        'cost': 'int',
+        'damage': 'int',
+        'distraction_power': 'int',
+        'health': 'int',
+        'moves': 'int',
+        'munching': 'int',
+        'title': 'str',
+    }
+
     def __init__(self):
         """Initializes a Job with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
@@ -16,6 +16,27 @@ class Spawner(GameObject):
     A resource spawner that generates branches or food.
     """
 
+    # attributes are stored in slots instead of a per instance __dict__, which
+    # makes game objects much smaller in memory
+    __slots__ = (
+        '_has_been_harvested',
+        '_health',
+        '_tile',
+        '_type',
+        # <<-- Creer-Merge: slots -->> - Code you add between this comment and the end comment will be preserved between Creer re-runs.
+        # if you add attributes to this class, add their names here
+        # <<-- /Creer-Merge: slots -->>
+    )
+
+    # the type of each attribute as the server describes it, for code that
+    # needs them without an instance, such as joueur.grid
+    _attribute_types = {
+        'has_been_harvested': 'bool',
+        'health': 'int',
+        'tile': 'games.stumped.tile.Tile',
+        'type': 'str',
+    }
+
     def __init__(self):
         """Initializes a Spawner with basic logic as provided by the Creer code generator."""
         GameObject.__init__(self)
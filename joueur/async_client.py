@@ -0,0 +1,362 @@
+# AsyncClient: an asyncio based client that talks to the server, so one python
+# process can play many games at once. Like the client module it performs no
+# game logic, it just moves events between the server, the game, and the AI
+import asyncio
+import contextvars
+import functools
+import importlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from joueur.serializer import serialize, deserialize
+from joueur.frame_decoder import FrameDecoder
+import joueur.codec as codec
+from joueur.game_manager import GameManager
+from joueur.utilities import camel_case_converter
+from joueur.client import EOT_BYTE, DEFAULT_BUFFER_SIZE
+from joueur.run import parse_server, game_module_name, play_data, print_lobbied
+import joueur.delta_mergeable
+import joueur.error_code as error_code
+import joueur.ansi_color_coder as color
+
+# the AsyncClient playing the game in the current task (or AI thread), so game
+# objects know which connection to run their functions on
+current_client = contextvars.ContextVar('current_client', default=None)
+joueur.delta_mergeable._current_async_client = current_client.get
+
+
+class ClientError(Exception):
+    """An error that ended a single game session.
+
+    Unlike the blocking client, which exits the whole process, an AsyncClient
+    raises these so the other sessions hosted by the process keep playing.
+    """
+
+    def __init__(self, code, message=None):
+        self.code = code
+        name = error_code._by_code.get(code, 'UNKNOWN ERROR {}'.format(code))
+        Exception.__init__(self, '{}: {}'.format(name, message) if message else name)
+
+
+class AsyncClient():
+    """A single connection to a game server, driven by asyncio streams.
+
+    AI callbacks written as coroutines are awaited on the event loop and can
+    use ``await game_object.run('functionName', ...)``. Regular AI callbacks
+    run on a thread dedicated to this client, where game object functions block
+    just like with the normal client.
+    """
+
+    def __init__(self, print_io=False, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.hostname = None
+        self.port = None
+        self.game = None
+        self.ai = None
+        self.manager = None
+        self.won = None
+        self.reason = None
+
+        self._print_io = print_io
+        self._buffer_size = int(buffer_size)
+        self._decoder = FrameDecoder()
+        self._events = deque()
+        self._reader = None
+        self._writer = None
+        self._loop = None
+        self._loop_thread = None
+        # callbacks only ever run one at a time, but game_updated can be
+        # called while run_turn's thread is blocked waiting on the server
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._read_lock = None
+        self._runs = deque()  # a future for the result of each run sent, oldest first
+        self._over = False
+
+    async def connect(self, hostname='localhost', port=3000):
+        self.hostname = hostname
+        self.port = int(port)
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._read_lock = asyncio.Lock()
+
+        print(color.text('cyan') + 'Connecting to:', self.hostname + ':' +
+              str(self.port) + color.reset())
+
+        try:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.hostname, self.port)
+        except OSError as e:
+            raise ClientError(
+                error_code.COULD_NOT_CONNECT,
+                'Could not connect to {}:{}'.format(self.hostname, self.port)
+            ) from e
+
+    def disconnect(self):
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        # no result can come back for runs still waiting, so they fail
+        # rather than block the AI threads waiting on them
+        while self._runs:
+            ran = self._runs.popleft()
+            if not ran.done():
+                ran.set_exception(ClientError(
+                    error_code.DISCONNECTED_UNEXPECTEDLY,
+                    'Disconnected while waiting to run a function on the server'))
+        self._executor.shutdown(wait=False)
+
+    # sends the server an event, it is flushed the next time we wait on it
+    def send(self, event, data):
+        encoded = codec.dumps({
+            'sentTime': int(time.time()),
+            'event': event,
+            'data': serialize(data)
+        }) + EOT_BYTE
+
+        if self._print_io:
+            print(color.text('magenta') + 'TO SERVER --> ' + str(encoded) +
+                  color.reset())
+        self._writer.write(encoded)
+
+    async def run(self, args):
+        """Plays a full game with the given (main.py style) args.
+
+        Returns:
+            bool: True if our AI won, False otherwise.
+        """
+        current_client.set(self)
+        parse_server(args)
+
+        await self.connect(args.server, args.port)
+        # the socket and AI threads are closed however the game ends, so a
+        # failed session doesn't leak them while others keep playing
+        try:
+            self.send('alias', args.game)
+            game_name = await self.wait_for_event('named')
+
+            module_str = game_module_name(game_name)
+            try:
+                module = importlib.import_module(module_str)
+            except ImportError as e:
+                raise ClientError(
+                    error_code.GAME_NOT_FOUND,
+                    'Could not import game module: "{}".'.format(module_str)
+                ) from e
+
+            self.game = module.Game()
+            self.ai = module.AI(self.game)
+            self.manager = GameManager(self.game)
+
+            self.ai.set_settings(args.ai_settings)
+
+            self.send('play', play_data(args, game_name, self.ai))
+            lobby_data = await self.wait_for_event('lobbied')
+            print_lobbied(lobby_data)
+
+            self.manager.set_constants(lobby_data['constants'])
+
+            start_data = await self.wait_for_event('start')
+
+            print(color.text('green') + 'Game is starting.' + color.reset())
+
+            self.ai.set_player(self.game.get_game_object(start_data['playerID']))
+            await self._call_ai('during game initialization', self.ai.start)
+            await self._call_ai('during game initialization', self.ai.game_updated)
+
+            await self.play()
+            return self.won
+        finally:
+            self.disconnect()
+
+    async def play(self):
+        await self.wait_for_event(None)
+
+    async def run_on_server(self, caller, function_name, args=None):
+        # the server answers runs in the order they were sent, so whichever
+        # coroutine reads a "ran" gives it to the oldest run. Nothing is held
+        # while other events are handled, so game_updated() can run functions
+        # of its own while this waits
+        ran = self._loop.create_future()
+        self._runs.append(ran)
+        self.send('run', {
+            'caller': caller,
+            'functionName': function_name,
+            'args': args
+        })
+
+        try:
+            while not ran.done():
+                sent = await self._next_event(until=ran)
+                if sent is not None:
+                    await self._auto_handle(sent['event'], sent['data'] if 'data' in sent else None)
+        except BaseException:
+            ran.cancel()  # nothing waits on it anymore, so its result is dropped when it comes
+            raise
+        return ran.result()
+
+    def run_on_server_threadsafe(self, caller, function_name, args=None):
+        """Runs a function on the server from the AI's thread, blocking it
+        until the result is back.
+        """
+        if threading.get_ident() == self._loop_thread:
+            raise RuntimeError(
+                'Game object functions cannot block the event loop, use '
+                '"await obj.run(\'{}\', ...)" from coroutines.'.format(
+                    function_name))
+
+        return asyncio.run_coroutine_threadsafe(
+            self.run_on_server(caller, function_name, args),
+            self._loop
+        ).result()
+
+    async def wait_for_event(self, event):
+        while not self._over:
+            sent = await self._next_event()
+            data = sent['data'] if 'data' in sent else None
+            if event is not None and sent['event'] == event:
+                return data
+            else:
+                await self._auto_handle(sent['event'], data)
+
+    async def _next_event(self, until=None):
+        # only one coroutine reads from the server at a time, and one waiting
+        # to read stops once what it was waiting for came in to another
+        async with self._read_lock:
+            if until is not None and until.done():
+                return None
+            return await self._read_event()
+
+    async def _read_event(self):
+        while not self._events:
+            await self._writer.drain()
+            received = await self._reader.read(self._buffer_size)
+            if not received:
+                raise ClientError(error_code.DISCONNECTED_UNEXPECTEDLY,
+                                  'The server closed the connection')
+
+            for frame in self._decoder.feed(received):
+                if self._print_io:
+                    print(color.text('magenta') + 'FROM SERVER <-- ' +
+                          frame.decode('utf-8', 'replace') + color.reset())
+
+                try:
+                    self._events.append(codec.loads(frame))
+                except ValueError as e:
+                    raise ClientError(
+                        error_code.MALFORMED_JSON,
+                        'Could not parse json "{}"'.format(
+                            frame.decode('utf-8', 'replace'))
+                    ) from e
+
+        return self._events.popleft()
+
+    # runs an AI callback, on the loop if it's a coroutine, otherwise on our AI
+    # thread so it can block on game object functions
+    async def _call_ai(self, doing, function, *args):
+        try:
+            if asyncio.iscoroutinefunction(function):
+                return await function(*args)
+
+            context = contextvars.copy_context()
+            return await self._loop.run_in_executor(
+                self._executor,
+                functools.partial(context.run, function, *args)
+            )
+        except ClientError:
+            raise
+        except Exception as e:
+            raise ClientError(error_code.AI_ERRORED,
+                              'AI errored {}'.format(doing)) from e
+
+    async def _auto_handle(self, event, data=None):
+        auto_handle_function = getattr(self, '_auto_handle_' + event, None)
+
+        if auto_handle_function is None:
+            raise ClientError(
+                error_code.UNKNOWN_EVENT_FROM_SERVER,
+                'Could not auto handle event "{}".'.format(event))
+
+        await auto_handle_function(data)
+
+    async def _auto_handle_delta(self, data):
+        try:
+            self.manager.apply_delta_state(data)
+        except Exception as e:
+            raise ClientError(error_code.DELTA_MERGE_FAILURE,
+                              'Error merging delta') from e
+
+        if self.ai.player:  # then the AI is ready for updates
+            await self._call_ai('while updating', self.ai.game_updated)
+
+    async def _auto_handle_order(self, data):
+        args = deserialize(data['args'], self.game)
+        callback = getattr(self.ai, camel_case_converter(data['name']), None)
+        if callback is None:
+            raise ClientError(
+                error_code.REFLECTION_FAILED,
+                'AI has no function "{}" to respond with.'.format(data['name']))
+
+        with self.ai._budgeting():
+            returned = await self._call_ai(
+                'executing order "{}"'.format(data['name']), callback, *args)
+
+        self.send('finished', {
+            'orderIndex': data['index'],
+            'returned': returned
+        })
+
+    async def _auto_handle_ran(self, data):
+        if not self._runs:
+            raise ClientError(error_code.UNKNOWN_EVENT_FROM_SERVER,
+                              'Got a "ran" event without having run anything')
+        ran = self._runs.popleft()
+        if not ran.done():
+            ran.set_result(deserialize(data, self.game))
+
+    async def _auto_handle_invalid(self, data):
+        await self._call_ai('while handling invalid data',
+                            self.ai.invalid, data['message'])
+
+    async def _auto_handle_fatal(self, data):
+        raise ClientError(
+            error_code.FATAL_EVENT,
+            'Got a fatal event from the server: ' + data['message'])
+
+    async def _auto_handle_over(self, data):
+        self._over = True
+        self.won = self.ai.player.won
+        self.reason = self.ai.player.reason_won \
+            if self.ai.player.won \
+            else self.ai.player.reason_lost
+
+        print('{}Game is Over. {} because {}{}'.format(
+            color.text('green'),
+            'I Won!' if self.won else 'I Lost :(',
+            self.reason,
+            color.reset()
+        ))
+
+        try:
+            await self._call_ai('during end', self.ai.end, self.won,
+                                self.reason)
+        finally:
+            if 'message' in data:
+                message = data['message'].replace('__HOSTNAME__',
+                                                  self.hostname)
+                print(color.text('cyan') + message + color.reset())
+
+            self.disconnect()
+
+
+async def run_sessions(args_list):
+    """Plays every game described by the list of (main.py style) args
+    concurrently, each on its own AsyncClient.
+
+    Returns:
+        list: for each session, True/False for if it was won, or the
+        ClientError (or other exception) that ended it.
+    """
+    return await asyncio.gather(
+        *(AsyncClient(args.print_io).run(args) for args in args_list),
+        return_exceptions=True
+    )
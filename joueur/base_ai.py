@@ -2,7 +2,127 @@
 from joueur.utilities import camel_case_converter
 import joueur.error_code as error_code
 import joueur.ansi_color_coder as color
+from contextlib import contextmanager
 import sys
+import time
+
+NANOSECONDS = 1000000000  # player.time_remaining and game.time_added_per_turn are in nanoseconds
+
+
+# @class TurnBudget: how much of the player's clock the current order can safely use
+class TurnBudget:
+    """A deadline for each order the AI runs, like run_turn() or make_move(),
+    worked out from how much time the player has left on their clock.
+
+    Each order gets an even share of the time left, spread over the turns
+    expected to remain, plus most of the time the server adds per turn. It
+    never gets more than the time left minus a safety margin, to leave time
+    for sending the order back to the server.
+    """
+
+    def __init__(self, turns_left=30, added_share=0.9, margin=0.25, min_seconds=0.01):
+        """Sets how the budget is worked out.
+
+        Args:
+            turns_left (int): how many more turns to plan for using the time left on
+            added_share (float): how much of the time added per turn each order can use, 0 to 1
+            margin (float): seconds to always leave on the clock
+            min_seconds (float): the smallest budget an order gets
+        """
+        self.turns_left = turns_left
+        self.added_share = added_share
+        self.margin = margin
+        self.min_seconds = min_seconds
+
+        self._started = None
+        self._seconds = 0.0
+        self._deadline = None
+        self._history = []
+
+    def start(self, time_remaining, time_added_per_turn=0):
+        """Starts the clock on an order.
+
+        Args:
+            time_remaining (float): nanoseconds left on the player's clock, player.time_remaining
+            time_added_per_turn (float): nanoseconds added each turn, game.time_added_per_turn
+        Returns:
+            float: seconds budgeted for this order
+        """
+        remaining = (time_remaining or 0) / NANOSECONDS
+        added = (time_added_per_turn or 0) / NANOSECONDS
+
+        seconds = remaining / max(self.turns_left, 1) + added * self.added_share
+        seconds = min(seconds, remaining - self.margin)
+
+        self._seconds = max(seconds, self.min_seconds)
+        self._started = time.perf_counter()
+        self._deadline = self._started + self._seconds
+        return self._seconds
+
+    def stop(self):
+        """Stops the clock on the current order, recording how long it took against its budget.
+
+        Returns:
+            float: seconds the order took
+        """
+        if self._started is None:
+            return 0.0
+
+        used = time.perf_counter() - self._started
+        self._history.append((self._seconds, used))
+        self._started = None
+        self._deadline = None
+        return used
+
+    @property
+    def seconds(self):
+        """The seconds budgeted for the current (or last) order.
+
+        :rtype: float
+        """
+        return self._seconds
+
+    @property
+    def deadline(self):
+        """The time.perf_counter() time the current order should be done by, or None if no order is running.
+
+        :rtype: float
+        """
+        return self._deadline
+
+    def elapsed(self):
+        """Gets the seconds since the current order started."""
+        return time.perf_counter() - self._started if self._started is not None else 0.0
+
+    def left(self):
+        """Gets the seconds left before the current order's deadline, which can be negative once it has passed."""
+        return self._deadline - time.perf_counter() if self._deadline is not None else 0.0
+
+    def out_of_time(self, reserve=0.0):
+        """Checks if the current order should stop working and return now.
+
+        Args:
+            reserve (float): seconds the caller still needs to wrap up, e.g. to send its moves
+        Returns:
+            bool: True once the deadline (less the reserve) has passed
+        """
+        return self._deadline is not None and time.perf_counter() + reserve >= self._deadline
+
+    @property
+    def history(self):
+        """The (budgeted seconds, used seconds) of every order that has finished, in order.
+
+        :rtype: list[tuple[float, float]]
+        """
+        return self._history
+
+    @property
+    def overruns(self):
+        """How many orders took longer than their budget.
+
+        :rtype: int
+        """
+        return sum(1 for budgeted, used in self._history if used > budgeted)
 
 
 # @class BaseAI: the basic AI functions that are the same between games
@@ -11,6 +131,7 @@ class BaseAI:
         self._game = game
         self._player = None
         self._settings = {}
+        self._budget = TurnBudget()
 
     def set_player(self, player):
         self._player = player
@@ -31,6 +152,24 @@ class BaseAI:
         """
         return self._player
 
+    @property
+    def budget(self):
+        """How much time the order being run (e.g. run_turn) can safely take, from the player's clock. Check `self.budget.out_of_time()` in long running loops.
+
+        :rtype: joueur.base_ai.TurnBudget
+        """
+        return self._budget
+
+    def out_of_time(self, reserve=0.0):
+        """Checks if the order being run (e.g. run_turn) should stop working and return now to stay within the player's clock.
+
+        Args:
+            reserve (float): seconds still needed to wrap up
+        Returns:
+            bool: True once the order's deadline has passed
+        """
+        return self._budget.out_of_time(reserve)
+
     def set_settings(self, ai_settings_str):
         if ai_settings_str:
             settings = ai_settings_str.split("&")
@@ -60,13 +199,28 @@ class BaseAI:
     def game_updated(self):
         pass
 
+    @contextmanager
+    def _budgeting(self):
+        """Runs the budget's clock for the order run inside it, so
+        self.budget has a deadline whichever client runs the order.
+        """
+        self._budget.start(
+            getattr(self._player, 'time_remaining', 0),
+            getattr(self._game, 'time_added_per_turn', 0)
+        )
+        try:
+            yield self._budget
+        finally:
+            self._budget.stop()
+
     # intended to be overridden by the AI class
     def _do_order(self, order, arguments):
         callback = getattr(self, camel_case_converter(order))
 
         if callback is not None:
             try:
-                return callback(*arguments)
+                with self._budgeting():
+                    return callback(*arguments)
             except:
                 error_code.handle_error(
                     error_code.AI_ERRORED,
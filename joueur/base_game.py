@@ -3,8 +3,43 @@ from joueur.delta_mergeable import DeltaMergeable
 
 # @class BaseGame: the basics of any game
 class BaseGame(DeltaMergeable):
+    __slots__ = ('_last_changes', '_grid', '_tile_graph')
+
     def __init__(self):
         DeltaMergeable.__init__(self)
+        self._last_changes = None
+        self._grid = None
+        self._tile_graph = None
+
+    @property
+    def last_changes(self):
+        """What the most recent delta state changed in the game, or None before the first one. Check this in `game_updated()`, which is called after every delta, to keep track of the game without re-scanning it.
+
+        :rtype: joueur.change_set.ChangeSet
+        """
+        return self._last_changes
+
+    @property
+    def grid(self):
+        """Every Tile's attributes as 2D NumPy arrays indexed [y, x], e.g. `game.grid.is_path` or `game.grid.unit_owner`, kept up to date after every delta. Built the first time it is used, and needs numpy installed. None for games without Tiles.
+
+        :rtype: joueur.grid.Grid
+        """
+        if self._grid is None and hasattr(self, '_tiles'):
+            from joueur.grid import Grid # only games that use it need numpy installed
+            self._grid = Grid(self)
+        return self._grid
+
+    @property
+    def tile_graph(self):
+        """The neighbors of every Tile as indexes into `tiles`, for searching the map with ints instead of Tiles. Built the first time it is used. None for games without Tiles.
+
+        :rtype: joueur.tile_graph.TileGraph
+        """
+        if self._tile_graph is None and hasattr(self, '_tiles'):
+            from joueur.tile_graph import TileGraph
+            self._tile_graph = TileGraph(self._tiles)
+        return self._tile_graph
 
     def get_game_object(self, id):
         """ gets the game object with the given id, or None
@@ -4,6 +4,8 @@ from joueur.delta_mergeable import DeltaMergeable
 # the base class that every game object within a game inherit from for Python
 # manipulation that would be redundant via Creer
 class BaseGameObject(DeltaMergeable):
+    __slots__ = ()
+
     def __init__(self):
         DeltaMergeable.__init__(self)
 
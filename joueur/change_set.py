@@ -0,0 +1,75 @@
+from joueur.base_game import BaseGame
+
+
+# @class ChangeSet: what a single delta state changed in the game, so AIs can update what they track instead of re-scanning everything
+class ChangeSet():
+    """The changes a single delta made to the game.
+
+    The most recent one is available as `game.last_changes` from within your
+    AI's `game_updated()`, which is called once for every delta.
+    """
+
+    def __init__(self):
+        self._created = []
+        self._removed = []
+        self._changed = {}
+
+    @property
+    def created(self):
+        """The game objects this delta created.
+
+        :rtype: list[BaseGameObject]
+        """
+        return self._created
+
+    @property
+    def removed(self):
+        """The game objects this delta removed from the game.
+
+        :rtype: list[BaseGameObject]
+        """
+        return self._removed
+
+    @property
+    def changed(self):
+        """Every game object (and the game itself) this delta changed, mapped to the names of its attributes that changed.
+
+        :rtype: dict[BaseGameObject, set[str]]
+        """
+        return self._changed
+
+    def attributes(self, obj):
+        """Gets the names of the attributes this delta changed on a game object or the game.
+
+        Args:
+            obj (BaseGameObject): the game object (or game) to check
+        Returns:
+            set[str]: the changed attribute names, e.g. {'x', 'tile'}, empty if it was not changed
+        """
+        return self._changed.get(obj, frozenset())
+
+    def objects(self, game_object_name=None):
+        """Gets the game objects this delta changed, not including the game.
+
+        Args:
+            game_object_name (Optional[str]): only get game objects of this type, e.g. 'Tile'
+        Returns:
+            list[BaseGameObject]: the changed game objects
+        """
+        return [
+            obj for obj in self._changed
+            if not isinstance(obj, BaseGame) and (
+                game_object_name is None or
+                obj.game_object_name == game_object_name
+            )
+        ]
+
+    def __contains__(self, obj):
+        return obj in self._changed
+
+    def __bool__(self):
+        return bool(self._created or self._removed or self._changed)
+
+    def __repr__(self):
+        return '<ChangeSet {} created, {} removed, {} changed>'.format(
+            len(self._created), len(self._removed), len(self._changed))
@@ -1,34 +1,51 @@
 import socket
+import selectors
+import signal
 import errno
 import sys
 import os
-import json
 import time
+from collections import deque
+from contextlib import contextmanager
 from joueur.serializer import serialize, deserialize
+from joueur.frame_decoder import FrameDecoder
+import joueur.codec as codec
 import joueur.error_code as error_code
 from joueur.game_manager import GameManager
 import joueur.ansi_color_coder as color
 
 EOT_CHAR = chr(4)
+EOT_BYTE = EOT_CHAR.encode('utf-8')
+
+# how many bytes to try to read off the socket at once; start of game deltas
+# can be several megabytes, so this is deliberately large
+DEFAULT_BUFFER_SIZE = 65536
 
 
 # Client: A singleton module that talks to the server receiving game
 # information and sending commands to execute. Clients perform no game logic
 class _Client:
     socket = None
+    _pipeline = None  # list of queued (frame, PendingResult) when pipelining
+    _flushing = False
+    profiler = None  # a joueur.profiler.TurnProfiler when timing turns
+    _capture = None  # the file every frame from the server is written to, when capturing
 
 _client = _Client()
 
 
-def connect(hostname='localhost', port=3000, print_io=False):
+def connect(hostname='localhost', port=3000, print_io=False,
+            buffer_size=DEFAULT_BUFFER_SIZE):
     _client.hostname = hostname
     _client.port = int(port)
 
     _client._print_io = print_io
-    _client._received_buffer = ""
-    _client._events_stack = []
-    _client._buffer_size = 1024
-    _client._timeout_time = 1.0
+    _client._decoder = FrameDecoder()
+    _client._events = deque()  # (time received, parsed event) in FIFO order
+    _client._buffer_size = int(buffer_size)
+    _client._recv_buffer = bytearray(_client._buffer_size)
+    _client._recv_view = memoryview(_client._recv_buffer)
+    _client.last_received_time = None
 
     print(color.text('cyan') + 'Connecting to:', _client.hostname + ':' + str(
         _client.port) + color.reset())
@@ -38,10 +55,6 @@ def connect(hostname='localhost', port=3000, print_io=False):
 
         # Silly Windows
         _client.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-
-        # so the blocking on recv doesn't hang forever and other system
-        # interrupts (e.g. keyboard) can be handled
-        _client.socket.settimeout(_client._timeout_time)
         _client.socket.connect((_client.hostname, _client.port))
     except socket.error as e:
         error_code.handle_error(
@@ -53,6 +66,34 @@ def connect(hostname='localhost', port=3000, print_io=False):
             )
         )
 
+    _client._selector = selectors.DefaultSelector()
+    _client._selector.register(_client.socket, selectors.EVENT_READ)
+    _setup_wakeup()
+
+
+# the selector blocks without a timeout, so signals (e.g. keyboard interrupts)
+# need a way to wake it up: the C level signal handler writes a byte into this
+# socket pair, which makes the select return and the python handler run
+def _setup_wakeup():
+    _client._wakeup_reader, _client._wakeup_writer = socket.socketpair()
+    _client._wakeup_reader.setblocking(False)
+    _client._wakeup_writer.setblocking(False)
+
+    try:
+        signal.set_wakeup_fd(_client._wakeup_writer.fileno())
+    except ValueError:
+        pass  # not the main thread, so signals can't be delivered here anyways
+
+    _client._selector.register(_client._wakeup_reader, selectors.EVENT_READ)
+
+
+def _drain_wakeup():
+    try:
+        while _client._wakeup_reader.recv(_client._buffer_size):
+            pass
+    except (BlockingIOError, InterruptedError):
+        pass
+
 
 def setup(game, ai, manager):
     _client.game = game
@@ -60,40 +101,213 @@ def setup(game, ai, manager):
     _client.manager = manager
 
 
+def set_profiler(profiler):
+    """Times each turn with a joueur.profiler.TurnProfiler, or stops timing if None."""
+    _client.profiler = profiler
+
+
+def capture(path):
+    """Writes every frame the server sends to a file, one JSON object per
+    line, e.g. to replay with joueur.mock_server or benchmarks.replay.
+    """
+    _client._capture = open(path, 'wb')
+
+
 def _send_raw(string):
     if _client._print_io:
         print(color.text('magenta') + 'TO SERVER --> ' + str(
             string) + color.reset())
-    _client.socket.send(string)
+    _client.socket.sendall(string)
+
+
+def _encode(event, data):
+    return codec.dumps({
+        'sentTime': int(time.time()),
+        'event': event,
+        'data': serialize(data)
+    }) + EOT_BYTE
 
 
 # sends the server an event via socket
 def send(event, data):
-    _send_raw(
-        (json.dumps({
-            'sentTime': int(time.time()),
-            'event': event,
-            'data': serialize(data)
-        }) + EOT_CHAR).encode('utf-8')
-    )
+    _send_raw(_encode(event, data))
 
 
 def disconnect(exit_code=None):
+    if _client._capture is not None:
+        _client._capture.close()
+        _client._capture = None
+
     if _client.socket:
         _client.socket.close()
 
+    if getattr(_client, '_selector', None):
+        try:
+            signal.set_wakeup_fd(-1)
+        except ValueError:
+            pass
+        _client._selector.close()
+        _client._wakeup_reader.close()
+        _client._wakeup_writer.close()
+        _client._selector = None
+
 
 def run_on_server(caller, function_name, args=None):
-    send('run', {
+    data = {
         'caller': caller,
         'functionName': function_name,
         'args': args
-    })
+    }
+
+    if _client._pipeline is not None:
+        pending = PendingResult(function_name)
+        _client._pipeline.append((_encode('run', data), pending))
+        return pending
+
+    profiler = _client.profiler
+    if profiler is not None:
+        sent_time = time.perf_counter()
+
+    send('run', data)
 
     ran_data = wait_for_event('ran')
+    if profiler is not None:
+        profiler.add_call(function_name, time.perf_counter() - sent_time)
     return deserialize(ran_data, _client.game)
 
 
+class PendingResult():
+    """The future result of a game object function called while pipelining.
+
+    The command has been queued, not sent. It is sent (along with every other
+    queued command) when the pipeline block ends, `flush()` is called, or its
+    value is needed via `result()` or a truth test such as `if unit.move(t):`.
+    """
+
+    def __init__(self, function_name):
+        self.function_name = function_name
+        self._done = False
+        self._value = None
+        self._error = None  # why it will never be sent, if it won't be
+
+    def done(self):
+        """bool: True if the server has already returned the value."""
+        return self._done
+
+    def result(self):
+        """Gets the value the server returned, sending every queued command
+        and waiting for their results first if need be.
+
+        Raises:
+            RuntimeError: if the command was dropped without being sent,
+                e.g. because its pipeline block raised
+        """
+        if self._error is not None:
+            raise RuntimeError('"{}" was never run: {}'.format(
+                self.function_name, self._error))
+        if not self._done:
+            if _client._flushing:
+                raise RuntimeError(
+                    'Cannot wait on "{}" while pipelined commands are being '
+                    'flushed (e.g. from game_updated).'.format(
+                        self.function_name))
+            flush()
+            if not self._done:
+                raise RuntimeError('"{}" was queued but never sent'.format(
+                    self.function_name))
+        return self._value
+
+    def __bool__(self):
+        return bool(self.result())
+
+    def __repr__(self):
+        return '<PendingResult {} {}>'.format(
+            self.function_name,
+            repr(self._value) if self._done else
+            'failed' if self._error is not None else 'pending'
+        )
+
+
+@contextmanager
+def pipeline():
+    """Pipelines game object functions called inside the with block.
+
+    Instead of waiting for the server after every command, commands are queued
+    and return a PendingResult. Queued commands are written to the server with
+    a single send, and their results are read back in the order they were
+    called. Because the game state is only updated as results come back, only
+    pipeline commands that don't depend on each other's effects, e.g. every
+    tower attacking.
+
+    Results are all resolved once the block is left. Reading one inside the
+    block, with result() or a truth test, first sends everything queued so
+    far and waits for all of their results. A result can't be read from
+    game_updated() while queued commands are being sent, as it may be one
+    that is still being waited on.
+
+    Games played by an AsyncClient run each command as it is called, so
+    nothing is pipelined and the block's commands return their values
+    rather than PendingResults. Code played by both clients should only use
+    results in truth tests, which work the same on both.
+
+    Example:
+        with joueur.client.pipeline():
+            results = [unit.attack(tile) for unit, tile in targets]
+        # every result is resolved once the with block is left
+    """
+    if _client._pipeline is not None:  # already pipelining, so just join in
+        yield
+        return
+
+    _client._pipeline = []
+    try:
+        yield
+        flush()
+    finally:
+        # if the block raised, what it queued is dropped, and must not later
+        # read as if the server had run it
+        queued = _client._pipeline or []
+        _client._pipeline = None
+        _abandon((pending for _, pending in queued), 'the pipeline block raised')
+
+
+def _abandon(pendings, reason):
+    for pending in pendings:
+        if not pending._done:
+            pending._error = reason
+
+
+def flush():
+    """Sends every queued pipelined command and waits for all their results."""
+    if _client._pipeline is None or _client._flushing:
+        return
+
+    _client._flushing = True
+    try:
+        # commands queued while waiting (e.g. from game_updated) are sent in
+        # the next batch, so results always come back in the order called
+        while _client._pipeline:
+            batch = _client._pipeline
+            _client._pipeline = []
+
+            _send_raw(b''.join(frame for frame, _ in batch))
+            profiler = _client.profiler
+            sent_time = time.perf_counter()
+
+            try:
+                for _, pending in batch:
+                    ran_data = wait_for_event('ran')
+                    if profiler is not None:  # each result's latency is from when the whole batch was sent
+                        profiler.add_call(pending.function_name, time.perf_counter() - sent_time)
+                    pending._value = deserialize(ran_data, _client.game)
+                    pending._done = True
+            except BaseException:
+                _abandon((pending for _, pending in batch), 'reading its result failed')
+                raise
+    finally:
+        _client._flushing = False
+
+
 def play():
     wait_for_event(None)
 
@@ -102,8 +316,8 @@ def wait_for_event(event):
     while True:
         wait_for_events()
 
-        while len(_client._events_stack) > 0:
-            sent = _client._events_stack.pop()
+        while _client._events:
+            _client.last_received_time, sent = _client._events.popleft()
             data = sent['data'] if 'data' in sent else None
             if event is not None and sent['event'] == event:
                 return data
@@ -111,52 +325,66 @@ def wait_for_event(event):
                 _auto_handle(sent['event'], data)
 
 
-# loops to check the socket for incoming data and ends once some events
-# get found
+# blocks on the socket (and the signal wakeup socket) until some complete
+# events have been received, queueing all of them in the order they were sent
 def wait_for_events():
-    if len(_client._events_stack) > 0:
+    if _client._events:
         return  # as we already have events to handle, no need to wait for more
 
     try:
         while True:
-            sent = None
-            try:
-                sent = _client.socket.recv(_client._buffer_size) \
-                    .decode('utf-8')
-            except socket.timeout:
-                pass  # timed out so keyboard/system interrupts can be handled,
-                #       hence the while true loop above
-            except socket.error as e:
-                error_code.handle_error(
-                    error_code.CANNOT_READ_SOCKET, e,
-                    'Error reading socket while waiting for events')
-
-            if not sent:
-                continue
-            elif _client._print_io:
-                print(color.text('magenta') + 'FROM SERVER <-- ' + str(
-                    sent) + color.reset())
-
-            split = (_client._received_buffer + sent).split(EOT_CHAR)
-            # the last item will either be "" if the last char was an EOT_CHAR,
-            #   or a partial data we need to buffer anyways
-            _client._received_buffer = split.pop()
-
-            for json_str in reversed(split):
-                try:
-                    parsed = json.loads(json_str)
-                except ValueError as e:
-                    error_code.handle_error(error_code.MALFORMED_JSON, e,
-                                            'Could not parse json ""'.format(
-                                                json_str)
-                                            )
-
-                _client._events_stack.append(parsed)
-
-            if len(_client._events_stack) > 0:
+            for key, _ in _client._selector.select():
+                if key.fileobj is _client._wakeup_reader:
+                    _drain_wakeup()
+                else:
+                    _read_socket()
+
+            if _client._events:
                 return
     except (KeyboardInterrupt, SystemExit):
         disconnect()
+        raise  # there is no socket left to wait on, so the client has to stop
+
+
+def _read_socket():
+    try:
+        received = _client.socket.recv_into(_client._recv_view)
+    except (BlockingIOError, InterruptedError):
+        return
+    except socket.error as e:
+        error_code.handle_error(
+            error_code.CANNOT_READ_SOCKET, e,
+            'Error reading socket while waiting for events')
+
+    if not received:
+        error_code.handle_error(
+            error_code.DISCONNECTED_UNEXPECTEDLY,
+            message='The server closed the connection')
+
+    received_time = time.perf_counter()
+    frames = _client._decoder.feed(_client._recv_view[:received])
+    profiler = _client.profiler
+
+    for frame in frames:
+        if _client._print_io:
+            print(color.text('magenta') + 'FROM SERVER <-- ' +
+                  frame.decode('utf-8', 'replace') + color.reset())
+
+        if _client._capture is not None:
+            _client._capture.write(frame + b'\n')
+
+        try:
+            parsed = codec.loads(frame)
+        except ValueError as e:
+            error_code.handle_error(error_code.MALFORMED_JSON, e,
+                                    'Could not parse json "{}"'.format(
+                                        frame.decode('utf-8', 'replace'))
+                                    )
+
+        _client._events.append((received_time, parsed))
+
+    if profiler is not None and frames:
+        profiler.add('parse', time.perf_counter() - received_time)
 
 
 # called via the client run loop when data is sent
@@ -173,18 +401,31 @@ def _auto_handle(event, data=None):
 
 
 def _auto_handle_delta(data):
+    profiler = _client.profiler
+    if profiler is not None:
+        start_time = time.perf_counter()
+
     try:
         _client.manager.apply_delta_state(data)
     except:
         error_code.handle_error(error_code.DELTA_MERGE_FAILURE, sys.exc_info(),
                                 'Error merging delta')
 
+    if profiler is not None:
+        merged_time = time.perf_counter()
+        profiler.add('merge', merged_time - start_time)
+
     if _client.ai.player:  # then the AI is ready for updates
         _client.ai.game_updated()
+        if profiler is not None:
+            profiler.add('game_updated', time.perf_counter() - merged_time)
 
 
 def _auto_handle_order(data):
     args = deserialize(data['args'], _client.game)
+    profiler = _client.profiler
+    if profiler is not None:
+        profiler.start_order(data['name'])
     try:
         returned = _client.ai._do_order(data['name'], args)
     except:
@@ -193,6 +434,9 @@ def _auto_handle_order(data):
                                 'AI errored executing order "{}"'.format(
                                     data.name))
 
+    if profiler is not None:
+        profiler.end_order()
+
     send("finished", {
         'orderIndex': data['index'],
         'returned': returned
@@ -237,5 +481,20 @@ def _auto_handle_over(data):
         message = data['message'].replace('__HOSTNAME__', _client.hostname)
         print(color.text('cyan') + message + color.reset())
 
+    if _client.profiler is not None:
+        _write_profile()
+
     disconnect()
     os._exit(0)
+
+
+def _write_profile():
+    try:
+        written = _client.profiler.write()
+    except OSError as e:
+        print('{}Could not write the turn profile: {}{}'.format(
+            color.text('yellow'), e, color.reset()))
+        return
+
+    print('{}Turn profile written to {}{}'.format(
+        color.text('cyan'), ', '.join(written), color.reset()))
@@ -0,0 +1,71 @@
+# Codec: encodes and decodes the JSON sent to and from the server, using the
+# fastest JSON library installed. orjson and ujson are optional, the standard
+# library's json is always there to fall back on. Set the JOUEUR_JSON
+# environment variable to "orjson", "ujson", or "json" to force one.
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj).encode('utf-8')
+
+
+def _json_dumps(obj):
+    return json.dumps(obj).encode('utf-8')
+
+
+# name -> (loads, dumps). loads takes UTF-8 bytes, dumps returns UTF-8 bytes
+_codecs = {}
+if orjson:
+    _codecs['orjson'] = (orjson.loads, _orjson_dumps)
+if ujson:
+    _codecs['ujson'] = (ujson.loads, _ujson_dumps)
+_codecs['json'] = (json.loads, _json_dumps)
+
+# fastest first
+PREFERRED = ['orjson', 'ujson', 'json']
+
+name = None
+loads = None
+dumps = None
+
+
+def available():
+    """Gets the names of every JSON library that can be used, fastest first."""
+    return [codec_name for codec_name in PREFERRED if codec_name in _codecs]
+
+
+def use(codec_name=None):
+    """Switches the JSON library used for all client I/O.
+
+    Args:
+        codec_name (Optional[str]): "orjson", "ujson", or "json". If not given
+        the fastest one installed is used.
+    """
+    global name, loads, dumps
+
+    if codec_name is None:
+        codec_name = available()[0]
+    elif codec_name not in _codecs:
+        raise ValueError('JSON library "{}" is not installed, use one of: {}'.format(
+            codec_name, ', '.join(available())))
+
+    name = codec_name
+    loads, dumps = _codecs[codec_name]
+
+
+use(os.environ.get('JOUEUR_JSON') or None)
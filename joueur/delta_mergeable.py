@@ -1,13 +1,43 @@
+# gets the AsyncClient playing the game in the current task (or AI thread), or
+# None. joueur.async_client replaces it when imported, so games played by the
+# blocking client never import it, or contextvars, which it needs
+def _current_async_client():
+    return None
+
+
 class DeltaMergeable():
     """a game or game object that needs to be delta merged"""
 
+    __slots__ = () # so the generated classes' __slots__ leave instances without a __dict__
+
     def __init__(self):
         pass
 
     def _run_on_server(self, function_name, **kwargs):
-        import joueur.client # avoid circular imports (sphinx won't build docs otherwise)
+        client = _current_async_client()
+        if client is not None: # then this game is being played by an AsyncClient, from an AI thread
+            return client.run_on_server_threadsafe(self, function_name, kwargs)
+
+        import joueur.client
         return joueur.client.run_on_server(self, function_name, kwargs)
 
+    async def run(self, function_name, **kwargs):
+        """Runs a function on the game server for this object, without blocking
+        the event loop. Only usable by AIs played via an AsyncClient.
+
+        Args:
+            function_name (str): The name of the function on the server, e.g. 'spawnUnit'.
+            kwargs: The arguments to the function, as named in its documentation.
+
+        Returns:
+            The value returned by the function, e.g. `await tile.run('spawnUnit', title='zombie')` is the same as `tile.spawn_unit('zombie')`.
+        """
+        client = _current_async_client()
+        if client is None:
+            raise RuntimeError('run() can only be awaited in games played via an AsyncClient')
+
+        return await client.run_on_server(self, function_name, kwargs)
+
     def __contains__(self, key):
         return hasattr(self, key)
 
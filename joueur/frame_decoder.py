@@ -0,0 +1,55 @@
+# FrameDecoder: incrementally splits the raw byte stream from the server into
+# complete EOT terminated frames, without re-copying already buffered data
+EOT_BYTE = b'\x04'
+
+
+class FrameDecoder():
+    """Buffers raw socket bytes and hands back complete frames.
+
+    Incoming bytes are appended to a single bytearray. Only the newly appended
+    region is scanned for the EOT byte, so a frame that arrives over many reads
+    costs linear time. Consumed bytes are trimmed off the front of the buffer
+    once every complete frame has been taken out of it.
+
+    Frames are handed back as the raw UTF-8 bytes, which JSON libraries can
+    parse directly without decoding them to a str first.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scan_offset = 0  # everything before this has no EOT in it
+
+    def __len__(self):
+        """The number of buffered bytes that are not part of a complete frame yet."""
+        return len(self._buffer)
+
+    def feed(self, data):
+        """Appends raw bytes (bytes, bytearray, or memoryview) to the buffer.
+
+        Returns:
+            list[bytes]: every frame completed by this data, without the EOT
+            byte, in the order they were sent.
+        """
+        buffer = self._buffer
+        buffer += data
+
+        frames = []
+        start = 0
+        end = buffer.find(EOT_BYTE, self._scan_offset)
+        if end != -1:
+            with memoryview(buffer) as view:  # so each frame is only copied once
+                while end != -1:
+                    frames.append(bytes(view[start:end]))
+                    start = end + 1
+                    end = buffer.find(EOT_BYTE, start)
+
+        if start:
+            del buffer[:start]
+        self._scan_offset = len(buffer)
+
+        return frames
+
+    def clear(self):
+        """Drops any partially received frame."""
+        del self._buffer[:]
+        self._scan_offset = 0
@@ -2,75 +2,167 @@ from joueur.delta_mergeable import DeltaMergeable
 from joueur.base_game_object import BaseGameObject
 from joueur.utilities import camel_case_converter
 from joueur.serializer import is_game_object_reference, is_object
+from joueur.change_set import ChangeSet
+import joueur.tile_graph
+
+# game or game object class -> {server key: (private attribute name, public attribute name, is attribute initialized)}
+# shared by every manager, as the classes (and so their attributes) never change
+_merge_plans = {}
+
+# list index keys from deltas, e.g. "12" -> 12, so they are only parsed once
+_list_indexes = {}
 
 # @class GameManager: managed the game and it's game objects including unserializing deltas
 class GameManager():
     def __init__(self, game):
         self.game = game
         self._game_object_classes = game._game_object_classes
+        self._tiled = hasattr(game, '_tiles')
 
     def set_constants(self, constants):
         self._server_constants = constants
         self._DELTA_REMOVED = constants['DELTA_REMOVED']
         self._DELTA_LIST_LENGTH = constants['DELTA_LIST_LENGTH']
 
-    ## applies a delta state (change in state information) to this game
+    ## applies a delta state (change in state information) to this game, returning the ChangeSet of what it changed (also stored as game.last_changes)
     def apply_delta_state(self, delta):
+        changes = ChangeSet()
+
         if 'gameObjects' in delta:
-            self._init_game_objects(delta['gameObjects'])
+            self._init_game_objects(delta['gameObjects'], changes)
+
+        self._merge_delta(self.game, delta, changes)
+
+        if changes._created or changes._removed:
+            changes._changed.setdefault(self.game, set()).add('game_objects')
 
-        self._merge_delta(self.game, delta)
+        self.game._last_changes = changes
+        if self._tiled:
+            joueur.tile_graph._invalidate(self.game, changes)
+        if self.game._grid is not None:
+            self.game._grid._update(changes)
+        return changes
 
     ## game objects can be refences in the delta states for cycles, they will all point to the game objects here.
-    def _init_game_objects(self, delta_game_objects):
+    def _init_game_objects(self, delta_game_objects, changes):
         for id, obj in delta_game_objects.items():
-            if not id in self.game._game_objects: # then we need to create it
-                self.game._game_objects[id] = self._game_object_classes[obj['gameObjectName']]()
-
-    ## Correctly apply a single change to a member of a list, dict, or object
-    def _set_member(self, state, state_key, value):
-        if isinstance(state_key, int) or isinstance(state, dict):
-            state[state_key] = value
-        else:
-            setattr(state, state_key, value)
-
-    ## recursively merges delta changes to the game.
-    def _merge_delta(self, state, delta):
-        delta_length = -1
-        if self._DELTA_LIST_LENGTH in delta:
-            delta_length = delta[self._DELTA_LIST_LENGTH]
-            del delta[self._DELTA_LIST_LENGTH] # we don't want to copy this key/value over to the state, it was just to signify it is an array
-
-        if delta_length > -1: # then this part in the state is an array
-            while len(state) > delta_length: # remove elements off the array to make it's size correct.
-                state.pop()
-            while len(state) < delta_length: # append elements on the array to make it's size correct.
-                state.append(None)
-
-        for key in delta: # deltas will always be objects when iterating through, arrays just have keys of numbers
-            d = delta[key]
-            state_key = key # array's keys are real numbers, not strings e.g. "1"
-            key_in_state = False
-
-            if isinstance(state, list):
-                state_key = int(key)
-                key_in_state = state_key < len(state)
-            else:
-                if isinstance(state, DeltaMergeable):
-                    state_key = "_" + camel_case_converter(state_key)
-                key_in_state = state_key in state
-
-            if d == self._DELTA_REMOVED:
-                if key_in_state:
-                    del state[state_key]
-            elif is_game_object_reference(d): # then this is a shallow reference to a game object
-                referenced_object = self.game.get_game_object(d['id'])
-                self._set_member(state, state_key, referenced_object)
-            elif is_object(d) and key_in_state and is_object(state[state_key]):
-                self._merge_delta(state[state_key], d)
-            elif not key_in_state and is_object(d):
-                if isinstance(d, dict):
-                    self._set_member(state, state_key, [] if self._DELTA_LIST_LENGTH in d else {})
-                    self._merge_delta(state[state_key], d)
-            else:
-                self._set_member(state, state_key, d)
+            if not id in self.game._game_objects and obj != self._DELTA_REMOVED: # then we need to create it
+                created = self._game_object_classes[obj['gameObjectName']]()
+                self.game._game_objects[id] = created
+                changes._created.append(created)
+
+    ## looks up the merge plan of a game or game object class for a server key, building it the first time that key is seen
+    def _plan_key(self, state, key):
+        plan = _merge_plans.get(state.__class__)
+        if plan is None:
+            plan = _merge_plans[state.__class__] = {}
+
+        planned = plan.get(key)
+        if planned is None:
+            name = camel_case_converter(key)
+            # every instance initializes the same attributes, so checking one is enough
+            planned = plan[key] = ("_" + name, name, hasattr(state, "_" + name))
+        return planned
+
+    ## merges delta changes to the game, walking nested deltas with an explicit stack instead of recursing. The delta itself is never modified.
+    ## Attributes of the game and game objects that are changed (directly, or in a container they hold) are recorded in changes.
+    def _merge_delta(self, state, delta, changes):
+        DELTA_REMOVED = self._DELTA_REMOVED
+        DELTA_LIST_LENGTH = self._DELTA_LIST_LENGTH
+        get_game_object = self.game.get_game_object
+        game_objects = self.game._game_objects
+        changed = changes._changed
+
+        stack = [(state, delta)]
+        while stack:
+            state, delta = stack.pop()
+
+            if isinstance(state, DeltaMergeable): # the plan knows the attribute for each key
+                names = []
+                for key, d in delta.items():
+                    state_key, name, key_in_state = self._plan_key(state, key)
+                    if state_key != '_game_objects': # the game objects themselves record what changed
+                        names.append(name)
+                    if not key_in_state: # not one of the class's attributes, but could have been added since
+                        key_in_state = hasattr(state, state_key)
+                        if not key_in_state and not hasattr(state, '__dict__'):
+                            continue # slotted classes can't hold attributes the server has but this game version does not
+
+                    if d == DELTA_REMOVED:
+                        if key_in_state:
+                            delattr(state, state_key)
+                    elif is_game_object_reference(d):
+                        setattr(state, state_key, get_game_object(d['id']))
+                    elif key_in_state and is_object(d) and is_object(getattr(state, state_key)):
+                        stack.append((getattr(state, state_key), d))
+                    elif not key_in_state and is_object(d):
+                        if isinstance(d, dict):
+                            container = [] if DELTA_LIST_LENGTH in d else {}
+                            setattr(state, state_key, container)
+                            stack.append((container, d))
+                    else:
+                        setattr(state, state_key, d)
+
+                # recorded once all keys are merged, as game objects hash on their id, which a new one only has now
+                if names:
+                    attributes = changed.get(state)
+                    if attributes is None:
+                        changed[state] = set(names)
+                    else:
+                        attributes.update(names)
+
+            elif isinstance(state, list): # keys are indexes, e.g. "1", along with the new length
+                length = delta.get(DELTA_LIST_LENGTH, -1)
+                if length > -1:
+                    if len(state) > length:
+                        del state[length:]
+                    elif len(state) < length:
+                        state.extend([None] * (length - len(state)))
+
+                for key, d in delta.items():
+                    if key == DELTA_LIST_LENGTH:
+                        continue # only signifies this is a list, not an element
+
+                    index = _list_indexes.get(key)
+                    if index is None:
+                        index = _list_indexes[key] = int(key)
+                    key_in_state = index < len(state)
+
+                    if d == DELTA_REMOVED:
+                        if key_in_state:
+                            del state[index]
+                    elif is_game_object_reference(d):
+                        state[index] = get_game_object(d['id'])
+                    elif key_in_state and is_object(d) and is_object(state[index]):
+                        stack.append((state[index], d))
+                    elif not key_in_state and is_object(d):
+                        if isinstance(d, dict):
+                            container = [] if DELTA_LIST_LENGTH in d else {}
+                            state[index] = container
+                            stack.append((container, d))
+                    else:
+                        state[index] = d
+
+            else: # a dict
+                for key, d in delta.items():
+                    if key == DELTA_LIST_LENGTH:
+                        continue
+
+                    key_in_state = key in state
+
+                    if d == DELTA_REMOVED:
+                        if key_in_state:
+                            if state is game_objects:
+                                changes._removed.append(state[key])
+                            del state[key]
+                    elif is_game_object_reference(d):
+                        state[key] = get_game_object(d['id'])
+                    elif key_in_state and is_object(d) and is_object(state[key]):
+                        stack.append((state[key], d))
+                    elif not key_in_state and is_object(d):
+                        if isinstance(d, dict):
+                            container = [] if DELTA_LIST_LENGTH in d else {}
+                            state[key] = container
+                            stack.append((container, d))
+                    else:
+                        state[key] = d
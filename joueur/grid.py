@@ -0,0 +1,198 @@
+# Grid: NumPy arrays mirroring the attributes of every Tile in games with a 2D
+# map, so AIs can ask questions of the whole map at once instead of looping
+# over game.tiles. Kept up to date by the GameManager after every delta.
+import numpy as np
+from joueur.base_game_object import BaseGameObject
+from joueur.utilities import attribute_types
+
+NO_ID = -1  # in reference columns, where the Tile's attribute is None
+
+_dtypes = {
+    'bool': np.bool_,
+    'int': np.int64,
+    'float': np.float64,
+}
+
+
+def id_of(game_object):
+    """The number a game object is stored as in reference columns.
+
+    Args:
+        game_object (Optional[BaseGameObject]): a game object, or None
+    Returns:
+        int: its id as an int, or NO_ID for None
+    """
+    return NO_ID if game_object is None else int(game_object.id)
+
+
+def _getter(name):
+    def value(tile):
+        return getattr(tile, name)
+    return value
+
+
+def _reference(name):
+    def value(tile):
+        return id_of(getattr(tile, name))
+    return value
+
+
+def _reference_owner(name):
+    def value(tile):
+        game_object = getattr(tile, name)
+        return NO_ID if game_object is None else id_of(game_object.owner)
+    return value
+
+
+# @class Grid: the Tiles of a game as 2D NumPy arrays, one per attribute
+class Grid():
+    """Every Tile attribute as a 2D NumPy array, indexed [y, x].
+
+    Boolean and number attributes are mirrored as they are, e.g.
+    `game.grid.is_path` or `game.grid.num_zombies`. Attributes that reference
+    another game object hold its id as an int, or NO_ID (-1) when None, e.g.
+    `game.grid.unit`. References to game objects that have an owner also get
+    their owner's id, e.g. `game.grid.unit_owner == grid.id_of(player)`.
+
+    Only the Tiles a delta changed are updated, so reading it is always cheap.
+    """
+
+    def __init__(self, game):
+        self._game = game
+        self._columns = {}  # name -> (array, function to get a Tile's value, tile attributes it depends on or None for all)
+        self._derived = {}  # name -> (dtype, function) added via add_field, kept when the map is rebuilt
+        self._build()
+
+    @property
+    def width(self):
+        """The number of Tiles across the map.
+
+        :rtype: int
+        """
+        return self._width
+
+    @property
+    def height(self):
+        """The number of Tiles down the map.
+
+        :rtype: int
+        """
+        return self._height
+
+    @property
+    def names(self):
+        """The names of every array in this grid.
+
+        :rtype: list[str]
+        """
+        return list(self._columns)
+
+    def __getattr__(self, name):
+        columns = self.__dict__.get('_columns')
+        if columns is not None and name in columns:
+            return columns[name][0]
+        raise AttributeError("Grid has no field '{}'".format(name))
+
+    def __getitem__(self, name):
+        return self._columns[name][0]
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def add_field(self, name, function, dtype=np.int64):
+        """Adds an array computed from each Tile, kept up to date whenever a Tile, or a game object on it, changes.
+
+        Args:
+            name (str): the name to get the array by, e.g. 'enemy_unit'
+            function (function): takes a Tile and returns its value
+            dtype (numpy.dtype): the type of the array's values
+        Returns:
+            numpy.ndarray: the new array
+        """
+        self._derived[name] = (dtype, function)
+        self._add_column(name, function, dtype, None)
+        return self._columns[name][0]
+
+    def tile_at(self, x, y):
+        """Gets the Tile the [y, x] element of every array mirrors.
+
+        Returns:
+            Tile: the Tile at (x, y)
+        """
+        return self._game.tiles[x + y * self._width]
+
+    def tiles_where(self, mask):
+        """Gets the Tiles where a boolean array is True, e.g. `grid.tiles_where(grid.is_gold_mine & (grid.unit == NO_ID))`.
+
+        Returns:
+            list[Tile]: the Tiles, in the same row-major order as game.tiles
+        """
+        tiles = self._game.tiles
+        return [tiles[i] for i in np.flatnonzero(mask)]
+
+    def _build(self):
+        game = self._game
+        self._width = game.map_width
+        self._height = game.map_height
+        if len(game.tiles) != self._width * self._height:
+            self._width = self._height = 0  # the map has not been sent yet
+
+        self._columns = {}
+        self._tile_columns = {}  # tile attribute -> names of the columns that depend on it
+
+        tile_class = game._game_object_classes['Tile']
+        for name, rtype in sorted(attribute_types(tile_class).items()):
+            if rtype in _dtypes:
+                self._add_column(name, _getter(name), _dtypes[rtype], (name,))
+            elif rtype.startswith('games.') and not rtype.endswith('.Tile'):
+                self._add_column(name, _reference(name), np.int64, (name,))
+                referenced_class = game._game_object_classes.get(rtype.rsplit('.', 1)[1])
+                if referenced_class is not None and hasattr(referenced_class, 'owner'):
+                    self._add_column(name + '_owner', _reference_owner(name), np.int64, None)
+
+        for name, (dtype, function) in self._derived.items():
+            self._add_column(name, function, dtype, None)
+
+    def _add_column(self, name, function, dtype, depends_on):
+        tiles = self._game.tiles if self._width else []
+        array = np.fromiter((function(tile) for tile in tiles), dtype=dtype, count=len(tiles))
+        self._columns[name] = (array.reshape(self._height, self._width), function, depends_on)
+        for attribute in (depends_on or ()):
+            self._tile_columns.setdefault(attribute, []).append(name)
+
+    ## updates the arrays for what a delta changed, called by the GameManager after each one is merged
+    def _update(self, changes):
+        game_attributes = changes.attributes(self._game)
+        if 'tiles' in game_attributes or 'map_width' in game_attributes or 'map_height' in game_attributes:
+            self._build()
+            return
+
+        if not self._width:
+            return
+
+        width = self._width
+        columns = self._columns
+        tile_columns = self._tile_columns
+        any_change = [name for name, column in columns.items() if column[2] is None]
+
+        changed_tiles = set()
+        for obj, attributes in changes.changed.items():
+            if not isinstance(obj, BaseGameObject):
+                continue
+            if obj.game_object_name == 'Tile':
+                index = obj.x + obj.y * width
+                for attribute in attributes:
+                    for name in tile_columns.get(attribute, ()):
+                        array, function, _ = columns[name]
+                        array.flat[index] = function(obj)
+                changed_tiles.add(obj)
+            elif any_change:
+                tile = getattr(obj, 'tile', None)  # e.g. a unit's owner can change without its Tile changing
+                if tile is not None:
+                    changed_tiles.add(tile)
+
+        for tile in changed_tiles:
+            index = tile.x + tile.y * width
+            for name in any_change:
+                array, function, _ = columns[name]
+                array.flat[index] = function(tile)
@@ -0,0 +1,313 @@
+# MockServer: a stand-in for a Cadre game server, so the client, the
+# GameManager, and the AIs can be played end to end with no network. It speaks
+# the same EOT framed JSON as the real server (alias/named, play/lobbied,
+# start, delta, order, run/ran, finished, over), but instead of running a game
+# it replays a Script of recorded or made up deltas, and answers each `run`
+# with a scripted response.
+#
+#   python3 -m joueur.mock_server captured.jsonl --port 3000
+#   python3 main.py Necrowar -s localhost:3000
+import argparse
+import collections
+import json
+import socket
+import socketserver
+import threading
+import time
+import joueur.codec as codec
+from joueur.frame_decoder import FrameDecoder, EOT_BYTE
+
+DEFAULT_CONSTANTS = {
+    'DELTA_REMOVED': '&RM',
+    'DELTA_LIST_LENGTH': '&LEN'
+}
+
+
+# @class Script: what a MockServer sends to each client that connects
+class Script():
+    """The frames of one game for a MockServer to replay.
+
+    The initial deltas are sent before the game starts, then each turn's
+    deltas are sent followed by its order (e.g. "runTurn"). While the client
+    works on an order every `run` it sends is answered, with the recorded
+    responses for that turn first and then by `respond`, until it sends back
+    `finished`. The final deltas, with who won and why, are sent just before
+    the game is over.
+    """
+
+    def __init__(self, game_name, player_id, initial_deltas, turns,
+                 constants=None, responses=None, over=None, recorded=None,
+                 final_deltas=None):
+        """Makes a script.
+
+        Args:
+            game_name (str): the name of the game, as the server names it, e.g. "Necrowar"
+            player_id (str): the id of the Player game object the client plays as
+            initial_deltas (list[dict]): the deltas sent before the game starts, the first creating every game object
+            turns (list[tuple[list[dict], dict]]): for each turn, the deltas to send then the order, e.g. {'name': 'runTurn', 'args': []}
+            constants (Optional[dict]): the delta constants sent when lobbied
+            responses (Optional[dict]): server function name -> what it returns, or a function that takes the run data and returns (list of deltas to send first, returned)
+            over (Optional[dict]): the data of the "over" event
+            recorded (Optional[dict]): turn index -> list of recorded (deltas, returned) to answer that turn's runs with, in order
+            final_deltas (Optional[list[dict]]): the deltas sent after the last turn, before "over"
+        """
+        self.game_name = game_name
+        self.player_id = player_id
+        self.initial_deltas = initial_deltas
+        self.turns = turns
+        self.constants = constants or DEFAULT_CONSTANTS
+        self.responses = responses or {}
+        self.over = over or {}
+        self.recorded = recorded or {}
+        self.final_deltas = final_deltas or []
+
+    def respond(self, run):
+        """Gets the server's response to a run that has no recorded response left.
+
+        Args:
+            run (dict): the data the client sent, with the caller, functionName, and args
+        Returns:
+            tuple: (list of deltas to send first, the value returned), which defaults to no deltas and True
+        """
+        response = self.responses.get(run['functionName'], True)
+        if callable(response):
+            return response(run)
+        return [], response
+
+    @classmethod
+    def from_captured(cls, path):
+        """Loads a script from server frames captured as JSON lines, one {"event", "data"} per line.
+
+        Deltas the server sent before a `ran` are replayed as the response to
+        the client's run; any other deltas go before the next order, or
+        before `over` after the last one.
+
+        Args:
+            path (str): the captured frames, e.g. from main.py --capture
+        Returns:
+            Script: replaying the capture
+        """
+        game_name = None
+        player_id = None
+        constants = None
+        initial_deltas = []
+        turns = []
+        recorded = {}
+        over = None
+        final_deltas = []
+        pending = []  # deltas not yet known to be for an order or a ran
+
+        with open(path, 'r') as captured:
+            for line in captured:
+                if not line.strip():
+                    continue
+                frame = json.loads(line)
+                event = frame['event']
+                data = frame.get('data')
+
+                if event == 'named':
+                    game_name = data
+                elif event == 'lobbied':
+                    constants = data['constants']
+                elif event == 'start':
+                    player_id = data['playerID']
+                    initial_deltas, pending = pending, []
+                elif event == 'delta':
+                    pending.append(data)
+                elif event == 'order':
+                    turns.append((pending, {'name': data['name'], 'args': data.get('args', [])}))
+                    pending = []
+                elif event == 'ran' and turns:
+                    recorded.setdefault(len(turns) - 1, []).append((pending, data))
+                    pending = []
+                elif event == 'over':
+                    over = data
+                    final_deltas, pending = pending, []
+
+        if game_name is None or player_id is None:
+            raise ValueError('"{}" does not have a named and start event'.format(path))
+
+        return cls(game_name, player_id, initial_deltas, turns, constants, over=over, recorded=recorded,
+                   final_deltas=final_deltas)
+
+
+class _Connection():
+    # one client playing through the script
+    def __init__(self, sock, script, stats):
+        self._socket = sock
+        self._script = script
+        self._decoder = FrameDecoder()
+        self._frames = collections.deque()
+        self._stats = stats
+        self._recorded = {turn: collections.deque(responses) for turn, responses in script.recorded.items()}
+
+    def _send(self, event, data=None):
+        frame = codec.dumps({'event': event, 'data': data}) + EOT_BYTE
+        self._socket.sendall(frame)
+        self._stats['frames_sent'] += 1
+        self._stats['bytes_sent'] += len(frame)
+
+    def _receive(self):
+        while not self._frames:
+            received = self._socket.recv(65536)
+            if not received:
+                raise ConnectionError('The client closed the connection')
+            self._stats['bytes_received'] += len(received)
+            self._frames.extend(codec.loads(frame) for frame in self._decoder.feed(received))
+        return self._frames.popleft()
+
+    def _expect(self, event):
+        frame = self._receive()
+        if frame['event'] != event:
+            raise ConnectionError('Expected "{}" from the client, got "{}"'.format(event, frame['event']))
+        return frame.get('data')
+
+    def play(self):
+        script = self._script
+        stats = self._stats
+
+        self._expect('alias')
+        self._send('named', script.game_name)
+
+        self._expect('play')
+        self._send('lobbied', {
+            'gameName': script.game_name,
+            'gameSession': 'mock',
+            'gameVersion': None,
+            'constants': script.constants,
+        })
+
+        for delta in script.initial_deltas:
+            self._send('delta', delta)
+        self._send('start', {'playerID': script.player_id})
+
+        started = time.perf_counter()
+        for turn, (deltas, order) in enumerate(script.turns):
+            for delta in deltas:
+                self._send('delta', delta)
+
+            order_sent = time.perf_counter()
+            self._send('order', {'name': order['name'], 'index': turn, 'args': order.get('args', [])})
+            while True:
+                frame = self._receive()
+                if frame['event'] == 'finished':
+                    break
+                if frame['event'] != 'run':
+                    raise ConnectionError('Unexpected "{}" from the client during an order'.format(frame['event']))
+
+                stats['runs'] += 1
+                recorded = self._recorded.get(turn)
+                deltas, returned = recorded.popleft() if recorded else script.respond(frame['data'])
+                for delta in deltas:
+                    self._send('delta', delta)
+                self._send('ran', returned)
+
+            stats['order_seconds'].append(time.perf_counter() - order_sent)
+
+        stats['turns'] = len(script.turns)
+        stats['seconds'] = time.perf_counter() - started
+        for delta in script.final_deltas:
+            self._send('delta', delta)
+        self._send('over', script.over)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        stats = {
+            'turns': 0,
+            'runs': 0,
+            'frames_sent': 0,
+            'bytes_sent': 0,
+            'bytes_received': 0,
+            'seconds': None,
+            'order_seconds': [],
+            'error': None,
+        }
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            _Connection(self.request, self.server.script, stats).play()
+        except (ConnectionError, OSError) as e:
+            stats['error'] = str(e)
+        finally:
+            with self.server.lock:
+                self.server.results.append(stats)
+                self.server.finished.notify_all()
+
+
+# @class MockServer: serves a Script to every client that connects, each in its own thread
+class MockServer(socketserver.ThreadingTCPServer):
+    """A local server that plays a Script with every client that connects.
+
+    Example:
+        server = MockServer(script, port=0)  # 0 picks a free port
+        server.start()
+        # run main.py (or an AsyncClient) against localhost:server.port
+        server.wait_for(1)
+        server.shutdown()
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, script, host='localhost', port=3000):
+        """Starts listening.
+
+        Args:
+            script (Script): what to play with each client
+            host (str): the hostname to listen on
+            port (int): the port to listen on, 0 to pick a free one
+        """
+        socketserver.ThreadingTCPServer.__init__(self, (host, port), _Handler)
+        self.script = script
+        self.results = []  # the stats of each finished game, in the order they finished
+        self.lock = threading.Lock()
+        self.finished = threading.Condition(self.lock)
+        self._thread = None
+
+    @property
+    def port(self):
+        """The port being listened on.
+
+        :rtype: int
+        """
+        return self.server_address[1]
+
+    def start(self):
+        """Serves from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def wait_for(self, games, timeout=None):
+        """Blocks until a number of games have finished.
+
+        Args:
+            games (int): how many games to wait for, counting ones already finished
+            timeout (Optional[float]): the most seconds to wait
+        Returns:
+            list[dict]: the stats of each finished game
+        """
+        with self.lock:
+            self.finished.wait_for(lambda: len(self.results) >= games, timeout)
+            return list(self.results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replays captured server frames to clients, as a stand-in game server.')
+    parser.add_argument('captured', help='server frames captured as JSON lines, e.g. by main.py --capture')
+    parser.add_argument('-s', '--server', default='localhost', help='the hostname to listen on')
+    parser.add_argument('-p', '--port', type=int, default=3000)
+    args = parser.parse_args()
+
+    server = MockServer(Script.from_captured(args.captured), args.server, args.port)
+    print('Replaying "{}" with {} turns on {}:{}'.format(
+        server.script.game_name, len(server.script.turns), args.server, server.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,411 @@
+# Pathfinding: searches over a TileGraph, working on tile indexes instead of
+# Tiles. Every search reuses the same preallocated arrays, so finding many
+# paths a turn does not allocate a dict or set per search.
+#
+# Every search takes a passable function, which takes a tile index and
+# returns if paths can go through it. The goal is always treated as passable,
+# so units can path to what they target. Paths are lists of the indexes to
+# step to in order, not including the start.
+import collections
+import heapq
+import weakref
+
+BFS = 'bfs'
+ASTAR = 'astar'
+BIDIRECTIONAL = 'bidirectional'
+
+
+def _walk_back(parents, end):
+    # the path from the start (the index whose parent is -1) to end, not including the start
+    path = []
+    while parents[end] != -1:
+        path.append(end)
+        end = parents[end]
+    path.reverse()
+    return path
+
+
+# @class AStar: A* search over a TileGraph, reusable for any number of searches
+class AStar():
+    """A* search from one tile index to another, moving one tile per step.
+
+    The scores, parents, and closed set are flat lists the size of the map,
+    allocated once. Instead of being cleared before every search, each entry
+    is stamped with the search's generation, and entries with an older stamp
+    are treated as empty.
+    """
+
+    def __init__(self, graph):
+        """Allocates the arrays for searching a map.
+
+        Args:
+            graph (TileGraph): the map to search, e.g. game.tile_graph
+        """
+        size = len(graph)
+        self._graph = graph
+        self._xs = [tile.x for tile in graph.tiles]
+        self._ys = [tile.y for tile in graph.tiles]
+        self._g_scores = [0] * size
+        self._parents = [-1] * size
+        self._seen = [0] * size  # generation the g score and parent were set in
+        self._closed = [0] * size  # generation the index was expanded in
+        self._generation = 0
+
+    @property
+    def graph(self):
+        """The map this searches.
+
+        :rtype: joueur.tile_graph.TileGraph
+        """
+        return self._graph
+
+    def distance(self, index, goal):
+        """The Manhattan distance between two tile indexes, the default heuristic."""
+        return abs(self._xs[index] - self._xs[goal]) + abs(self._ys[index] - self._ys[goal])
+
+    def search(self, start, goal, passable=None, heuristic=None, partial=False):
+        """Finds a shortest path between two tile indexes.
+
+        Args:
+            start (int): the index of the tile to start from
+            goal (int): the index of the tile to get to, which is always
+                treated as passable so units can path to what they target
+            passable (Optional[function]): takes a tile index and returns if
+                the path can go through it, if not given every tile can be
+            heuristic (Optional[function]): takes a tile index and the goal
+                index and returns a lower bound of the steps between them,
+                Manhattan distance if not given
+            partial (bool): if the goal cannot be reached, return the path to
+                the reachable tile closest to it instead of None
+        Returns:
+            Optional[list[int]]: the indexes of the tiles to step to in order,
+            not including start, or None if there is no path
+        """
+        self._generation += 1
+        generation = self._generation
+        adjacency = self._graph.adjacency
+        g_scores = self._g_scores
+        parents = self._parents
+        seen = self._seen
+        closed = self._closed
+
+        if heuristic is None:
+            xs = self._xs
+            ys = self._ys
+            goal_x = xs[goal]
+            goal_y = ys[goal]
+        else:
+            xs = None
+
+        seen[start] = generation
+        g_scores[start] = 0
+        parents[start] = -1
+        start_h = (abs(self._xs[start] - self._xs[goal]) + abs(self._ys[start] - self._ys[goal])) if xs else heuristic(start, goal)
+        open_heap = [(start_h, start_h, start)]  # (f, h, index), ties go to the tile closer to the goal
+        closest, closest_h = start, start_h
+
+        while open_heap:
+            _, h, current = heapq.heappop(open_heap)
+            if closed[current] == generation:
+                continue  # already expanded via a shorter path
+            if current == goal:
+                return self._path(goal)
+
+            closed[current] = generation
+            if h < closest_h:
+                closest, closest_h = current, h
+
+            score = g_scores[current] + 1
+            for neighbor in adjacency[current]:
+                if closed[neighbor] == generation:
+                    continue
+                if neighbor != goal and passable is not None and not passable(neighbor):
+                    continue
+                if seen[neighbor] != generation or score < g_scores[neighbor]:
+                    seen[neighbor] = generation
+                    g_scores[neighbor] = score
+                    parents[neighbor] = current
+                    h = (abs(xs[neighbor] - goal_x) + abs(ys[neighbor] - goal_y)) if xs else heuristic(neighbor, goal)
+                    heapq.heappush(open_heap, (score + h, h, neighbor))
+
+        if partial and closest != start:
+            return self._path(closest)
+        return None
+
+    def _path(self, end):
+        return _walk_back(self._parents, end)
+
+
+# @class BreadthFirstSearch: breadth first search over a TileGraph, reusable for any number of searches
+class BreadthFirstSearch():
+    """Breadth first search from one tile index to another, which finds a
+    shortest path when every step costs the same.
+
+    Like AStar, the parents and visited set are flat lists allocated once and
+    stamped with each search's generation instead of being cleared.
+    """
+
+    def __init__(self, graph):
+        """Allocates the arrays for searching a map.
+
+        Args:
+            graph (TileGraph): the map to search, e.g. game.tile_graph
+        """
+        size = len(graph)
+        self._graph = graph
+        self._parents = [-1] * size
+        self._seen = [0] * size
+        self._generation = 0
+
+    @property
+    def graph(self):
+        """The map this searches.
+
+        :rtype: joueur.tile_graph.TileGraph
+        """
+        return self._graph
+
+    def search(self, start, goal, passable=None):
+        """Finds a shortest path between two tile indexes.
+
+        Returns:
+            Optional[list[int]]: the indexes of the tiles to step to in order, or None if there is no path
+        """
+        if start == goal:
+            return []
+
+        self._generation += 1
+        generation = self._generation
+        adjacency = self._graph.adjacency
+        parents = self._parents
+        seen = self._seen
+
+        seen[start] = generation
+        parents[start] = -1
+        fringe = collections.deque((start,))
+
+        while fringe:
+            current = fringe.popleft()
+            for neighbor in adjacency[current]:
+                if seen[neighbor] == generation:
+                    continue
+                if neighbor == goal:
+                    parents[neighbor] = current
+                    return _walk_back(parents, goal)
+                if passable is None or passable(neighbor):
+                    seen[neighbor] = generation
+                    parents[neighbor] = current
+                    fringe.append(neighbor)
+
+        return None
+
+
+# @class BidirectionalSearch: breadth first search from both ends at once, reusable for any number of searches
+class BidirectionalSearch():
+    """Breadth first search out from the start and the goal at the same time,
+    always growing the smaller side by a whole level, until they meet.
+
+    On open maps this visits far fewer tiles than searching from one end, as
+    each side only has to reach about half way.
+    """
+
+    def __init__(self, graph):
+        """Allocates the arrays for searching a map.
+
+        Args:
+            graph (TileGraph): the map to search, e.g. game.tile_graph
+        """
+        size = len(graph)
+        self._graph = graph
+        self._parents = ([-1] * size, [-1] * size)  # from the start, from the goal
+        self._depths = ([0] * size, [0] * size)
+        self._seen = ([0] * size, [0] * size)
+        self._generation = 0
+
+    @property
+    def graph(self):
+        """The map this searches.
+
+        :rtype: joueur.tile_graph.TileGraph
+        """
+        return self._graph
+
+    def search(self, start, goal, passable=None):
+        """Finds a shortest path between two tile indexes.
+
+        Returns:
+            Optional[list[int]]: the indexes of the tiles to step to in order, or None if there is no path
+        """
+        if start == goal:
+            return []
+
+        self._generation += 1
+        generation = self._generation
+        adjacency = self._graph.adjacency
+
+        for side, end in enumerate((start, goal)):
+            self._seen[side][end] = generation
+            self._parents[side][end] = -1
+            self._depths[side][end] = 0
+        fringes = ([start], [goal])
+
+        while fringes[0] and fringes[1]:
+            side = 0 if len(fringes[0]) <= len(fringes[1]) else 1
+            parents, depths, seen = self._parents[side], self._depths[side], self._seen[side]
+            other_depths, other_seen = self._depths[1 - side], self._seen[1 - side]
+
+            # grow the whole level, then take the shortest way through any tile where the sides met
+            meeting = None
+            meeting_length = None
+            level = []
+            for current in fringes[side]:
+                depth = depths[current] + 1
+                for neighbor in adjacency[current]:
+                    if seen[neighbor] == generation:
+                        continue
+                    if other_seen[neighbor] == generation:
+                        length = depth + other_depths[neighbor]
+                        if meeting is None or length < meeting_length:
+                            meeting, meeting_length = neighbor, length
+                            parents[neighbor] = current
+                            depths[neighbor] = depth
+                        continue
+                    if passable is None or passable(neighbor):
+                        seen[neighbor] = generation
+                        parents[neighbor] = current
+                        depths[neighbor] = depth
+                        level.append(neighbor)
+
+            if meeting is not None:
+                path = _walk_back(self._parents[0], meeting)  # the start's side, up to and including the meeting tile
+                toward_goal = self._parents[1]
+                while toward_goal[meeting] != -1:  # then the goal's side, which points back to the goal
+                    meeting = toward_goal[meeting]
+                    path.append(meeting)
+                return path
+
+            fringes = (level, fringes[1]) if side == 0 else (fringes[0], level)
+
+        return None
+
+
+# @class SearchTree: a breadth first search tree from one start, grown only as far as each query needs
+class SearchTree():
+    """Shortest paths from one start tile to any number of goals.
+
+    The tree is grown breadth first only until it reaches the goal asked for,
+    and remembers everything it has explored, so later queries for nearer
+    tiles are answered without searching and farther ones pick up where the
+    last one stopped. Build a new tree when passability changes.
+    """
+
+    def __init__(self, graph, start, passable=None):
+        """Starts a tree.
+
+        Args:
+            graph (TileGraph): the map to search, e.g. game.tile_graph
+            start (int): the index of the tile every path starts from
+            passable (Optional[function]): takes a tile index and returns if paths can go through it
+        """
+        self._graph = graph
+        self._start = start
+        self._passable = passable
+        self._parents = {start: -1}
+        self._blocked = {}  # tiles paths can't go through, but can end at -> the tile first reached from
+        self._fringe = collections.deque((start,))
+
+    @property
+    def start(self):
+        """The index of the tile every path starts from.
+
+        :rtype: int
+        """
+        return self._start
+
+    def path_to(self, goal):
+        """Finds a shortest path from the start to a tile index.
+
+        Returns:
+            Optional[list[int]]: the indexes of the tiles to step to in order, or None if there is no path
+        """
+        parents = self._parents
+        if goal not in parents and goal not in self._blocked:
+            self._grow_until(goal)
+
+        if goal in parents:
+            return _walk_back(parents, goal)
+        if goal in self._blocked:
+            return _walk_back(parents, self._blocked[goal]) + [goal]
+        return None
+
+    def _grow_until(self, goal):
+        adjacency = self._graph.adjacency
+        passable = self._passable
+        parents = self._parents
+        blocked = self._blocked
+        fringe = self._fringe
+
+        while fringe:
+            current = fringe.popleft()
+            for neighbor in adjacency[current]:
+                if neighbor in parents or neighbor in blocked:
+                    continue
+                if passable is None or passable(neighbor):
+                    parents[neighbor] = current
+                    fringe.append(neighbor)
+                else:
+                    blocked[neighbor] = current
+
+            if goal in parents or goal in blocked:
+                return
+
+
+# the searches of each TileGraph, so their arrays are allocated once per map
+_searches = weakref.WeakKeyDictionary()
+
+_algorithms = {
+    BFS: BreadthFirstSearch,
+    ASTAR: AStar,
+    BIDIRECTIONAL: BidirectionalSearch,
+}
+
+
+def search_for(graph, algorithm=BFS):
+    """Gets the search for a map, allocating it the first time.
+
+    Args:
+        graph (TileGraph): the map to search, e.g. game.tile_graph
+        algorithm (str): BFS, ASTAR, or BIDIRECTIONAL
+    Returns:
+        BreadthFirstSearch, AStar, or BidirectionalSearch: the search, reused for every call with the same graph
+    """
+    searches = _searches.get(graph)
+    if searches is None:
+        searches = _searches[graph] = {}
+
+    search = searches.get(algorithm)
+    if search is None:
+        search = searches[algorithm] = _algorithms[algorithm](graph)
+    return search
+
+
+def find_path(game, start, goal, passable=None, algorithm=BFS):
+    """Finds a shortest path between two Tiles of a game.
+
+    Args:
+        game (BaseGame): a game with tiles
+        start (Tile): the Tile to start from
+        goal (Tile): the Tile to get to
+        passable (Optional[function]): takes a Tile and returns if paths can go through it, e.g. `lambda tile: tile.is_pathable()`
+        algorithm (str): BFS, ASTAR, or BIDIRECTIONAL, which all find a shortest path
+    Returns:
+        list[Tile]: the Tiles to step to in order, the last being the goal, or an empty list if there is no path (or start is goal)
+    """
+    graph = game.tile_graph
+    tiles = graph.tiles
+    is_passable = None
+    if passable is not None:
+        is_passable = lambda index: passable(tiles[index])
+
+    path = search_for(graph, algorithm).search(graph.index_of(start), graph.index_of(goal), is_passable)
+    return [tiles[index] for index in path] if path else []
@@ -0,0 +1,183 @@
+# Profiler: where the time of each turn goes, for the --profile flag of
+# main.py. The client times parsing what the server sent, merging deltas,
+# game_updated(), each order the AI runs (e.g. run_turn), and each command
+# sent to the server by its function name. At the end of the game the times
+# are written out as JSON, or as CSV if the report path ends in ".csv".
+#
+# The client only calls in here when a profiler is set, so playing without
+# --profile costs nothing extra. Only the blocking client (joueur/client.py)
+# is profiled; main.py refuses --profile and --profileAI with --async.
+import cProfile
+import csv
+import json
+import os
+import time
+
+PHASES = ('parse', 'merge', 'game_updated', 'ai', 'server')
+
+TURN_FIELDS = ('turn', 'order', 'seconds') + PHASES + ('server_calls', 'logic')
+CALL_FIELDS = ('function', 'count', 'total', 'mean', 'max')
+
+
+# @class TurnProfiler: timing spans for each turn, and the latency of each server command
+class TurnProfiler():
+    """Times each phase of each turn.
+
+    A turn is everything up to and including an order from the server, so the
+    deltas parsed and merged since the last order count toward it. The "ai"
+    phase is the whole order, including waiting on the server for commands
+    it ran ("server"), and "logic" is the ai time spent outside of them.
+    Deltas merged while waiting on a command are timed both as "merge" and
+    as part of "server".
+    """
+
+    def __init__(self, report_path, cprofile_path=None):
+        """Starts profiling.
+
+        Args:
+            report_path (Optional[str]): where to write the report, as JSON or as CSV if it ends in ".csv", or None to only write the cProfile stats
+            cprofile_path (Optional[str]): if given, every order is run under cProfile and its stats dumped here, for pstats or snakeviz
+        """
+        self.report_path = report_path
+        self.cprofile_path = cprofile_path
+        self._cprofile = cProfile.Profile() if cprofile_path else None
+        self._turns = []
+        self._turn = None
+        self._calls = {}  # server function name -> [count, total seconds, max seconds]
+        self._order = None
+        self._order_start = None
+
+    def _current(self):
+        if self._turn is None:
+            self._turn = dict.fromkeys(PHASES, 0.0)
+            self._turn['server_calls'] = 0
+        return self._turn
+
+    def add(self, phase, seconds):
+        """Adds time spent in a phase to the current turn.
+
+        Args:
+            phase (str): one of PHASES
+            seconds (float): how long it took
+        """
+        self._current()[phase] += seconds
+
+    def add_call(self, function_name, seconds):
+        """Records a command run on the server, and how long its result took to come back.
+
+        Args:
+            function_name (str): the function run on the server, e.g. "move"
+            seconds (float): from sending the command to receiving its result
+        """
+        turn = self._current()
+        turn['server'] += seconds
+        turn['server_calls'] += 1
+
+        stats = self._calls.get(function_name)
+        if stats is None:
+            self._calls[function_name] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+
+    def start_order(self, order):
+        """Starts timing an order from the server, e.g. "runTurn"."""
+        self._current()
+        self._order = order
+        self._order_start = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def end_order(self):
+        """Stops timing the current order, which ends the turn."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+        turn = self._current()
+        turn['ai'] += time.perf_counter() - self._order_start
+        turn['turn'] = len(self._turns)
+        turn['order'] = self._order
+        turn['seconds'] = turn['parse'] + turn['merge'] + turn['game_updated'] + turn['ai']
+        turn['logic'] = turn['ai'] - turn['server']
+        self._turns.append(turn)
+        self._turn = None
+
+    @property
+    def turns(self):
+        """The timings of each finished turn, in order.
+
+        :rtype: list[dict]
+        """
+        return self._turns
+
+    def calls(self):
+        """Gets the count and latency of every function run on the server, slowest in total first.
+
+        Returns:
+            list[dict]: with the function name, count, and total, mean, and max seconds
+        """
+        return [
+            {
+                'function': name,
+                'count': count,
+                'total': total,
+                'mean': total / count,
+                'max': longest,
+            }
+            for name, (count, total, longest) in sorted(self._calls.items(), key=lambda item: -item[1][1])
+        ]
+
+    def totals(self):
+        """Gets the seconds spent in each phase over every turn.
+
+        Returns:
+            dict[str, float]: phase -> seconds
+        """
+        return {phase: sum(turn[phase] for turn in self._turns) for phase in PHASES}
+
+    def report(self):
+        """Gets everything recorded, as written to a JSON report.
+
+        Returns:
+            dict: the totals, per function server calls, and each turn
+        """
+        return {
+            'totals': self.totals(),
+            'calls': self.calls(),
+            'turns': self._turns,
+        }
+
+    def write(self):
+        """Writes the report, and the cProfile stats if profiling orders.
+
+        A CSV report has a row per turn, and the server calls are written
+        next to it, e.g. "profile.csv" and "profile.calls.csv".
+
+        Returns:
+            list[str]: the paths written
+        """
+        written = []
+        if self.report_path is not None and self.report_path.lower().endswith('.csv'):
+            calls_path = os.path.splitext(self.report_path)[0] + '.calls.csv'
+            _write_csv(self.report_path, TURN_FIELDS, self._turns)
+            _write_csv(calls_path, CALL_FIELDS, self.calls())
+            written += [self.report_path, calls_path]
+        elif self.report_path is not None:
+            with open(self.report_path, 'w') as report:
+                json.dump(self.report(), report, indent=2)
+            written.append(self.report_path)
+
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(self.cprofile_path)
+            written.append(self.cprofile_path)
+
+        return written
+
+
+def _write_csv(path, fields, rows):
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
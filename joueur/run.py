@@ -1,5 +1,6 @@
 import importlib.util
 import joueur.client
+import joueur.profiler
 import sys
 import joueur.error_code as error_code
 from joueur.game_manager import GameManager
@@ -8,16 +9,24 @@ import joueur.ansi_color_coder as color
 
 
 def run(args):
-    split_server = args.server.split(":")
-    args.server = split_server[0]
-    args.port = int((len(split_server) == 2 and split_server[1])) or args.port
+    if getattr(args, 'use_async', False):
+        run_async(args)
+        return
+
+    parse_server(args)
+
+    if args.profile or args.profile_ai:
+        joueur.client.set_profiler(joueur.profiler.TurnProfiler(
+            args.profile, args.profile_ai))
 
     joueur.client.connect(args.server, args.port, args.print_io)
+    if args.capture:
+        joueur.client.capture(args.capture)
 
     joueur.client.send("alias", args.game)
     game_name = joueur.client.wait_for_event("named")
 
-    module_str = "games." + camel_case_converter(game_name)
+    module_str = game_module_name(game_name)
 
     spec = importlib.util.find_spec(module_str)
     if spec is None:
@@ -54,15 +63,7 @@ def run(args):
 
     ai.set_settings(args.ai_settings)
 
-    joueur.client.send("play", {
-        'gameName': game_name,
-        'password': args.password,
-        'requestedSession': args.session,
-        'clientType': "Python",
-        'playerName': args.name or ai.get_name() or "Python Player",
-        'playerIndex': args.index,
-        'gameSettings': args.game_settings
-    })
+    joueur.client.send("play", play_data(args, game_name, ai))
 
     lobby_data = joueur.client.wait_for_event("lobbied")
 
@@ -79,13 +80,7 @@ Version mismatch means that unexpected crashes may happen due to differing game
         )
     )
 
-    print('{}In Lobby for game "{}" in session "{}".{}'.format(
-            color.text("cyan"),
-            lobby_data['gameName'],
-            lobby_data['gameSession'],
-            color.reset()
-        )
-    )
+    print_lobbied(lobby_data)
 
     manager.set_constants(lobby_data['constants'])
 
@@ -105,3 +100,49 @@ Version mismatch means that unexpected crashes may happen due to differing game
         )
 
     joueur.client.play()
+
+
+def run_async(args):
+    """Plays the game the same as run(), but through an AsyncClient,
+    exiting with its error code if the session fails.
+    """
+    import asyncio
+    from joueur.async_client import AsyncClient, ClientError  # imports this module
+
+    try:
+        asyncio.run(AsyncClient(args.print_io).run(args))
+    except ClientError as e:
+        error_code.handle_error(e.code, e.__cause__, str(e))
+
+
+# splits a "hostname:port" server arg into the server and port args
+def parse_server(args):
+    split_server = args.server.split(":")
+    args.server = split_server[0]
+    args.port = int((len(split_server) == 2 and split_server[1])) or args.port
+
+
+def game_module_name(game_name):
+    return "games." + camel_case_converter(game_name)
+
+
+def play_data(args, game_name, ai):
+    return {
+        'gameName': game_name,
+        'password': args.password,
+        'requestedSession': args.session,
+        'clientType': "Python",
+        'playerName': args.name or ai.get_name() or "Python Player",
+        'playerIndex': args.index,
+        'gameSettings': args.game_settings
+    }
+
+
+def print_lobbied(lobby_data):
+    print('{}In Lobby for game "{}" in session "{}".{}'.format(
+            color.text("cyan"),
+            lobby_data['gameName'],
+            lobby_data['gameSession'],
+            color.reset()
+        )
+    )
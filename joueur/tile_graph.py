@@ -0,0 +1,65 @@
+# TileGraph: the map of a tiled game as an adjacency list of tile indexes, so
+# searches can work on ints instead of looking up Tile attributes. Tile links
+# are only sent once, when the map is first merged, so this is built once too.
+
+# the Tile attributes that link it to its neighbors
+LINKS = frozenset(('tile_north', 'tile_east', 'tile_south', 'tile_west'))
+
+
+# @class TileGraph: every Tile's neighbors, by index into game.tiles
+class TileGraph():
+    """The neighbors of every Tile, as indexes into game.tiles.
+
+    `adjacency[i]` is a tuple of the indexes of the neighbors of
+    `game.tiles[i]`, in the same North, East, South, West order as
+    `Tile.get_neighbors()`.
+    """
+
+    def __init__(self, tiles):
+        self._tiles = tuple(tiles)
+        self._indexes = {tile: i for i, tile in enumerate(self._tiles)}
+        self._adjacency = [
+            tuple(self._indexes[neighbor] for neighbor in tile.get_neighbors())
+            for tile in self._tiles
+        ]
+
+    def __len__(self):
+        return len(self._tiles)
+
+    @property
+    def tiles(self):
+        """The Tiles, in the same order as game.tiles.
+
+        :rtype: tuple[Tile]
+        """
+        return self._tiles
+
+    @property
+    def adjacency(self):
+        """The indexes of the neighbors of the Tile at each index.
+
+        :rtype: list[tuple[int]]
+        """
+        return self._adjacency
+
+    def index_of(self, tile):
+        """Gets the index of a Tile.
+
+        Args:
+            tile (Tile): a Tile in the game
+        Returns:
+            int: its index into game.tiles and adjacency
+        """
+        return self._indexes[tile]
+
+
+## forgets cached neighbors after a delta changed the links between tiles, called by the GameManager after each one is merged
+def _invalidate(game, changes):
+    game_attributes = changes.attributes(game)
+    if 'tiles' in game_attributes:
+        game._tile_graph = None
+
+    for obj, attributes in changes.changed.items():
+        if obj is not game and not LINKS.isdisjoint(attributes):
+            obj._neighbors = None
+            game._tile_graph = None
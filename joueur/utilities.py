@@ -5,3 +5,19 @@ all_cap_re = re.compile('([a-z0-9])([A-Z])')
 def camel_case_converter(name):
     s1 = first_cap_re.sub(r'\1_\2', name)
     return all_cap_re.sub(r'\1_\2', s1).lower()
+
+def attribute_types(cls):
+    """The type of every attribute the server sends for a generated game or game object class, from the `_attribute_types` Creer generates for each, e.g. {'x': 'int', 'unit': 'games.necrowar.unit.Unit'}.
+
+    Raises:
+        TypeError: if a generated class in its hierarchy has no `_attribute_types`, e.g. it was generated by an older Creer template
+    """
+    types = {}
+    for klass in reversed(cls.__mro__):
+        if not klass.__module__.startswith('games.'):
+            continue  # client side only, e.g. BaseGame
+        if '_attribute_types' not in vars(klass):
+            raise TypeError('{}.{} has no _attribute_types, so the types of its attributes are unknown; re-run Creer to regenerate it'.format(
+                klass.__module__, klass.__name__))
+        types.update(klass._attribute_types)
+    return types
@@ -77,5 +77,39 @@ parser.add_argument(
     action='store_true',
     dest='print_io',
     help='(debugging) print IO through the TCP socket to the terminal')
+parser.add_argument(
+    '--async',
+    action='store_true',
+    dest='use_async',
+    help='play through the asyncio based joueur/async_client.py instead of the blocking client'
+)
+parser.add_argument(
+    '--capture',
+    action='store',
+    dest='capture',
+    default=None,
+    help=
+    '(debugging) write every frame the server sends to this file as JSON lines, to replay with joueur/mock_server.py or benchmark with benchmarks/replay.py'
+)
+parser.add_argument(
+    '--profile',
+    action='store',
+    dest='profile',
+    default=None,
+    help=
+    '(debugging) time where each turn goes and write a report to this file at the end of the game, as JSON or CSV if it ends in .csv'
+)
+parser.add_argument(
+    '--profileAI',
+    action='store',
+    dest='profile_ai',
+    default=None,
+    help=
+    '(debugging) run every AI order (e.g. run_turn) under cProfile and dump the stats to this file at the end of the game'
+)
+
+args = parser.parse_args()
+if args.use_async and (args.profile or args.profile_ai):
+    parser.error('--profile and --profileAI time the blocking client, so they cannot be used with --async')
 
-run(parser.parse_args())
+run(args)